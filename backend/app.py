@@ -1,58 +1,87 @@
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
+from contextlib import asynccontextmanager
+from pydantic import BaseModel, Field
 from datetime import timedelta, datetime
-import google.generativeai as genai
-import os
-from io import BytesIO
-
-from database import engine, get_db, Base
+import anyio
+import asyncio
+import hashlib
+import json
+import math
+from urllib.parse import quote
+
+from database import get_db, async_session_local
+from replicas import replica_router, get_read_db
 from models import User, Content, Template
+from languages import SUPPORTED_LANGUAGES
 from auth import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
+    password_needs_rehash,
     create_access_token,
     verify_token,
     get_current_user,
+    invalidate_principal,
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
+from generation import load_model, generate_cached, stream_text, cache_key
+from cache import generation_cache, export_cache, job_registry
+from singleflight import single_flight
+from stats import stats_cache, record_bulk_delete
+from rate_limit import gemini_limiter, QuotaExceededError
+from tasks import celery_app, generate_content_task, purge_users_task
+from config import (
+    BATCH_MAX_ITEMS,
+    BATCH_CONCURRENCY,
+    BULK_DELETE_CHUNK_SIZE,
+    BULK_DELETE_MAX_IDS,
+    EXCERPT_LENGTH,
+    GZIP_MIN_SIZE,
+    GZIP_LEVEL,
+    CATALOG_CACHE_MAX_AGE
+)
+from model_catalog import load_catalog, refresh_catalog, select_model_name
+from pagination import page_size, keyset_page, parse_text
+from search import search_contents
+from sqlalchemy import select, delete, func, case, or_
+from sqlalchemy.orm import undefer
+from exports import EXPORT_FORMATS, export_renderer
+from compression import body_codec
+from bulk_export import parse_bulk_request, stream_zip_export
+from http_compression import SelectiveGZipMiddleware
+
+# Schema wird separat angelegt (python init_db.py), nicht beim Import
+model = None
+
 
-from docx import Document
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.units import inch
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Modell aus dem lokalen Katalog laden (kein Netzwerk), Dictionaries laden und Export-Worker starten"""
+    global model
+    model = load_model()
+    await body_codec.load_async()
+    export_renderer.start()
+    yield
+    export_renderer.shutdown()
 
-Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title="Easy Content Generator", version="1.0.0")
+app = FastAPI(title="Easy Content Generator", version="1.0.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
-    allow_headers=["Content-Type", "Authorization", "Accept"],
+    allow_headers=["Content-Type", "Authorization", "Accept", "If-None-Match"],
     expose_headers=["*"],
     max_age=86400,
 )
 
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-
-SUPPORTED_LANGUAGES = {
-    "en": "English",
-    "de": "German",
-    "fr": "French",
-    "es": "Spanish",
-    "it": "Italian",
-    "pt": "Portuguese",
-    "nl": "Dutch",
-    "ja": "Japanese",
-    "zh": "Chinese",
-    "ru": "Russian"
-}
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=GZIP_MIN_SIZE, compresslevel=GZIP_LEVEL)
 
 SUPPORTED_TONES = {
     "professional": "Professional - Formal, structured, business-appropriate tone",
@@ -136,112 +165,34 @@ DEFAULT_TEMPLATES = {
     ]
 }
 
-if GEMINI_API_KEY:
-    genai.configure(api_key=GEMINI_API_KEY)
-    try:
-        models = genai.list_models()
-        available_models = [m.name for m in models if 'generateContent' in m.supported_generation_methods]
-        print(f"Available models: {available_models}")
-        
-        model_name = available_models[0] if available_models else 'models/gemini-2.5-flash'
-        model = genai.GenerativeModel(model_name)
-        print(f"Using model: {model_name}")
-    except Exception as e:
-        print(f"Error loading models: {e}")
-        model = genai.GenerativeModel('models/gemini-2.5-flash')
-else:
-    model = None
-
-
-def export_to_markdown(title: str, body: str) -> str:
-    """Konvertiert Content zu Markdown"""
-    return f"""# {title}
-
-{body}
-
----
-Generated with Easy Content Generator
-"""
-
-def export_to_docx(title: str, body: str) -> bytes:
-    """Konvertiert Content zu Word (.docx)"""
-    doc = Document()
-    doc.add_heading(title, 0)
-    doc.add_paragraph(body)
-    doc.add_paragraph()
-    doc.add_paragraph("Generated with Easy Content Generator")
-    
-    output = BytesIO()
-    doc.save(output)
-    output.seek(0)
-    return output.getvalue()
-
-def export_to_pdf(title: str, body: str) -> bytes:
-    """Konvertiert Content zu PDF"""
-    output = BytesIO()
-    doc = SimpleDocTemplate(output, pagesize=letter)
-    styles = getSampleStyleSheet()
-    story = []
-    
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor='#1f2937',
-        spaceAfter=30
-    )
-    story.append(Paragraph(title, title_style))
-    story.append(Spacer(1, 0.3*inch))
-    
-    body_style = styles['BodyText']
-    paragraphs = body.split('\n')
-    for para in paragraphs:
-        if para.strip():
-            story.append(Paragraph(para, body_style))
-        story.append(Spacer(1, 0.1*inch))
-    
-    story.append(Spacer(1, 0.5*inch))
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor='#9ca3af'
-    )
-    story.append(Paragraph("Generated with Easy Content Generator", footer_style))
-    
-    doc.build(story)
-    output.seek(0)
-    return output.getvalue()
-
-
 # ============================================
 # 🔐 AUTH ENDPOINTS
 # ============================================
 
 @app.post("/auth/register")
-async def register(username: str, email: str, password: str, db: Session = Depends(get_db)):
+async def register(username: str, email: str, password: str, db: AsyncSession = Depends(get_db)):
     """Registriere einen neuen User"""
     
     if not username or not email or not password:
         raise HTTPException(status_code=400, detail="Username, email and password required")
     
-    existing_user = db.query(User).filter(
+    existing_user = await db.scalar(select(User).where(
         (User.username == username) | (User.email == email)
-    ).first()
+    ))
     
     if existing_user:
         raise HTTPException(status_code=400, detail="Username or email already exists")
     
     try:
-        hashed_password = hash_password(password)
+        hashed_password = await hash_password_async(password)
         new_user = User(
             username=username,
             email=email,
             hashed_password=hashed_password
         )
         db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        await db.commit()
+        await db.refresh(new_user)
         
         access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
@@ -262,24 +213,29 @@ async def register(username: str, email: str, password: str, db: Session = Depen
             }
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/auth/login")
-async def login(username: str, password: str, db: Session = Depends(get_db)):
+async def login(username: str, password: str, db: AsyncSession = Depends(get_db)):
     """Login für einen User"""
     
     if not username or not password:
         raise HTTPException(status_code=400, detail="Username and password required")
     
-    user = db.query(User).filter(User.username == username).first()
+    user = await db.scalar(select(User).where(User.username == username))
     
-    if not user or not verify_password(password, user.hashed_password):
+    if not user or not await verify_password_async(password, user.hashed_password):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     if not user.is_active:
         raise HTTPException(status_code=403, detail="User is inactive")
     
+    # Hash transparent auf den aktuellen Cost-Faktor bringen
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await hash_password_async(password)
+        await db.commit()
+    
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={
@@ -321,14 +277,14 @@ async def health_check():
     return {"status": "ok", "timestamp": datetime.now().isoformat()}
 
 @app.get("/languages")
-async def get_languages():
+async def get_languages(request: Request, response: Response):
     """Gibt alle unterstützten Sprachen zurück"""
-    return {"languages": SUPPORTED_LANGUAGES}
+    return catalog_response(request, response, {"languages": SUPPORTED_LANGUAGES})
 
 @app.get("/tones")
-async def get_tones():
+async def get_tones(request: Request, response: Response):
     """Gibt alle unterstützten Tones zurück"""
-    return {"tones": SUPPORTED_TONES}
+    return catalog_response(request, response, {"tones": SUPPORTED_TONES})
 
 @app.get("/")
 async def root():
@@ -343,35 +299,86 @@ async def root():
 # 📝 GENERATION ENDPOINT
 # ============================================
 
+def validate_generation_params(language: str, tone: str):
+    """Prüfe Sprache und Tone einer Generierungs-Anfrage"""
+    if language not in SUPPORTED_LANGUAGES:
+        raise HTTPException(status_code=400, detail=f"Unsupported language")
+    
+    if tone not in SUPPORTED_TONES:
+        raise HTTPException(status_code=400, detail=f"Unsupported tone")
+
+def build_enhanced_prompt(prompt: str, language: str, tone: str) -> str:
+    """Ergänze den User-Prompt um Sprache und Tone"""
+    language_name = SUPPORTED_LANGUAGES[language]
+    tone_description = SUPPORTED_TONES[tone]
+    
+    return f"""Please answer in {language_name} with a {tone_description} tone.
+
+{prompt}"""
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match gegen einen ETag prüfen (schwacher Vergleich, RFC 9110)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag.removeprefix("W/") in candidates
+
+def weak_etag(*parts) -> str:
+    """Schwacher ETag aus den Teilen, die den Inhalt einer Antwort bestimmen"""
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+# Listen ändern sich mit jedem Schreibzugriff: immer revalidieren, nie in Shared Caches
+LIST_CACHE_CONTROL = "private, no-cache"
+
+def not_modified(request: Request, response: Response, etag: str, cache_control: str) -> Optional[Response]:
+    """ETag/Cache-Control setzen; 304-Antwort, wenn der Client diesen Stand schon hat"""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+def catalog_response(request: Request, response: Response, payload: dict):
+    """Statische Kataloge: ETag aus dem Inhalt, von Browsern cachebar"""
+    etag = weak_etag(json.dumps(payload, sort_keys=True))
+    cache_control = f"public, max-age={CATALOG_CACHE_MAX_AGE}"
+    return not_modified(request, response, etag, cache_control) or payload
+
+def content_disposition(filename: str) -> str:
+    """Attachment-Header; Nicht-ASCII-Dateinamen per RFC 5987 kodiert"""
+    try:
+        filename.encode("ascii")
+        return f'attachment; filename="{filename}"'
+    except UnicodeEncodeError:
+        return f"attachment; filename*=utf-8''{quote(filename)}"
+
+def sse_event(event: str, data: dict) -> str:
+    """Formatiere ein Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
 @app.post("/generate")
 async def generate_content(
     prompt: str,
     language: str = "en",
     tone: str = "professional",
+    fresh: bool = False,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Generiere Content (nur für authenticated users)"""
     
     if not model:
         raise HTTPException(status_code=500, detail="Gemini API not configured")
     
-    if language not in SUPPORTED_LANGUAGES:
-        raise HTTPException(status_code=400, detail=f"Unsupported language")
-    
-    if tone not in SUPPORTED_TONES:
-        raise HTTPException(status_code=400, detail=f"Unsupported tone")
+    validate_generation_params(language, tone)
     
     try:
-        language_name = SUPPORTED_LANGUAGES[language]
-        tone_description = SUPPORTED_TONES[tone]
-        
-        enhanced_prompt = f"""Please answer in {language_name} with a {tone_description} tone.
-
-{prompt}"""
+        enhanced_prompt = build_enhanced_prompt(prompt, language, tone)
         
-        response = model.generate_content(enhanced_prompt)
-        generated_text = response.text
+        generated_text, cached = await generate_cached(model, enhanced_prompt, fresh=fresh)
         
         content = Content(
             title=prompt[:100],
@@ -382,8 +389,7 @@ async def generate_content(
             owner_id=current_user.id
         )
         db.add(content)
-        db.commit()
-        db.refresh(content)
+        await db.commit()
         
         return {
             "id": content.id,
@@ -392,11 +398,268 @@ async def generate_content(
             "language": language,
             "tone": tone,
             "status": content.status,
+            "cached": cached,
             "created_at": content.created_at.isoformat()
         }
     
+    except QuotaExceededError as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(math.ceil(e.retry_after))}
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Generation timed out")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/generate/batch")
+async def generate_content_batch(
+    request: dict,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Generiere mehrere Contents parallel (Items: prompt, language, tone)"""
+    
+    if not model:
+        raise HTTPException(status_code=500, detail="Gemini API not configured")
+    
+    items = request.get("items", [])
+    
+    if not items:
+        raise HTTPException(status_code=400, detail="No items provided")
+    
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise HTTPException(status_code=400, detail="items must be a list of objects")
+    
+    if len(items) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"Too many items (max {BATCH_MAX_ITEMS})")
+    
+    try:
+        concurrency = int(request.get("concurrency", BATCH_CONCURRENCY))
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="concurrency must be an integer")
+    
+    concurrency = max(1, min(concurrency, BATCH_CONCURRENCY))
+    fresh = bool(request.get("fresh", False))
+    batch_slots = asyncio.Semaphore(concurrency)
+    
+    async def run_item(item: dict) -> dict:
+        prompt = item.get("prompt")
+        language = item.get("language", "en")
+        tone = item.get("tone", "professional")
+        
+        try:
+            if not prompt or not isinstance(prompt, str):
+                raise HTTPException(status_code=400, detail="Prompt required")
+            validate_generation_params(language, tone)
+            
+            async with batch_slots:
+                generated_text, cached = await generate_cached(
+                    model, build_enhanced_prompt(prompt, language, tone), fresh=fresh
+                )
+            
+            return {"prompt": prompt, "language": language, "tone": tone, "content": generated_text, "cached": cached}
+        except HTTPException as e:
+            return {"prompt": prompt, "language": language, "tone": tone, "error": e.detail}
+        except asyncio.TimeoutError:
+            return {"prompt": prompt, "language": language, "tone": tone, "error": "Generation timed out"}
+        except Exception as e:
+            return {"prompt": prompt, "language": language, "tone": tone, "error": str(e)}
+    
+    results = await asyncio.gather(*(run_item(item) for item in items))
+    
+    # Alle erfolgreichen Ergebnisse in einer Transaktion speichern
+    succeeded = [r for r in results if "error" not in r]
+    contents = [
+        Content(
+            title=r["prompt"][:100],
+            body=r["content"],
+            language=r["language"],
+            tone=r["tone"],
+            status="published",
+            owner_id=current_user.id
+        )
+        for r in succeeded
+    ]
+    
+    try:
+        db.add_all(contents)
+        await db.flush()
+        for r, content in zip(succeeded, contents):
+            r.update({
+                "id": content.id,
+                "status": content.status,
+                "created_at": content.created_at.isoformat()
+            })
+        await db.commit()
     except Exception as e:
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
+    
+    return {
+        "total": len(results),
+        "succeeded": len(succeeded),
+        "failed": len(results) - len(succeeded),
+        "results": results
+    }
+
+
+@app.post("/generate/stream")
+async def generate_content_stream(
+    prompt: str,
+    language: str = "en",
+    tone: str = "professional",
+    fresh: bool = False,
+    current_user: User = Depends(get_current_user)
+):
+    """Generiere Content als Server-Sent Events Stream"""
+    
+    if not model:
+        raise HTTPException(status_code=500, detail="Gemini API not configured")
+    
+    validate_generation_params(language, tone)
+    
+    enhanced_prompt = build_enhanced_prompt(prompt, language, tone)
+    key = cache_key(model, enhanced_prompt)
+    owner_id = current_user.id
+    
+    async def save_stream(body: str, completed: bool) -> dict:
+        """Fertiger Stream wird published, abgebrochener (z.B. Client getrennt) als Draft gesichert"""
+        # Bei einem Client-Abbruch cancelt Starlette den Stream: ohne Shield würde das Commit abgebrochen
+        with anyio.CancelScope(shield=True):
+            async with async_session_local() as db:
+                db.info["user_id"] = owner_id
+                content = Content(
+                    title=prompt[:100],
+                    body=body,
+                    language=language,
+                    tone=tone,
+                    status="published" if completed else "draft",
+                    owner_id=owner_id
+                )
+                db.add(content)
+                await db.commit()
+                return {
+                    "id": content.id,
+                    "status": content.status,
+                    "created_at": content.created_at.isoformat()
+                }
+    
+    async def event_stream():
+        chunks = []
+        completed = False
+        error = None
+        saved = None
+        try:
+            cached = None if fresh else await generation_cache.get(key)
+            if cached is not None:
+                chunks.append(cached)
+                yield sse_event("chunk", {"text": cached})
+            else:
+                async for text in stream_text(model, enhanced_prompt):
+                    chunks.append(text)
+                    yield sse_event("chunk", {"text": text})
+                await generation_cache.set(key, "".join(chunks))
+            completed = True
+        except asyncio.TimeoutError:
+            error = "Generation timed out"
+        except Exception as e:
+            error = str(e)
+        finally:
+            if completed or chunks:
+                saved = await save_stream("".join(chunks), completed)
+        
+        if error is not None:
+            # Ein bis dahin gesicherter Draft wird mitgeschickt, damit der Client ihn öffnen kann
+            yield sse_event("error", {"detail": error, "saved": saved})
+        
+        if completed:
+            yield sse_event("done", {
+                "prompt": prompt,
+                "language": language,
+                "tone": tone,
+                **saved
+            })
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.post("/generate/jobs", status_code=202)
+async def create_generation_job(
+    prompt: str,
+    language: str = "en",
+    tone: str = "professional",
+    current_user: User = Depends(get_current_user)
+):
+    """Stelle eine Generierung in die Worker-Queue"""
+    
+    validate_generation_params(language, tone)
+    
+    enhanced_prompt = build_enhanced_prompt(prompt, language, tone)
+    
+    task = await run_in_threadpool(
+        generate_content_task.apply_async,
+        kwargs={
+            "owner_id": current_user.id,
+            "prompt": prompt,
+            "enhanced_prompt": enhanced_prompt,
+            "language": language,
+            "tone": tone
+        }
+    )
+    await job_registry.register(task.id, current_user.id)
+    
+    return {"job_id": task.id, "status": "queued"}
+
+
+# Celery-Zustände → API-Status
+JOB_STATUS = {
+    "PENDING": "queued",
+    "RECEIVED": "queued",
+    "STARTED": "running",
+    "PROGRESS": "running",
+    "RETRY": "running",
+    "SUCCESS": "completed",
+    "FAILURE": "failed",
+    "REVOKED": "failed"
+}
+
+
+@app.get("/generate/jobs/{job_id}")
+async def get_generation_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Hole Status und Ergebnis eines Generierungs-Jobs"""
+    
+    result = celery_app.AsyncResult(job_id)
+    state = await run_in_threadpool(lambda: result.state)
+    
+    owner_id = await job_registry.owner(job_id)
+    if owner_id is None:
+        # Ohne Registry-Eintrag (z.B. Redis-Fehler beim Einreihen) nur gestartete Jobs anerkennen
+        kwargs = await run_in_threadpool(lambda: result.kwargs)
+        owner_id = kwargs.get("owner_id") if kwargs else None
+    
+    # Unbekannte, abgelaufene und fremde Jobs sehen gleich aus (Celery meldet dafür PENDING)
+    if owner_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    response = {"job_id": job_id, "status": JOB_STATUS.get(state, state.lower())}
+    if state == "SUCCESS":
+        response["result"] = result.result
+        # Der Worker hat auf den Primary geschrieben: danach nicht von einer nachhinkenden Replica lesen
+        replica_router.record_write(current_user.id)
+    elif state == "FAILURE":
+        response["error"] = str(result.result)
+    
+    return response
 
 
 # ============================================
@@ -407,17 +670,19 @@ async def generate_content(
 async def get_content(
     content_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Hole einen spezifischen Content"""
-    content = db.query(Content).filter(
+    content = await db.scalar(select(Content).options(undefer(Content.body_compressed)).where(
         Content.id == content_id,
         Content.owner_id == current_user.id
-    ).first()
+    ))
     
     if not content:
         raise HTTPException(status_code=404, detail="Content not found")
     
+    await body_codec.ensure_loaded([content.body_compressed])
+    
     return {
         "id": content.id,
         "title": content.title,
@@ -429,16 +694,107 @@ async def get_content(
         "updated_at": content.updated_at.isoformat() if content.updated_at else None
     }
 
+def content_list_query(
+    owner_id: int,
+    status: str,
+    date_column,
+    fields: str,
+    language: Optional[str],
+    tone: Optional[str],
+    date_from: Optional[datetime],
+    date_to: Optional[datetime]
+):
+    """Query für History/Drafts inkl. Filter und optionaler Summary-Projektion"""
+    if fields not in ("full", "summary"):
+        raise HTTPException(status_code=400, detail="fields must be 'full' or 'summary'")
+    
+    if fields == "summary":
+        # Nur Metadaten + Auszug aus der DB holen, nicht den kompletten Body
+        query = select(
+            Content.id,
+            Content.title,
+            func.substr(Content.excerpt, 1, EXCERPT_LENGTH).label("excerpt"),
+            Content.language,
+            Content.tone,
+            Content.status,
+            Content.created_at,
+            Content.updated_at
+        )
+    else:
+        query = select(Content).options(undefer(Content.body_compressed))
+    
+    query = query.where(Content.owner_id == owner_id, Content.status == status)
+    
+    if language:
+        query = query.where(Content.language == language)
+    if tone:
+        query = query.where(Content.tone == tone)
+    if date_from:
+        query = query.where(date_column >= date_from)
+    if date_to:
+        query = query.where(date_column < date_to)
+    
+    return query
+
+async def content_list_etag(request: Request, db: AsyncSession, owner_id: int, content_status: str) -> str:
+    """ETag einer History/Drafts-Seite aus Anzahl, höchster ID und letzter Änderung
+
+    Die Aggregat-Abfrage liest nur ix_contents_owner_status_version (Index-Only-Scan,
+    keine Tabellenzeilen): Anlegen, Löschen und Bearbeiten ändern mindestens einen der drei Werte.
+    """
+    count, max_id, last_updated = (await db.execute(
+        select(func.count(Content.id), func.max(Content.id), func.max(Content.updated_at))
+        .where(Content.owner_id == owner_id, Content.status == content_status)
+    )).one()
+    return weak_etag(owner_id, content_status, count, max_id, last_updated, request.query_params)
+
+def content_summary(row) -> dict:
+    return {
+        "id": row.id,
+        "title": row.title,
+        "excerpt": row.excerpt,
+        "language": row.language,
+        "tone": row.tone,
+        "status": row.status,
+        "created_at": row.created_at.isoformat(),
+        "updated_at": row.updated_at.isoformat() if row.updated_at else None
+    }
+
 @app.get("/history")
 async def get_history(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    language: Optional[str] = None,
+    tone: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    fields: str = "full",
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Hole History des aktuellen Users (NUR published Content)"""
-    contents = db.query(Content).filter(
-        Content.owner_id == current_user.id,
-        Content.status == "published"  # ✅ Nur published
-    ).order_by(Content.created_at.desc()).all()
+    """Hole History des aktuellen Users (NUR published Content, seitenweise)"""
+    query = content_list_query(
+        current_user.id, "published", Content.created_at,
+        fields, language, tone, date_from, date_to
+    )
+    
+    etag = await content_list_etag(request, db, current_user.id, "published")
+    unchanged = not_modified(request, response, etag, LIST_CACHE_CONTROL)
+    if unchanged:
+        return unchanged
+    
+    contents, next_cursor = await keyset_page(db, query, Content.created_at, Content.id, cursor, page_size(limit))
+    
+    # Cursor der nächsten Seite im Header, damit die Antwort eine Liste bleibt
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    
+    if fields == "summary":
+        return [content_summary(content) for content in contents]
+    
+    await body_codec.ensure_loaded(content.body_compressed for content in contents)
     
     return [
         {
@@ -453,23 +809,50 @@ async def get_history(
         for content in contents
     ]
 
+@app.get("/search")
+async def search_content(
+    q: str,
+    response: Response,
+    language: Optional[str] = None,
+    tone: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    sort: str = "rank",
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Volltextsuche in den eigenen Contents (Titel + Body), nach Relevanz sortiert"""
+    results, next_cursor = await search_contents(
+        db, q, current_user.id, language, tone, status, date_from, date_to,
+        sort, cursor, page_size(limit)
+    )
+    
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    
+    return results
+
 @app.delete("/content/{content_id}")
 async def delete_content(
     content_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Lösche einen Content"""
-    content = db.query(Content).filter(
+    content = await db.scalar(select(Content).where(
         Content.id == content_id,
         Content.owner_id == current_user.id
-    ).first()
+    ))
     
     if not content:
         raise HTTPException(status_code=404, detail="Content not found")
     
-    db.delete(content)
-    db.commit()
+    await db.delete(content)
+    await db.commit()
+    await export_cache.invalidate(content_id)
     
     return {"message": "Content deleted successfully"}
 
@@ -479,13 +862,13 @@ async def update_content(
     title: str,
     body: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update einen Content"""
-    content = db.query(Content).filter(
+    content = await db.scalar(select(Content).where(
         Content.id == content_id,
         Content.owner_id == current_user.id
-    ).first()
+    ))
     
     if not content:
         raise HTTPException(status_code=404, detail="Content not found")
@@ -493,8 +876,8 @@ async def update_content(
     content.title = title
     content.body = body
     content.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(content)
+    await db.commit()
+    await export_cache.invalidate(content.id)
     
     return {
         "id": content.id,
@@ -517,7 +900,7 @@ async def save_draft(
     language: str = "en",
     tone: str = "professional",
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Speichere einen Draft (unvollendeter Content)"""
     
@@ -531,8 +914,7 @@ async def save_draft(
             owner_id=current_user.id
         )
         db.add(draft)
-        db.commit()
-        db.refresh(draft)
+        await db.commit()
         
         return {
             "id": draft.id,
@@ -545,21 +927,45 @@ async def save_draft(
             "updated_at": draft.updated_at.isoformat()
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/drafts")
 async def get_drafts(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    language: Optional[str] = None,
+    tone: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    fields: str = "full",
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Hole alle Drafts des aktuellen Users"""
+    """Hole Drafts des aktuellen Users (seitenweise, neueste Änderung zuerst)"""
     
-    drafts = db.query(Content).filter(
-        Content.owner_id == current_user.id,
-        Content.status == "draft"  # ✅ Nur Drafts
-    ).order_by(Content.updated_at.desc()).all()
+    query = content_list_query(
+        current_user.id, "draft", Content.updated_at,
+        fields, language, tone, date_from, date_to
+    )
+    
+    etag = await content_list_etag(request, db, current_user.id, "draft")
+    unchanged = not_modified(request, response, etag, LIST_CACHE_CONTROL)
+    if unchanged:
+        return unchanged
+    
+    drafts, next_cursor = await keyset_page(db, query, Content.updated_at, Content.id, cursor, page_size(limit))
+    
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    
+    if fields == "summary":
+        return [content_summary(draft) for draft in drafts]
+    
+    await body_codec.ensure_loaded(draft.body_compressed for draft in drafts)
     
     return [
         {
@@ -584,19 +990,21 @@ async def update_draft(
     language: str = None,
     tone: str = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update einen Draft"""
     
-    draft = db.query(Content).filter(
+    draft = await db.scalar(select(Content).options(undefer(Content.body_compressed)).where(
         Content.id == draft_id,
         Content.owner_id == current_user.id,
         Content.status == "draft"  # ✅ Nur Drafts
-    ).first()
+    ))
     
     if not draft:
         raise HTTPException(status_code=404, detail="Draft not found")
     
+    await body_codec.ensure_loaded([draft.body_compressed])
+    
     if title is not None:
         draft.title = title
     if body is not None:
@@ -607,8 +1015,8 @@ async def update_draft(
         draft.tone = tone
     
     draft.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(draft)
+    await db.commit()
+    await export_cache.invalidate(draft.id)
     
     return {
         "id": draft.id,
@@ -626,23 +1034,24 @@ async def update_draft(
 async def publish_draft(
     draft_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Konvertiere Draft zu Published Content"""
     
-    draft = db.query(Content).filter(
+    draft = await db.scalar(select(Content).options(undefer(Content.body_compressed)).where(
         Content.id == draft_id,
         Content.owner_id == current_user.id,
         Content.status == "draft"  # ✅ Nur Drafts
-    ).first()
+    ))
     
     if not draft:
         raise HTTPException(status_code=404, detail="Draft not found")
     
     draft.status = "published"  # ✅ Status ändern
     draft.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(draft)
+    await db.commit()
+    await export_cache.invalidate(draft.id)
+    await body_codec.ensure_loaded([draft.body_compressed])
     
     return {
         "id": draft.id,
@@ -660,21 +1069,22 @@ async def publish_draft(
 async def delete_draft(
     draft_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Lösche einen Draft"""
     
-    draft = db.query(Content).filter(
+    draft = await db.scalar(select(Content).where(
         Content.id == draft_id,
         Content.owner_id == current_user.id,
         Content.status == "draft"  # ✅ Nur Drafts
-    ).first()
+    ))
     
     if not draft:
         raise HTTPException(status_code=404, detail="Draft not found")
     
-    db.delete(draft)
-    db.commit()
+    await db.delete(draft)
+    await db.commit()
+    await export_cache.invalidate(draft_id)
     
     return {"message": "Draft deleted successfully"}
 
@@ -683,74 +1093,101 @@ async def delete_draft(
 # 📥 EXPORT ENDPOINTS
 # ============================================
 
-@app.get("/export/{content_id}/markdown")
-async def export_markdown(
+async def export_response(
+    request: Request,
+    db: AsyncSession,
     content_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """Exportiere Content als Markdown"""
-    content = db.query(Content).filter(
-        Content.id == content_id,
-        Content.owner_id == current_user.id
-    ).first()
+    owner_id: int,
+    export_format: str
+) -> Response:
+    """Export aus dem Artefakt-Cache ausliefern (mit ETag / 304), nur bei Miss rendern"""
+    content = (await db.execute(
+        select(Content.id, Content.title, Content.created_at, Content.updated_at).where(
+            Content.id == content_id,
+            Content.owner_id == owner_id
+        )
+    )).first()
     
     if not content:
         raise HTTPException(status_code=404, detail="Content not found")
     
-    markdown_content = export_to_markdown(content.title, content.body)
-    
-    return FileResponse(
-        BytesIO(markdown_content.encode()),
-        media_type="text/markdown",
-        filename=f"{content.title.replace(' ', '_')}.md"
+    media_type, extension = EXPORT_FORMATS[export_format]
+    key = export_cache.make_key(content.id, export_format, content.updated_at or content.created_at)
+    if_none_match = request.headers.get("if-none-match")
+    headers = {"Cache-Control": "private, no-cache"}
+    
+    # Bekannter ETag: 304 ohne Datei zu lesen
+    etag = export_cache.etag(key)
+    if etag and etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={**headers, "ETag": etag})
+    
+    cached = await export_cache.get(key)
+    if cached:
+        data, etag = cached
+    else:
+        # Body nur laden (und entpacken), wenn wirklich gerendert werden muss
+        body_compressed = await db.scalar(select(Content.body_compressed).where(Content.id == content.id))
+        await body_codec.ensure_loaded([body_compressed])
+        body = body_codec.decompress(body_compressed)
+        try:
+            data = await export_renderer.render(export_format, content.title, body)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=504, detail="Export rendering timed out")
+        etag = await export_cache.set(key, data)
+    
+    headers["ETag"] = etag
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    
+    headers["Content-Disposition"] = content_disposition(f"{(content.title or 'content').replace(' ', '_')}.{extension}")
+    return Response(content=data, media_type=media_type, headers=headers)
+
+def zip_response(chunks, export_format: str) -> StreamingResponse:
+    filename = f"contents_{export_format}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+    return StreamingResponse(
+        chunks,
+        media_type="application/zip",
+        headers={"Content-Disposition": content_disposition(filename)}
     )
 
+@app.post("/export/bulk")
+async def export_bulk(
+    request: dict,
+    current_user: User = Depends(get_current_user)
+):
+    """Exportiere mehrere eigene Contents (ids oder Filter) als gestreamtes ZIP"""
+    export_format, filters = parse_bulk_request(request)
+    return zip_response(stream_zip_export(export_format, filters, owner_id=current_user.id), export_format)
+
+@app.get("/export/{content_id}/markdown")
+async def export_markdown(
+    content_id: int,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Exportiere Content als Markdown"""
+    return await export_response(request, db, content_id, current_user.id, "markdown")
+
 @app.get("/export/{content_id}/docx")
 async def export_docx(
     content_id: int,
+    request: Request,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Exportiere Content als Word"""
-    content = db.query(Content).filter(
-        Content.id == content_id,
-        Content.owner_id == current_user.id
-    ).first()
-    
-    if not content:
-        raise HTTPException(status_code=404, detail="Content not found")
-    
-    docx_bytes = export_to_docx(content.title, content.body)
-    
-    return FileResponse(
-        BytesIO(docx_bytes),
-        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        filename=f"{content.title.replace(' ', '_')}.docx"
-    )
+    return await export_response(request, db, content_id, current_user.id, "docx")
 
 @app.get("/export/{content_id}/pdf")
 async def export_pdf(
     content_id: int,
+    request: Request,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Exportiere Content als PDF"""
-    content = db.query(Content).filter(
-        Content.id == content_id,
-        Content.owner_id == current_user.id
-    ).first()
-    
-    if not content:
-        raise HTTPException(status_code=404, detail="Content not found")
-    
-    pdf_bytes = export_to_pdf(content.title, content.body)
-    
-    return FileResponse(
-        BytesIO(pdf_bytes),
-        media_type="application/pdf",
-        filename=f"{content.title.replace(' ', '_')}.pdf"
-    )
+    return await export_response(request, db, content_id, current_user.id, "pdf")
 
 
 # ============================================
@@ -759,22 +1196,39 @@ async def export_pdf(
 
 @app.get("/templates")
 async def get_templates(
+    request: Request,
+    response: Response,
     language: str = "en",
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Hole alle Templates"""
     
     if language not in SUPPORTED_LANGUAGES:
         raise HTTPException(status_code=400, detail=f"Unsupported language")
     
+    # Eigene Templates werden nur angelegt und gelöscht: Anzahl + höchste ID genügen als Version
+    template_count, max_id = (await db.execute(
+        select(func.count(Template.id), func.max(Template.id)).where(
+            Template.language == language,
+            Template.is_default == False,
+            Template.owner_id == current_user.id
+        )
+    )).one()
+    
     default_templates = DEFAULT_TEMPLATES.get(language, DEFAULT_TEMPLATES["en"])
     
-    user_templates = db.query(Template).filter(
+    # Die Default-Templates fließen mit ein, damit ein Deploy mit geänderten Defaults neu lädt
+    etag = weak_etag(current_user.id, language, template_count, max_id, json.dumps(default_templates))
+    unchanged = not_modified(request, response, etag, LIST_CACHE_CONTROL)
+    if unchanged:
+        return unchanged
+    
+    user_templates = (await db.scalars(select(Template).where(
         Template.language == language,
         Template.is_default == False,
         Template.owner_id == current_user.id
-    ).all()
+    ))).all()
     
     result = [
         {
@@ -810,7 +1264,7 @@ async def create_template(
     prompt: str,
     language: str = "en",
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Erstelle ein neues Template"""
     
@@ -826,8 +1280,8 @@ async def create_template(
         owner_id=current_user.id
     )
     db.add(template)
-    db.commit()
-    db.refresh(template)
+    await db.commit()
+    await db.refresh(template)
     
     return {
         "id": template.id,
@@ -842,14 +1296,14 @@ async def create_template(
 async def delete_template(
     template_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Lösche ein Template"""
     
-    template = db.query(Template).filter(
+    template = await db.scalar(select(Template).where(
         Template.id == template_id,
         Template.owner_id == current_user.id
-    ).first()
+    ))
     
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
@@ -857,8 +1311,8 @@ async def delete_template(
     if template.is_default:
         raise HTTPException(status_code=403, detail="Cannot delete default templates")
     
-    db.delete(template)
-    db.commit()
+    await db.delete(template)
+    await db.commit()
     
     return {"message": "Template deleted successfully"}
 
@@ -881,57 +1335,36 @@ def check_admin(current_user: User = Depends(get_current_user)):
 @app.get("/admin/dashboard")
 async def admin_dashboard(
     admin_user: User = Depends(check_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Admin Dashboard mit Statistiken"""
     
-    total_users = db.query(User).count()
-    active_users = db.query(User).filter(User.is_active == True).count()
-    admins = db.query(User).filter(User.is_admin == True).count()
-    
-    total_contents = db.query(Content).count()
-    published_contents = db.query(Content).filter(Content.status == "published").count()
-    draft_contents = db.query(Content).filter(Content.status == "draft").count()
+    snapshot = await stats_cache.get(db)
+    contents = snapshot["contents"]
     
-    total_templates = db.query(Template).count()
-    default_templates = db.query(Template).filter(Template.is_default == True).count()
-    custom_templates = db.query(Template).filter(Template.is_default == False).count()
-    
-    # Top Languages
-    from sqlalchemy import func
-    top_languages = db.query(
-        Content.language,
-        func.count(Content.id).label("count")
-    ).group_by(Content.language).order_by(func.count(Content.id).desc()).limit(5).all()
-    
-    # Top Tones
-    top_tones = db.query(
-        Content.tone,
-        func.count(Content.id).label("count")
-    ).group_by(Content.tone).order_by(func.count(Content.id).desc()).limit(5).all()
+    top_languages = sorted(contents["by_language"].items(), key=lambda item: item[1], reverse=True)[:5]
+    top_tones = sorted(contents["by_tone"].items(), key=lambda item: item[1], reverse=True)[:5]
     
     return {
-        "users": {
-            "total": total_users,
-            "active": active_users,
-            "admins": admins
-        },
+        "users": snapshot["users"],
         "content": {
-            "total": total_contents,
-            "published": published_contents,
-            "drafts": draft_contents
+            "total": contents["total"],
+            "published": contents["by_status"].get("published", 0),
+            "drafts": contents["by_status"].get("draft", 0)
         },
         "templates": {
-            "total": total_templates,
-            "default": default_templates,
-            "custom": custom_templates
+            "total": snapshot["templates"]["total"],
+            "default": snapshot["templates"]["default"],
+            "custom": snapshot["templates"]["custom"]
         },
         "top_languages": [
             {"language": lang, "count": count} for lang, count in top_languages
         ],
         "top_tones": [
             {"tone": tone, "count": count} for tone, count in top_tones
-        ]
+        ],
+        "estimated": snapshot["estimated"],
+        "computed_at": snapshot["computed_at"]
     }
 
 
@@ -939,28 +1372,93 @@ async def admin_dashboard(
 # 👥 USER MANAGEMENT
 # ============================================
 
+def content_stats_columns():
+    """Bedingte Counts pro User in einer Aggregation"""
+    return (
+        func.count(Content.id).label("total_content"),
+        func.count(case((Content.status == "draft", 1))).label("drafts"),
+        func.count(case((Content.status == "published", 1))).label("published")
+    )
+
+USER_SORT_COLUMNS = {
+    "id": User.id,
+    "username": User.username,
+    "email": User.email,
+    "created_at": User.created_at,
+    "is_active": User.is_active,
+    "is_admin": User.is_admin
+}
+USER_STAT_SORT_COLUMNS = ("total_content", "drafts", "published")
+
 @app.get("/admin/users")
 async def get_all_users(
+    response: Response,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    sort: str = "id",
+    order: str = "asc",
+    search: Optional[str] = None,
     admin_user: User = Depends(check_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Hole alle Users mit Statistiken"""
-    
-    users = db.query(User).all()
-    
-    result = []
-    for user in users:
-        content_count = db.query(Content).filter(Content.owner_id == user.id).count()
-        draft_count = db.query(Content).filter(
-            Content.owner_id == user.id,
-            Content.status == "draft"
-        ).count()
-        published_count = db.query(Content).filter(
-            Content.owner_id == user.id,
-            Content.status == "published"
-        ).count()
+    """Hole Users mit Statistiken (seitenweise, sortier- und durchsuchbar)"""
+    
+    if sort not in USER_SORT_COLUMNS and sort not in USER_STAT_SORT_COLUMNS:
+        raise HTTPException(status_code=400, detail="Unsupported sort column")
+    if order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="order must be 'asc' or 'desc'")
+    
+    limit = page_size(limit)
+    offset = max(offset, 0)
+    
+    user_filter = []
+    if search:
+        pattern = f"%{search}%"
+        user_filter.append(or_(User.username.ilike(pattern), User.email.ilike(pattern)))
+    
+    total = await db.scalar(select(func.count(User.id)).where(*user_filter))
+    
+    if sort in USER_STAT_SORT_COLUMNS:
+        # Sortierung nach Statistik: Aggregat über alle User joinen
+        stats = select(Content.owner_id.label("owner_id"), *content_stats_columns()) \
+            .group_by(Content.owner_id).subquery()
+        sort_column = func.coalesce(stats.c[sort], 0)
+        rows = (await db.execute(
+            select(
+                User,
+                func.coalesce(stats.c.total_content, 0),
+                func.coalesce(stats.c.drafts, 0),
+                func.coalesce(stats.c.published, 0)
+            ).outerjoin(stats, stats.c.owner_id == User.id)
+            .where(*user_filter)
+            .order_by(sort_column.desc() if order == "desc" else sort_column.asc(), User.id.asc())
+            .offset(offset).limit(limit)
+        )).all()
+    else:
+        # Sortierung nach User-Spalte: erst die Seite, dann nur deren Statistiken aggregieren
+        sort_column = USER_SORT_COLUMNS[sort]
+        users = (await db.scalars(
+            select(User).where(*user_filter)
+            .order_by(sort_column.desc() if order == "desc" else sort_column.asc(), User.id.asc())
+            .offset(offset).limit(limit)
+        )).all()
         
-        result.append({
+        stats = {}
+        if users:
+            stats = {
+                row.owner_id: (row.total_content, row.drafts, row.published)
+                for row in await db.execute(
+                    select(Content.owner_id, *content_stats_columns())
+                    .where(Content.owner_id.in_([user.id for user in users]))
+                    .group_by(Content.owner_id)
+                )
+            }
+        rows = [(user, *stats.get(user.id, (0, 0, 0))) for user in users]
+    
+    response.headers["X-Total-Count"] = str(total)
+    
+    return [
+        {
             "id": user.id,
             "username": user.username,
             "email": user.email,
@@ -972,26 +1470,43 @@ async def get_all_users(
                 "drafts": draft_count,
                 "published": published_count
             }
-        })
-    
-    return result
+        }
+        for user, content_count, draft_count, published_count in rows
+    ]
 
 
 @app.get("/admin/users/{user_id}")
 async def get_user_detail(
     user_id: int,
+    contents_limit: Optional[int] = None,
+    contents_cursor: Optional[str] = None,
+    templates_limit: Optional[int] = None,
     admin_user: User = Depends(check_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Hole Detail-Info eines Users"""
+    """Hole Detail-Info eines Users (Contents seitenweise, ohne Body)"""
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.scalar(select(User).where(User.id == user_id))
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    contents = db.query(Content).filter(Content.owner_id == user.id).all()
-    templates = db.query(Template).filter(Template.owner_id == user.id).all()
+    stats = (await db.execute(
+        select(*content_stats_columns()).where(Content.owner_id == user.id)
+    )).one()
+    
+    contents, contents_next_cursor = await keyset_page(
+        db,
+        select(Content.id, Content.title, Content.status, Content.created_at)
+        .where(Content.owner_id == user.id),
+        Content.created_at, Content.id, contents_cursor, page_size(contents_limit)
+    )
+    templates = (await db.execute(
+        select(Template.id, Template.name, Template.category)
+        .where(Template.owner_id == user.id)
+        .order_by(Template.created_at.desc())
+        .limit(page_size(templates_limit))
+    )).all()
     
     return {
         "id": user.id,
@@ -1000,6 +1515,11 @@ async def get_user_detail(
         "is_active": user.is_active,
         "is_admin": user.is_admin,
         "created_at": user.created_at.isoformat(),
+        "stats": {
+            "total_content": stats.total_content,
+            "drafts": stats.drafts,
+            "published": stats.published
+        },
         "contents": [
             {
                 "id": c.id,
@@ -1009,6 +1529,7 @@ async def get_user_detail(
             }
             for c in contents
         ],
+        "contents_next_cursor": contents_next_cursor,
         "templates": [
             {
                 "id": t.id,
@@ -1024,11 +1545,11 @@ async def get_user_detail(
 async def toggle_user_active(
     user_id: int,
     admin_user: User = Depends(check_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Aktiviere/Deaktiviere User"""
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.scalar(select(User).where(User.id == user_id))
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -1037,8 +1558,9 @@ async def toggle_user_active(
         raise HTTPException(status_code=400, detail="Cannot toggle your own status")
     
     user.is_active = not user.is_active
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
+    await invalidate_principal(user.id)
     
     return {
         "id": user.id,
@@ -1051,11 +1573,11 @@ async def toggle_user_active(
 async def toggle_user_admin(
     user_id: int,
     admin_user: User = Depends(check_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Mache User zu Admin oder entferne Admin-Status"""
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.scalar(select(User).where(User.id == user_id))
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -1064,8 +1586,9 @@ async def toggle_user_admin(
         raise HTTPException(status_code=400, detail="Cannot toggle your own admin status")
     
     user.is_admin = not user.is_admin
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
+    await invalidate_principal(user.id)
     
     return {
         "id": user.id,
@@ -1084,29 +1607,30 @@ async def edit_user(
     username: str = None,
     email: str = None,
     admin_user: User = Depends(check_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Editiere User (Username, Email)"""
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.scalar(select(User).where(User.id == user_id))
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
     if username and username != user.username:
-        existing = db.query(User).filter(User.username == username).first()
+        existing = await db.scalar(select(User).where(User.username == username))
         if existing:
             raise HTTPException(status_code=400, detail="Username already exists")
         user.username = username
     
     if email and email != user.email:
-        existing = db.query(User).filter(User.email == email).first()
+        existing = await db.scalar(select(User).where(User.email == email))
         if existing:
             raise HTTPException(status_code=400, detail="Email already exists")
         user.email = email
     
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
+    await invalidate_principal(user.id)
     
     return {
         "id": user.id,
@@ -1121,21 +1645,21 @@ async def reset_user_password(
     user_id: int,
     new_password: str,
     admin_user: User = Depends(check_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Setze neues Password für User"""
     
     if len(new_password) < 6:
         raise HTTPException(status_code=400, detail="Password must be at least 6 characters")
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.scalar(select(User).where(User.id == user_id))
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    user.hashed_password = hash_password(new_password)
-    db.commit()
-    db.refresh(user)
+    user.hashed_password = await hash_password_async(new_password)
+    await db.commit()
+    await db.refresh(user)
     
     return {
         "id": user.id,
@@ -1148,9 +1672,9 @@ async def reset_user_password(
 async def bulk_delete_users(
     user_ids: list[int],
     admin_user: User = Depends(check_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Lösche mehrere User gleichzeitig"""
+    """Deaktiviere mehrere User sofort und lösche sie samt Inhalten im Hintergrund"""
     
     if not user_ids:
         raise HTTPException(status_code=400, detail="No user IDs provided")
@@ -1158,76 +1682,183 @@ async def bulk_delete_users(
     if admin_user.id in user_ids:
         raise HTTPException(status_code=400, detail="Cannot delete yourself")
     
-    users_to_delete = db.query(User).filter(User.id.in_(user_ids)).all()
+    users_to_delete = (await db.scalars(select(User).where(User.id.in_(user_ids)))).all()
     
     if not users_to_delete:
         raise HTTPException(status_code=404, detail="No users found")
     
-    deleted_count = 0
-    deleted_usernames = []
-    
     for user in users_to_delete:
-        deleted_usernames.append(user.username)
-        db.delete(user)
-        deleted_count += 1
+        user.is_active = False
+    
+    await db.commit()
+    deleted_ids = [user.id for user in users_to_delete]
+    await invalidate_principal(*deleted_ids)
     
-    db.commit()
+    # Contents und Templates löscht der Worker in Chunks (siehe tasks.purge_users_task)
+    task = await run_in_threadpool(purge_users_task.apply_async, kwargs={"user_ids": deleted_ids})
     
     return {
-        "deleted_count": deleted_count,
-        "deleted_users": deleted_usernames,
-        "message": f"{deleted_count} users deleted successfully"
+        "deleted_count": len(deleted_ids),
+        "deleted_users": [user.username for user in users_to_delete],
+        "job_id": task.id,
+        "status": "queued",
+        "message": f"{len(deleted_ids)} users deactivated, deletion queued"
     }
 
+@app.get("/admin/users/purge/{job_id}")
+async def get_purge_job(
+    job_id: str,
+    admin_user: User = Depends(check_admin)
+):
+    """Hole Status und Fortschritt eines User-Purges"""
+    
+    result = celery_app.AsyncResult(job_id)
+    state = await run_in_threadpool(lambda: result.state)
+    
+    name = await run_in_threadpool(lambda: result.name)
+    if name and name != purge_users_task.name:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    response = {"job_id": job_id, "status": JOB_STATUS.get(state, state.lower())}
+    if state == "PROGRESS":
+        response["progress"] = result.info
+    elif state == "SUCCESS":
+        response["result"] = result.result
+    elif state == "FAILURE":
+        response["error"] = str(result.result)
+    
+    return response
+
 # ============================================
 # 📄 CONTENT MANAGEMENT
 # ============================================
 
+ADMIN_EXCERPT_LENGTH = 100
+
+def sort_params(sort: str, order: str, columns: dict):
+    if sort not in columns:
+        raise HTTPException(status_code=400, detail="Unsupported sort column")
+    if order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="order must be 'asc' or 'desc'")
+    return columns[sort], order == "desc"
+
 @app.get("/admin/contents")
 async def get_all_contents(
+    response: Response,
     admin_user: User = Depends(check_admin),
-    db: Session = Depends(get_db),
-    status: str = None
+    db: AsyncSession = Depends(get_read_db),
+    status: str = None,
+    language: Optional[str] = None,
+    tone: Optional[str] = None,
+    owner_id: Optional[int] = None,
+    sort: str = "created_at",
+    order: str = "desc",
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
 ):
-    """Hole alle Contents (optional filterable nach Status)"""
+    """Hole Contents seitenweise (filterbar nach Status, Sprache, Tone, Owner)"""
+    
+    sort_column, descending = sort_params(
+        sort, order, {"created_at": Content.created_at, "updated_at": Content.updated_at}
+    )
     
-    query = db.query(Content)
+    # Ein Join statt Owner-Lookup pro Zeile; Auszug wird in SQL gekürzt (+1 Zeichen für "...")
+    query = select(
+        Content.id,
+        Content.title,
+        func.substr(Content.excerpt, 1, ADMIN_EXCERPT_LENGTH + 1).label("excerpt"),
+        Content.status,
+        Content.language,
+        Content.tone,
+        Content.owner_id,
+        User.username.label("owner_username"),
+        Content.created_at,
+        Content.updated_at
+    ).outerjoin(User, User.id == Content.owner_id)
     
     if status:
-        query = query.filter(Content.status == status)
+        query = query.where(Content.status == status)
+    if language:
+        query = query.where(Content.language == language)
+    if tone:
+        query = query.where(Content.tone == tone)
+    if owner_id is not None:
+        query = query.where(Content.owner_id == owner_id)
+    
+    contents, next_cursor = await keyset_page(db, query, sort_column, Content.id, cursor, page_size(limit), descending)
     
-    contents = query.order_by(Content.created_at.desc()).all()
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     
     return [
         {
             "id": c.id,
             "title": c.title,
-            "body": c.body[:100] + "..." if len(c.body) > 100 else c.body,
+            "body": c.excerpt[:ADMIN_EXCERPT_LENGTH] + "..." if c.excerpt and len(c.excerpt) > ADMIN_EXCERPT_LENGTH else c.excerpt,
             "status": c.status,
             "language": c.language,
             "tone": c.tone,
             "owner_id": c.owner_id,
-            "owner_username": db.query(User).filter(User.id == c.owner_id).first().username,
+            "owner_username": c.owner_username,
             "created_at": c.created_at.isoformat()
         }
         for c in contents
     ]
 
 
+@app.get("/admin/search")
+async def admin_search_content(
+    q: str,
+    response: Response,
+    admin_user: User = Depends(check_admin),
+    db: AsyncSession = Depends(get_read_db),
+    owner_id: Optional[int] = None,
+    language: Optional[str] = None,
+    tone: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    sort: str = "rank",
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+):
+    """Volltextsuche über die Contents aller User"""
+    results, next_cursor = await search_contents(
+        db, q, owner_id, language, tone, status, date_from, date_to,
+        sort, cursor, page_size(limit), with_owner=True
+    )
+    
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    
+    return results
+
+
+@app.post("/admin/export/bulk")
+async def admin_export_bulk(
+    request: dict,
+    admin_user: User = Depends(check_admin)
+):
+    """Exportiere Contents aller User (ids oder Filter, optional owner_id) als gestreamtes ZIP"""
+    export_format, filters = parse_bulk_request(request, allow_owner=True)
+    return zip_response(stream_zip_export(export_format, filters, with_owner=True), export_format)
+
+
 @app.get("/admin/contents/{content_id}")
 async def get_content_detail(
     content_id: int,
     admin_user: User = Depends(check_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Hole vollständige Content-Info"""
     
-    content = db.query(Content).filter(Content.id == content_id).first()
+    content = await db.scalar(select(Content).options(undefer(Content.body_compressed)).where(Content.id == content_id))
     
     if not content:
         raise HTTPException(status_code=404, detail="Content not found")
     
-    owner = db.query(User).filter(User.id == content.owner_id).first()
+    owner = await db.scalar(select(User).where(User.id == content.owner_id))
+    await body_codec.ensure_loaded([content.body_compressed])
     
     return {
         "id": content.id,
@@ -1250,52 +1881,64 @@ async def get_content_detail(
 async def admin_delete_content(
     content_id: int,
     admin_user: User = Depends(check_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Lösche Content als Admin"""
     
-    content = db.query(Content).filter(Content.id == content_id).first()
+    content = await db.scalar(select(Content).where(Content.id == content_id))
     
     if not content:
         raise HTTPException(status_code=404, detail="Content not found")
     
-    db.delete(content)
-    db.commit()
+    await db.delete(content)
+    await db.commit()
+    await export_cache.invalidate(content_id)
     
     return {"message": "Content deleted"}
 
+class BulkDeleteContentsRequest(BaseModel):
+    """Body von /admin/contents/bulk-delete"""
+
+    content_ids: list[int] = Field(max_length=BULK_DELETE_MAX_IDS)
+
+
 @app.post("/admin/contents/bulk-delete")
 async def bulk_delete_contents(
-    request: dict,
+    request: BulkDeleteContentsRequest,
     admin_user: User = Depends(check_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Lösche mehrere Contents gleichzeitig"""
+    """Lösche mehrere Contents gleichzeitig (alle oder keinen)"""
     
-    content_ids = request.get("content_ids", [])
+    content_ids = request.content_ids
     
     if not content_ids:
         raise HTTPException(status_code=400, detail="No content IDs provided")
     
-    contents_to_delete = db.query(Content).filter(Content.id.in_(content_ids)).all()
+    # Ein DELETE ... RETURNING pro Chunk statt Laden und Löschen jeder Zeile, ein Commit am Ende
+    deleted = []
+    for start in range(0, len(content_ids), BULK_DELETE_CHUNK_SIZE):
+        result = await db.execute(
+            delete(Content)
+            .where(Content.id.in_(content_ids[start:start + BULK_DELETE_CHUNK_SIZE]))
+            .returning(Content.id, Content.title, Content.status, Content.language, Content.tone)
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        record_bulk_delete(db, Content, rows)
+        deleted.extend(rows)
+    await db.commit()
     
-    if not contents_to_delete:
+    if not deleted:
         raise HTTPException(status_code=404, detail="No contents found")
     
-    deleted_count = 0
-    deleted_titles = []
-    
-    for content in contents_to_delete:
-        deleted_titles.append(content.title)
-        db.delete(content)
-        deleted_count += 1
-    
-    db.commit()
+    for row in deleted:
+        await export_cache.invalidate(row.id)
     
     return {
-        "deleted_count": deleted_count,
-        "deleted_contents": deleted_titles,
-        "message": f"{deleted_count} contents deleted successfully"
+        "deleted_count": len(deleted),
+        "deleted_contents": [row.title for row in deleted],
+        "message": f"{len(deleted)} contents deleted successfully"
     }
 
 
@@ -1303,14 +1946,64 @@ async def bulk_delete_contents(
 # 📚 TEMPLATES MANAGEMENT
 # ============================================
 
+# Text-Spalten mit NULL als "", sonst würde der Keyset-Vergleich diese Zeilen überspringen
+TEMPLATE_SORT_COLUMNS = {
+    "created_at": Template.created_at,
+    "name": func.coalesce(Template.name, "").label("sort_value"),
+    "category": func.coalesce(Template.category, "").label("sort_value"),
+    "language": func.coalesce(Template.language, "").label("sort_value")
+}
+
 @app.get("/admin/templates")
 async def get_all_templates(
+    response: Response,
     admin_user: User = Depends(check_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db),
+    language: Optional[str] = None,
+    category: Optional[str] = None,
+    is_default: Optional[bool] = None,
+    owner_id: Optional[int] = None,
+    sort: str = "created_at",
+    order: str = "desc",
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
 ):
-    """Hole alle Templates (Default + Custom)"""
+    """Hole Templates seitenweise (Default + Custom, filterbar, sortierbar nach Datum, Name, Kategorie, Sprache)"""
+    
+    sort_column, descending = sort_params(sort, order, TEMPLATE_SORT_COLUMNS)
+    
+    query = select(
+        Template.id,
+        Template.name,
+        Template.category,
+        Template.language,
+        Template.is_default,
+        Template.owner_id,
+        User.username.label("owner_username"),
+        Template.created_at
+    ).outerjoin(User, User.id == Template.owner_id)
+    
+    if language:
+        query = query.where(Template.language == language)
+    if category:
+        query = query.where(Template.category == category)
+    if is_default is not None:
+        query = query.where(Template.is_default == is_default)
+    if owner_id is not None:
+        query = query.where(Template.owner_id == owner_id)
+    
+    parse = datetime.fromisoformat
+    if sort != "created_at":
+        # Sortierwert mitselektieren, daraus entsteht der Cursor der nächsten Seite
+        query = query.add_columns(sort_column)
+        parse = parse_text
+    
+    templates, next_cursor = await keyset_page(
+        db, query, sort_column, Template.id, cursor, page_size(limit), descending, parse
+    )
     
-    templates = db.query(Template).order_by(Template.created_at.desc()).all()
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     
     return [
         {
@@ -1320,7 +2013,7 @@ async def get_all_templates(
             "language": t.language,
             "is_default": t.is_default,
             "owner_id": t.owner_id,
-            "owner_username": db.query(User).filter(User.id == t.owner_id).first().username if t.owner_id else "System",
+            "owner_username": t.owner_username if t.owner_id else "System",
             "created_at": t.created_at.isoformat()
         }
         for t in templates
@@ -1331,11 +2024,11 @@ async def get_all_templates(
 async def admin_delete_template(
     template_id: int,
     admin_user: User = Depends(check_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Lösche Custom Template als Admin"""
     
-    template = db.query(Template).filter(Template.id == template_id).first()
+    template = await db.scalar(select(Template).where(Template.id == template_id))
     
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
@@ -1343,8 +2036,8 @@ async def admin_delete_template(
     if template.is_default:
         raise HTTPException(status_code=403, detail="Cannot delete default templates")
     
-    db.delete(template)
-    db.commit()
+    await db.delete(template)
+    await db.commit()
     
     return {"message": "Template deleted"}
 
@@ -1356,12 +2049,12 @@ async def admin_delete_template(
 @app.get("/admin/system/health")
 async def system_health(
     admin_user: User = Depends(check_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """System Health Check"""
     
     try:
-        db_test = db.query(User).count()
+        await db.scalar(select(func.count(User.id)))
         db_status = "✅ OK"
     except Exception as e:
         db_status = f"❌ Error: {str(e)}"
@@ -1378,40 +2071,71 @@ async def system_health(
     }
 
 
+@app.get("/admin/system/models")
+async def get_model_catalog(
+    admin_user: User = Depends(check_admin)
+):
+    """Zeige den gecachten Modell-Katalog und das aktive Modell"""
+    
+    return {
+        "active_model": getattr(model, "model_name", None),
+        "catalog": load_catalog()
+    }
+
+
+@app.post("/admin/system/models/refresh")
+async def refresh_model_catalog(
+    admin_user: User = Depends(check_admin)
+):
+    """Lade die Modell-Liste neu von Gemini und aktiviere das ausgewählte Modell"""
+    global model
+    
+    try:
+        catalog = await run_in_threadpool(refresh_catalog)
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Error loading models: {str(e)}")
+    
+    model = load_model()
+    
+    return {
+        "active_model": getattr(model, "model_name", None),
+        "selected_model": select_model_name(catalog),
+        "catalog": catalog
+    }
+
+
 @app.get("/admin/system/stats")
 async def system_stats(
     admin_user: User = Depends(check_admin),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Detaillierte System-Statistiken"""
     
-    from sqlalchemy import func
+    snapshot = await stats_cache.get(db)
+    contents = snapshot["contents"]
     
     return {
         "database": {
-            "users": db.query(User).count(),
-            "contents": db.query(Content).count(),
-            "templates": db.query(Template).count()
+            "users": snapshot["users"]["total"],
+            "contents": contents["total"],
+            "templates": snapshot["templates"]["total"]
         },
         "content_by_status": {
-            "published": db.query(Content).filter(Content.status == "published").count(),
-            "draft": db.query(Content).filter(Content.status == "draft").count()
+            "published": contents["by_status"].get("published", 0),
+            "draft": contents["by_status"].get("draft", 0)
         },
-        "content_by_language": dict(
-            db.query(Content.language, func.count(Content.id))
-            .group_by(Content.language)
-            .all()
-        ),
-        "content_by_tone": dict(
-            db.query(Content.tone, func.count(Content.id))
-            .group_by(Content.tone)
-            .all()
-        ),
-        "templates_by_category": dict(
-            db.query(Template.category, func.count(Template.id))
-            .group_by(Template.category)
-            .all()
-        ),
+        "content_by_language": contents["by_language"],
+        "content_by_tone": contents["by_tone"],
+        "templates_by_category": snapshot["templates"]["by_category"],
+        "stats_estimated": snapshot["estimated"],
+        "stats_computed_at": snapshot["computed_at"],
+        "generation_cache": generation_cache.stats(),
+        "export_cache": export_cache.stats(),
+        "export_renderer": export_renderer.stats(),
+        "body_compression": body_codec.stats(),
+        "single_flight": single_flight.stats(),
+        "gemini_limiter": gemini_limiter.stats(),
+        "database_replicas": replica_router.stats(),
         "timestamp": datetime.now().isoformat()
     }
 
@@ -1,30 +1,87 @@
 from datetime import datetime, timedelta
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import jwt
 import bcrypt
+import redis.asyncio as aioredis
 from fastapi import Depends, HTTPException, status, Header
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from models import User
-from database import session_local
+from database import get_db
+from cache import LRUCache
+from config import (
+    REDIS_URL,
+    PRINCIPAL_CACHE_TTL,
+    PRINCIPAL_CACHE_MAX_ENTRIES,
+    BCRYPT_ROUNDS,
+    PASSWORD_HASH_WORKERS
+)
 
 SECRET_KEY = "your-secret-key-change-this-in-production"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30 * 24 * 60
 
-def get_db():
-    db = session_local()
+# Kurzlebiger Cache der User-Daten pro Prozess (spart die User-Query pro Request)
+_principal_cache = LRUCache(PRINCIPAL_CACHE_MAX_ENTRIES, PRINCIPAL_CACHE_TTL)
+
+# Zähler in Redis: Invalidierungen erreichen so auch die anderen uvicorn-Worker und API-Replicas
+PRINCIPAL_VERSION_KEY = "principals:version"
+_redis = aioredis.from_url(REDIS_URL, decode_responses=True) if REDIS_URL else None
+_principal_version = None
+
+async def _check_principal_version():
+    """Principal-Cache leeren, wenn irgendein Prozess seit dem letzten Request User geändert hat"""
+    global _principal_version
+    try:
+        version = await _redis.get(PRINCIPAL_VERSION_KEY)
+    except Exception:
+        # Redis nicht erreichbar: Änderungen anderer Prozesse greifen spätestens nach PRINCIPAL_CACHE_TTL
+        return
+    if version != _principal_version:
+        _principal_version = version
+        _principal_cache.clear()
+
+async def invalidate_principal(*user_ids: int):
+    """Entferne User aus dem Principal-Cache (nach Änderungen an Status/Rechten), in allen Prozessen"""
+    for user_id in user_ids:
+        _principal_cache.delete(user_id)
+    if _redis is None:
+        return
     try:
-        yield db
-    finally:
-        db.close()
+        await _redis.incr(PRINCIPAL_VERSION_KEY)
+    except Exception:
+        pass
+
+# Eigener Pool für bcrypt (gibt den GIL frei und skaliert so mit den Cores)
+_password_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS,
+    thread_name_prefix="bcrypt"
+)
 
 def hash_password(password: str) -> str:
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     return bcrypt.hashpw(password.encode(), salt).decode()
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Prüfe ob der Hash mit einem anderen Cost-Faktor erstellt wurde"""
+    try:
+        return int(hashed_password.split("$")[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+async def hash_password_async(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, verify_password, plain_password, hashed_password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -61,7 +118,7 @@ def verify_token(token: str) -> dict:
 
 async def get_current_user(
     authorization: Optional[str] = Header(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     if not authorization:
         raise HTTPException(status_code=401, detail="Missing authorization header")
@@ -76,9 +133,25 @@ async def get_current_user(
         raise HTTPException(status_code=401, detail="Invalid authorization header")
     
     token_data = verify_token(token)
+    user_id = token_data["user_id"]
+    # Commits dieser Session markieren den User für Read-Your-Writes (siehe replicas.py)
+    db.info["user_id"] = user_id
     
-    user = db.query(User).filter(User.id == token_data["user_id"]).first()
-    if not user:
-        raise HTTPException(status_code=401, detail="User not found")
+    if _redis:
+        await _check_principal_version()
+    
+    principal = _principal_cache.get(user_id)
+    if principal is None:
+        result = await db.execute(
+            select(User.id, User.username, User.email, User.is_active, User.is_admin, User.created_at)
+            .where(User.id == user_id)
+        )
+        row = result.first()
+        if not row:
+            raise HTTPException(status_code=401, detail="User not found")
+        
+        principal = row._asdict()
+        _principal_cache.set(user_id, principal)
     
-    return user
\ No newline at end of file
+    # Losgelöstes User-Objekt: nur lesen, nicht an eine Session hängen
+    return User(**principal)
\ No newline at end of file
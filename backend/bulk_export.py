@@ -0,0 +1,170 @@
+"""Bulk-Export mehrerer Contents als gestreamtes ZIP-Archiv
+
+Zeilen werden in Batches per Keyset über die id gelesen, jeder Batch wird
+parallel gerendert (Export-Cache + Prozess-Pool) und jeder Eintrag sofort
+an den Client geschrieben. Der Speicherbedarf hängt nur von der Batch-Größe ab.
+"""
+import asyncio
+import re
+import zipfile
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from cache import export_cache
+from compression import body_codec
+from config import EXPORT_BULK_BATCH_SIZE, EXPORT_BULK_MAX_IDS
+from database import async_session_local
+from exports import EXPORT_FORMATS, export_renderer
+from models import Content
+
+
+class _ZipStream:
+    """Nicht-seekbares Ziel für zipfile (schreibt dann Data Descriptors), wird nach jedem Eintrag geleert"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def parse_bulk_request(request: dict, allow_owner: bool = False) -> tuple[str, dict]:
+    """Format und Filter (ids oder status/language/tone/date_from/date_to, für Admins owner_id) aus dem Request"""
+    export_format = request.get("format", "markdown")
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="format must be 'markdown', 'docx' or 'pdf'")
+    
+    filters = {}
+    ids = request.get("ids")
+    if ids is not None:
+        if not isinstance(ids, list) or not ids or not all(isinstance(i, int) for i in ids):
+            raise HTTPException(status_code=400, detail="ids must be a non-empty list of integers")
+        if len(ids) > EXPORT_BULK_MAX_IDS:
+            raise HTTPException(status_code=400, detail=f"Too many ids (max {EXPORT_BULK_MAX_IDS})")
+        filters["ids"] = ids
+    
+    for name in ("status", "language", "tone"):
+        if request.get(name):
+            filters[name] = str(request[name])
+    
+    for name in ("date_from", "date_to"):
+        if request.get(name):
+            try:
+                filters[name] = datetime.fromisoformat(request[name])
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=400, detail=f"Invalid {name}")
+    
+    if allow_owner and request.get("owner_id") is not None:
+        try:
+            filters["owner_id"] = int(request["owner_id"])
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="owner_id must be an integer")
+    
+    return export_format, filters
+
+
+async def fetch_batch(owner_id: Optional[int], filters: dict, after_id: int) -> list:
+    """Nächster Batch nach after_id (eigene Session, da der Stream den Request überdauert)"""
+    query = select(
+        Content.id,
+        Content.title,
+        Content.body_compressed,
+        Content.owner_id,
+        Content.created_at,
+        Content.updated_at
+    ).where(Content.id > after_id)
+    
+    if owner_id is not None:
+        query = query.where(Content.owner_id == owner_id)
+    if "owner_id" in filters:
+        query = query.where(Content.owner_id == filters["owner_id"])
+    if "ids" in filters:
+        query = query.where(Content.id.in_(filters["ids"]))
+    if "status" in filters:
+        query = query.where(Content.status == filters["status"])
+    if "language" in filters:
+        query = query.where(Content.language == filters["language"])
+    if "tone" in filters:
+        query = query.where(Content.tone == filters["tone"])
+    if "date_from" in filters:
+        query = query.where(Content.created_at >= filters["date_from"])
+    if "date_to" in filters:
+        query = query.where(Content.created_at < filters["date_to"])
+    
+    async with async_session_local() as db:
+        result = await db.execute(query.order_by(Content.id).limit(EXPORT_BULK_BATCH_SIZE))
+        return result.all()
+
+
+def entry_name(row, extension: str, with_owner: bool) -> str:
+    slug = re.sub(r"[^\w\-]+", "_", row.title or "").strip("_")[:80] or "content"
+    name = f"{row.id}_{slug}.{extension}"
+    return f"user_{row.owner_id}/{name}" if with_owner else name
+
+
+async def render_row(row, export_format: str) -> bytes:
+    key = export_cache.make_key(row.id, export_format, row.updated_at or row.created_at)
+    cached = await export_cache.get(key)
+    if cached:
+        return cached[0]
+    
+    body = body_codec.decompress(row.body_compressed)
+    data = await export_renderer.render(export_format, row.title, body or "")
+    await export_cache.set(key, data)
+    return data
+
+
+async def stream_zip_export(export_format: str, filters: dict, owner_id: Optional[int] = None, with_owner: bool = False):
+    """ZIP-Archiv Eintrag für Eintrag erzeugen; fehlgeschlagene Exporte landen in export_errors.txt"""
+    _, extension = EXPORT_FORMATS[export_format]
+    # PDF und DOCX sind bereits komprimiert
+    compression = zipfile.ZIP_DEFLATED if export_format == "markdown" else zipfile.ZIP_STORED
+    stream = _ZipStream()
+    failed = []
+    last_id = 0
+    
+    with zipfile.ZipFile(stream, "w", compression=compression) as archive:
+        while True:
+            rows = await fetch_batch(owner_id, filters, last_id)
+            if not rows:
+                break
+            last_id = rows[-1].id
+            await body_codec.ensure_loaded(row.body_compressed for row in rows)
+            
+            results = await asyncio.gather(
+                *(render_row(row, export_format) for row in rows),
+                return_exceptions=True
+            )
+            
+            for row, data in zip(rows, results):
+                if isinstance(data, Exception):
+                    failed.append(f"{row.id}: {type(data).__name__}")
+                    continue
+                
+                info = zipfile.ZipInfo(
+                    entry_name(row, extension, with_owner),
+                    date_time=(row.updated_at or row.created_at).timetuple()[:6]
+                )
+                info.compress_type = compression
+                archive.writestr(info, data)
+                yield stream.drain()
+            
+            if len(rows) < EXPORT_BULK_BATCH_SIZE:
+                break
+        
+        if failed:
+            archive.writestr("export_errors.txt", "\n".join(failed) + "\n")
+    
+    yield stream.drain()
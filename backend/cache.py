@@ -0,0 +1,346 @@
+import glob
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional
+
+import redis.asyncio as aioredis
+from fastapi.concurrency import run_in_threadpool
+
+from config import (
+    REDIS_URL,
+    GENERATION_CACHE_ENABLED,
+    GENERATION_CACHE_TTL,
+    GENERATION_CACHE_MAX_ENTRIES,
+    GENERATION_CACHE_MAX_ENTRY_BYTES,
+    EXPORT_CACHE_BACKEND,
+    EXPORT_CACHE_DIR,
+    EXPORT_CACHE_MAX_BYTES,
+    EXPORT_CACHE_MAX_ENTRY_BYTES,
+    EXPORT_CACHE_TTL,
+    CELERY_RESULT_EXPIRES
+)
+
+
+class LRUCache:
+    """Einfacher In-Process LRU Cache mit TTL"""
+
+    def __init__(self, max_entries: int, ttl: int):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+
+    def get(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value):
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class GenerationCache:
+    """Cache für Generierungs-Ergebnisse (Redis, Fallback: In-Process LRU)"""
+
+    def __init__(self, enabled: bool, redis_url: Optional[str], ttl: int, max_entries: int, max_entry_bytes: int):
+        self.enabled = enabled
+        self.ttl = ttl
+        self.max_entry_bytes = max_entry_bytes
+        self.local = LRUCache(max_entries, ttl)
+        self.redis = aioredis.from_url(redis_url, decode_responses=True) if enabled and redis_url else None
+        self.hits = 0
+        self.misses = 0
+        self.redis_errors = 0
+
+    @staticmethod
+    def make_key(model_name: str, prompt: str, settings: Optional[dict] = None) -> str:
+        payload = json.dumps(
+            {"model": model_name, "prompt": prompt, "settings": settings or {}},
+            sort_keys=True
+        )
+        return "generation:" + hashlib.sha256(payload.encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        
+        value = None
+        if self.redis:
+            try:
+                value = await self.redis.get(key)
+            except Exception:
+                self.redis_errors += 1
+                value = self.local.get(key)
+        else:
+            value = self.local.get(key)
+        
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: str):
+        if not self.enabled or len(value.encode()) > self.max_entry_bytes:
+            return
+        
+        if self.redis:
+            try:
+                await self.redis.set(key, value, ex=self.ttl)
+                return
+            except Exception:
+                self.redis_errors += 1
+        self.local.set(key, value)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "backend": "redis" if self.redis else "memory",
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "local_entries": len(self.local),
+            "redis_errors": self.redis_errors
+        }
+
+
+class JobRegistry:
+    """Besitzer eingereihter Celery-Jobs (Redis, Fallback: In-Process LRU)
+
+    Celery meldet für unbekannte IDs PENDING; erst der Eintrag beim Einreihen
+    unterscheidet einen wartenden von einem nicht existierenden Job.
+    """
+
+    def __init__(self, redis_url: Optional[str], ttl: int, max_entries: int):
+        self.ttl = ttl
+        self.local = LRUCache(max_entries, ttl)
+        self.redis = aioredis.from_url(redis_url, decode_responses=True) if redis_url else None
+        self.redis_errors = 0
+
+    async def register(self, job_id: str, owner_id: int):
+        if self.redis:
+            try:
+                await self.redis.set(f"job:{job_id}:owner", owner_id, ex=self.ttl)
+                return
+            except Exception:
+                self.redis_errors += 1
+        self.local.set(job_id, owner_id)
+
+    async def owner(self, job_id: str) -> Optional[int]:
+        """User-ID des Jobs oder None, wenn der Job unbekannt bzw. abgelaufen ist"""
+        if self.redis:
+            try:
+                owner_id = await self.redis.get(f"job:{job_id}:owner")
+                if owner_id is not None:
+                    return int(owner_id)
+            except Exception:
+                self.redis_errors += 1
+        return self.local.get(job_id)
+
+
+class ExportCache:
+    """Cache für gerenderte Exporte (lokale Disk oder Redis), Schlüssel (content_id, Format, updated_at)
+
+    Auf Disk wird per LRU auf max_bytes begrenzt (mtime = letzter Zugriff),
+    in Redis per TTL und der maxmemory-Policy des Servers.
+    """
+
+    def __init__(self, backend: str, directory: str, redis_url: Optional[str],
+                 max_bytes: int, max_entry_bytes: int, ttl: int):
+        if backend == "redis" and not redis_url:
+            backend = "disk"
+        self.backend = backend
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.ttl = ttl
+        self.redis = aioredis.from_url(redis_url) if backend == "redis" else None
+        # ETags bekannter Artefakte, damit 304-Antworten ohne I/O auskommen
+        self.etags = LRUCache(max_entries=10000, ttl=ttl)
+        self._disk_bytes = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.redis_errors = 0
+
+    @staticmethod
+    def make_key(content_id: int, export_format: str, updated_at: datetime) -> str:
+        return f"{content_id}-{export_format}-{updated_at.strftime('%Y%m%d%H%M%S%f')}"
+
+    @staticmethod
+    def make_etag(data: bytes) -> str:
+        return '"' + hashlib.sha256(data).hexdigest()[:32] + '"'
+
+    def etag(self, key: str) -> Optional[str]:
+        return self.etags.get(key)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def _read_file(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def _write_file(self, key: str, data: bytes):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self._path(key)}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self._path(key))
+        
+        if self._disk_bytes is None:
+            self._disk_bytes = self._scan()[1]
+        else:
+            self._disk_bytes += len(data)
+        if self._disk_bytes > self.max_bytes:
+            self._evict()
+
+    def _scan(self) -> tuple[list, int]:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries, sum(size for _, size, _ in entries)
+
+    def _evict(self):
+        """Älteste Artefakte löschen, bis 90% von max_bytes erreicht sind"""
+        entries, total = self._scan()
+        target = self.max_bytes * 0.9
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            self.evictions += 1
+        self._disk_bytes = total
+
+    def _remove_files(self, content_id: int):
+        for path in glob.glob(os.path.join(self.directory, f"{content_id}-*")):
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            if self._disk_bytes is not None:
+                self._disk_bytes -= size
+
+    async def get(self, key: str) -> Optional[tuple[bytes, str]]:
+        """(Bytes, ETag) des gecachten Artefakts oder None"""
+        data = None
+        if self.backend == "disk":
+            data = await run_in_threadpool(self._read_file, key)
+        elif self.backend == "redis":
+            try:
+                data = await self.redis.get(f"export:{key}")
+            except Exception:
+                self.redis_errors += 1
+        
+        if data is None:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        etag = self.etags.get(key) or self.make_etag(data)
+        self.etags.set(key, etag)
+        return data, etag
+
+    async def set(self, key: str, data: bytes) -> str:
+        """Artefakt speichern und seinen (starken) ETag zurückgeben"""
+        etag = self.make_etag(data)
+        self.etags.set(key, etag)
+        if len(data) > self.max_entry_bytes:
+            return etag
+        
+        if self.backend == "disk":
+            await run_in_threadpool(self._write_file, key, data)
+        elif self.backend == "redis":
+            content_id = key.split("-", 1)[0]
+            try:
+                await self.redis.set(f"export:{key}", data, ex=self.ttl)
+                await self.redis.sadd(f"export:index:{content_id}", key)
+                await self.redis.expire(f"export:index:{content_id}", self.ttl)
+            except Exception:
+                self.redis_errors += 1
+        return etag
+
+    async def invalidate(self, content_id: int):
+        """Alle Artefakte eines Contents entfernen (nach Update/Publish/Löschen)"""
+        if self.backend == "disk":
+            await run_in_threadpool(self._remove_files, content_id)
+        elif self.backend == "redis":
+            index_key = f"export:index:{content_id}"
+            try:
+                keys = await self.redis.smembers(index_key)
+                await self.redis.delete(index_key, *[f"export:{key.decode()}" for key in keys])
+            except Exception:
+                self.redis_errors += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "disk_bytes": self._disk_bytes,
+            "redis_errors": self.redis_errors
+        }
+
+
+generation_cache = GenerationCache(
+    enabled=GENERATION_CACHE_ENABLED,
+    redis_url=REDIS_URL,
+    ttl=GENERATION_CACHE_TTL,
+    max_entries=GENERATION_CACHE_MAX_ENTRIES,
+    max_entry_bytes=GENERATION_CACHE_MAX_ENTRY_BYTES
+)
+
+job_registry = JobRegistry(
+    redis_url=REDIS_URL,
+    ttl=CELERY_RESULT_EXPIRES,
+    max_entries=100000
+)
+
+export_cache = ExportCache(
+    backend=EXPORT_CACHE_BACKEND,
+    directory=EXPORT_CACHE_DIR,
+    redis_url=REDIS_URL,
+    max_bytes=EXPORT_CACHE_MAX_BYTES,
+    max_entry_bytes=EXPORT_CACHE_MAX_ENTRY_BYTES,
+    ttl=EXPORT_CACHE_TTL
+)
@@ -0,0 +1,139 @@
+"""Prüft per EXPLAIN, ob die heißen Queries die Indizes aus den Migrationen nutzen
+
+    DATABASE_URL=postgresql://... python check_indexes.py
+
+Auf Postgres wird enable_seqscan für die Prüfung abgeschaltet, damit auch auf
+kleinen Tabellen sichtbar wird, ob ein passender Index existiert.
+Außerdem werden INVALID-Indizes gemeldet (Reste eines abgebrochenen
+CREATE INDEX CONCURRENTLY), die Postgres nie für Queries verwendet.
+Exit-Code 1, wenn eine Query ihren Index nicht verwendet oder ein Index INVALID ist.
+"""
+import sys
+
+from sqlalchemy import func, text, tuple_
+from sqlalchemy.orm import Session
+
+from database import engine
+from models import User, Content, Template
+from search import build_tsquery
+
+
+def hot_queries(db: Session):
+    """(Name, Query, erwarteter Index) für die Queries der API"""
+    queries = [
+        (
+            "/history",
+            db.query(Content).filter(Content.owner_id == 1, Content.status == "published")
+            .order_by(Content.created_at.desc(), Content.id.desc()).limit(51),
+            "ix_contents_owner_status_created"
+        ),
+        (
+            "/history (cursor)",
+            db.query(Content).filter(
+                Content.owner_id == 1,
+                Content.status == "published",
+                tuple_(Content.created_at, Content.id) < tuple_(text("'2030-01-01'"), 1000)
+            ).order_by(Content.created_at.desc(), Content.id.desc()).limit(51),
+            "ix_contents_owner_status_created"
+        ),
+        (
+            "/drafts",
+            db.query(Content).filter(Content.owner_id == 1, Content.status == "draft")
+            .order_by(Content.updated_at.desc(), Content.id.desc()).limit(51),
+            "ix_contents_owner_status_version"
+        ),
+        (
+            "/history (ETag)",
+            db.query(func.count(Content.id), func.max(Content.id), func.max(Content.updated_at))
+            .filter(Content.owner_id == 1, Content.status == "published"),
+            "ix_contents_owner_status_version"
+        ),
+        (
+            "/drafts (ETag)",
+            db.query(func.count(Content.id), func.max(Content.id), func.max(Content.updated_at))
+            .filter(Content.owner_id == 1, Content.status == "draft"),
+            "ix_contents_owner_status_version"
+        ),
+        (
+            "/admin/contents?status=",
+            db.query(Content.id, User.username).outerjoin(User, User.id == Content.owner_id)
+            .filter(Content.status == "published")
+            .order_by(Content.created_at.desc(), Content.id.desc()).limit(51),
+            "ix_contents_status_created"
+        ),
+        (
+            "/admin/contents",
+            db.query(Content.id, User.username).outerjoin(User, User.id == Content.owner_id)
+            .order_by(Content.created_at.desc(), Content.id.desc()).limit(51),
+            "ix_contents_created"
+        ),
+        (
+            "/templates",
+            db.query(Template).filter(
+                Template.language == "en",
+                Template.is_default == False,
+                Template.owner_id == 1
+            ),
+            "ix_templates_owner_custom"
+        ),
+        (
+            "/admin/templates",
+            db.query(Template.id, User.username).outerjoin(User, User.id == Template.owner_id)
+            .order_by(Template.created_at.desc(), Template.id.desc()).limit(51),
+            "ix_templates_created_at"
+        ),
+    ]
+    
+    if engine.dialect.name == "postgresql":
+        queries.append((
+            "/search",
+            db.query(Content.id).filter(Content.search_vector.op("@@")(build_tsquery("coffee", None))),
+            "ix_contents_search_vector"
+        ))
+    
+    return queries
+
+
+def explain(db: Session, query) -> str:
+    sql = str(query.statement.compile(engine, compile_kwargs={"literal_binds": True}))
+    
+    if engine.dialect.name == "sqlite":
+        rows = db.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+        return "\n".join(row[-1] for row in rows)
+    
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    rows = db.execute(text(f"EXPLAIN {sql}")).all()
+    return "\n".join(row[0] for row in rows)
+
+
+def invalid_indexes(db: Session) -> list:
+    """Namen aller INVALID-Indizes im aktuellen Schema (nur Postgres)"""
+    if engine.dialect.name != "postgresql":
+        return []
+    return db.execute(text(
+        "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE NOT i.indisvalid AND c.relnamespace = current_schema()::regnamespace"
+    )).scalars().all()
+
+
+def main() -> int:
+    failures = 0
+    with Session(engine) as db:
+        for index in invalid_indexes(db):
+            failures += 1
+            print(f"❌ {index} is INVALID (failed concurrent build): drop it and re-run the migration")
+        
+        for name, query, index in hot_queries(db):
+            plan = explain(db, query)
+            ok = index in plan
+            failures += not ok
+            print(f"{'✅' if ok else '❌'} {name:<26} expects {index}")
+            if not ok:
+                print("    " + plan.replace("\n", "\n    "))
+        db.rollback()
+    
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+from typing import Iterable, Optional
+
+import zstandard
+from sqlalchemy import select
+
+from config import BODY_COMPRESSION_LEVEL
+from database import session_local, async_session_local
+
+
+def dictionaries_query():
+    """Alle Dictionaries, ältestes zuerst"""
+    from models import CompressionDictionary  # models importiert dieses Modul
+    return select(CompressionDictionary.id, CompressionDictionary.data).order_by(
+        CompressionDictionary.created_at, CompressionDictionary.id
+    )
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+class UnknownDictionaryError(LookupError):
+    """Body mit einem Dictionary, das (noch) nicht geladen ist"""
+
+
+class BodyCodec:
+    """zstd-Kompression der Content-Bodies mit trainierten Dictionaries
+
+    Die Dictionary-ID steht im Frame-Header: neue Bodies nutzen das jüngste
+    Dictionary, ältere bleiben mit ihrem eigenen lesbar.
+
+    Die API lädt die Dictionaries im Lifespan und vor dem Entpacken per
+    ensure_loaded() nach; nur Worker und CLI laden bei Bedarf synchron.
+    """
+
+    def __init__(self, level: int):
+        self.level = level
+        self._dictionaries = {}
+        self._active_id = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+        # zstd-Kontexte dürfen nicht parallel benutzt werden: einer pro Thread
+        self._local = threading.local()
+
+    def load(self, rows):
+        """Dictionaries aus (id, data)-Zeilen übernehmen; das letzte wird aktiv"""
+        with self._lock:
+            for dict_id, data in rows:
+                self._dictionaries[dict_id] = zstandard.ZstdCompressionDict(data)
+                self._active_id = dict_id
+            self._loaded = True
+            self._local = threading.local()
+
+    def _load_from_db(self):
+        # Fallback ohne Lifespan (Celery-Worker, CLI); auf dem Event-Loop würde das den Prozess blockieren
+        if _on_event_loop():
+            raise UnknownDictionaryError("Dictionaries not loaded; await body_codec.ensure_loaded() first")
+        with session_local() as db:
+            self.load(db.execute(dictionaries_query()).all())
+
+    async def load_async(self):
+        async with async_session_local() as db:
+            self.load((await db.execute(dictionaries_query())).all())
+
+    def _unknown(self, data: Optional[bytes]) -> bool:
+        if data is None:
+            return False
+        dict_id = zstandard.get_frame_parameters(data).dict_id
+        return bool(dict_id) and dict_id not in self._dictionaries
+
+    async def ensure_loaded(self, blobs: Iterable[Optional[bytes]]):
+        """Vor decompress() in async Code: ein woanders neu trainiertes Dictionary über die async Session nachladen"""
+        if any(self._unknown(data) for data in blobs):
+            await self.load_async()
+
+    def _compressor(self) -> zstandard.ZstdCompressor:
+        local = self._local
+        if not hasattr(local, "compressor"):
+            local.compressor = zstandard.ZstdCompressor(
+                level=self.level,
+                dict_data=self._dictionaries.get(self._active_id)
+            )
+        return local.compressor
+
+    def _decompressor(self, dict_id: int) -> zstandard.ZstdDecompressor:
+        if dict_id and dict_id not in self._dictionaries:
+            self._load_from_db()
+            if dict_id not in self._dictionaries:
+                raise UnknownDictionaryError(f"Unknown compression dictionary {dict_id}")
+
+        local = self._local
+        if not hasattr(local, "decompressors"):
+            local.decompressors = {}
+        if dict_id not in local.decompressors:
+            local.decompressors[dict_id] = zstandard.ZstdDecompressor(dict_data=self._dictionaries.get(dict_id))
+        return local.decompressors[dict_id]
+
+    def compress(self, text: Optional[str]) -> Optional[bytes]:
+        if text is None:
+            return None
+        if not self._loaded:
+            self._load_from_db()
+        return self._compressor().compress(text.encode())
+
+    def decompress(self, data: Optional[bytes]) -> Optional[str]:
+        if data is None:
+            return None
+        dict_id = zstandard.get_frame_parameters(data).dict_id
+        return self._decompressor(dict_id).decompress(data).decode()
+
+    def stats(self) -> dict:
+        return {
+            "level": self.level,
+            "dictionaries": sorted(self._dictionaries),
+            "active_dictionary": self._active_id or None
+        }
+
+
+body_codec = BodyCodec(level=BODY_COMPRESSION_LEVEL)
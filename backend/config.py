@@ -5,13 +5,120 @@ import os
 # Gemini API Configuration
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 GEMINI_API_SECRET = os.getenv('GEMINI_API_SECRET')
+GEMINI_MODEL = os.getenv('GEMINI_MODEL')
+GEMINI_DEFAULT_MODEL = os.getenv('GEMINI_DEFAULT_MODEL', 'models/gemini-2.5-flash')
+GEMINI_MODEL_CATALOG_PATH = os.getenv(
+    'GEMINI_MODEL_CATALOG_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'gemini_models.json')
+)
+# 'gemini' (echte API) oder 'fake' (lokaler Ersatz für Lasttests)
+GEMINI_BACKEND = os.getenv('GEMINI_BACKEND', 'gemini')
+GEMINI_RECORD_PATH = os.getenv('GEMINI_RECORD_PATH')
+
+# Fake Gemini Configuration (nur mit GEMINI_BACKEND=fake)
+FAKE_GEMINI_LATENCY = os.getenv('FAKE_GEMINI_LATENCY', 'lognormal:-0.5:0.6')
+FAKE_GEMINI_CHUNK_SIZE = int(os.getenv('FAKE_GEMINI_CHUNK_SIZE', '40'))
+FAKE_GEMINI_CHUNK_DELAY = float(os.getenv('FAKE_GEMINI_CHUNK_DELAY', '0.05'))
+FAKE_GEMINI_ERROR_RATE = float(os.getenv('FAKE_GEMINI_ERROR_RATE', '0'))
+FAKE_GEMINI_QUOTA_ERROR_RATE = float(os.getenv('FAKE_GEMINI_QUOTA_ERROR_RATE', '0'))
+FAKE_GEMINI_REPLAY_PATH = os.getenv('FAKE_GEMINI_REPLAY_PATH')
 
 # Database Configuration
 DATABASE_URL = os.getenv('DATABASE_URL')
 DATABASE_USER = os.getenv('DATABASE_USER')
 DATABASE_PASSWORD = os.getenv('DATABASE_PASSWORD')
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '20'))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '30'))
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))
+DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
+
+# Read Replica Configuration (kommagetrennte URLs, leer = alle Reads über den Primary)
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv('DATABASE_REPLICA_URLS', '').split(',') if url.strip()]
+REPLICA_STICKY_SECONDS = int(os.getenv('REPLICA_STICKY_SECONDS', '10'))
+REPLICA_RETRY_SECONDS = int(os.getenv('REPLICA_RETRY_SECONDS', '30'))
+
+# Auth Configuration
+PRINCIPAL_CACHE_TTL = int(os.getenv('PRINCIPAL_CACHE_TTL', '30'))
+PRINCIPAL_CACHE_MAX_ENTRIES = int(os.getenv('PRINCIPAL_CACHE_MAX_ENTRIES', '10000'))
+BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', '12'))
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', str(os.cpu_count() or 2)))
+
+# Pagination Configuration
+PAGE_SIZE_DEFAULT = int(os.getenv('PAGE_SIZE_DEFAULT', '50'))
+PAGE_SIZE_MAX = int(os.getenv('PAGE_SIZE_MAX', '200'))
+EXCERPT_LENGTH = int(os.getenv('EXCERPT_LENGTH', '200'))  # max. 500 (Länge von contents.excerpt)
+
+# HTTP Caching / Compression Configuration
+GZIP_MIN_SIZE = int(os.getenv('GZIP_MIN_SIZE', '1024'))
+GZIP_LEVEL = int(os.getenv('GZIP_LEVEL', '6'))
+CATALOG_CACHE_MAX_AGE = int(os.getenv('CATALOG_CACHE_MAX_AGE', '86400'))
+
+# Admin Statistics Configuration
+STATS_CACHE_TTL = int(os.getenv('STATS_CACHE_TTL', '60'))
+STATS_STALE_TTL = int(os.getenv('STATS_STALE_TTL', '600'))
+STATS_FAST_COUNTS = os.getenv('STATS_FAST_COUNTS', 'false').lower() == 'true'
 
 # Redis Configuration
 REDIS_HOST = os.getenv('REDIS_HOST')
 REDIS_PORT = os.getenv('REDIS_PORT')
 REDIS_PASSWORD = os.getenv('REDIS_PASSWORD')
+REDIS_URL = os.getenv('REDIS_URL')
+
+# Generation Configuration
+GENERATION_CONCURRENCY = int(os.getenv('GENERATION_CONCURRENCY', '32'))
+GENERATION_TIMEOUT = float(os.getenv('GENERATION_TIMEOUT', '120'))
+# Maximale Pause zwischen zwei Chunks eines Streams (GENERATION_TIMEOUT begrenzt den ganzen Stream)
+GENERATION_CHUNK_TIMEOUT = float(os.getenv('GENERATION_CHUNK_TIMEOUT', '30'))
+BATCH_MAX_ITEMS = int(os.getenv('BATCH_MAX_ITEMS', '100'))
+BATCH_CONCURRENCY = int(os.getenv('BATCH_CONCURRENCY', '8'))
+
+# Generation Cache Configuration
+GENERATION_CACHE_ENABLED = os.getenv('GENERATION_CACHE_ENABLED', 'false').lower() == 'true'
+GENERATION_CACHE_TTL = int(os.getenv('GENERATION_CACHE_TTL', '3600'))
+GENERATION_CACHE_MAX_ENTRIES = int(os.getenv('GENERATION_CACHE_MAX_ENTRIES', '1024'))
+GENERATION_CACHE_MAX_ENTRY_BYTES = int(os.getenv('GENERATION_CACHE_MAX_ENTRY_BYTES', '262144'))
+
+# Export Cache Configuration ('disk', 'redis' oder 'none')
+EXPORT_CACHE_BACKEND = os.getenv('EXPORT_CACHE_BACKEND', 'disk')
+EXPORT_CACHE_DIR = os.getenv(
+    'EXPORT_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'exports')
+)
+EXPORT_CACHE_MAX_BYTES = int(os.getenv('EXPORT_CACHE_MAX_BYTES', str(512 * 1024 * 1024)))
+EXPORT_CACHE_MAX_ENTRY_BYTES = int(os.getenv('EXPORT_CACHE_MAX_ENTRY_BYTES', str(20 * 1024 * 1024)))
+EXPORT_CACHE_TTL = int(os.getenv('EXPORT_CACHE_TTL', '86400'))
+
+# Export Rendering Configuration (Worker-Prozesse pro API-Prozess; 0 = Rendering im Thread-Pool)
+EXPORT_WORKERS = int(os.getenv('EXPORT_WORKERS', '2'))
+EXPORT_TIMEOUT = float(os.getenv('EXPORT_TIMEOUT', '30'))
+EXPORT_BULK_BATCH_SIZE = int(os.getenv('EXPORT_BULK_BATCH_SIZE', '50'))
+EXPORT_BULK_MAX_IDS = int(os.getenv('EXPORT_BULK_MAX_IDS', '5000'))
+
+# Body Compression Configuration (zstd; Dictionary-Training per train_dictionary.py)
+BODY_COMPRESSION_LEVEL = int(os.getenv('BODY_COMPRESSION_LEVEL', '3'))
+BODY_DICTIONARY_SIZE = int(os.getenv('BODY_DICTIONARY_SIZE', str(112 * 1024)))
+BODY_DICTIONARY_SAMPLES = int(os.getenv('BODY_DICTIONARY_SAMPLES', '10000'))
+
+# Bulk Delete Configuration (Zeilen pro DELETE und Transaktion)
+BULK_DELETE_CHUNK_SIZE = int(os.getenv('BULK_DELETE_CHUNK_SIZE', '1000'))
+BULK_DELETE_MAX_IDS = int(os.getenv('BULK_DELETE_MAX_IDS', '10000'))
+
+# Single-Flight Configuration (Zusammenfassen identischer Generierungen)
+SINGLE_FLIGHT_ENABLED = os.getenv('SINGLE_FLIGHT_ENABLED', 'true').lower() == 'true'
+SINGLE_FLIGHT_POLL_INTERVAL = float(os.getenv('SINGLE_FLIGHT_POLL_INTERVAL', '0.25'))
+SINGLE_FLIGHT_RESULT_TTL = int(os.getenv('SINGLE_FLIGHT_RESULT_TTL', '60'))
+
+# Gemini Rate Limit Configuration (0 = unbegrenzt)
+GEMINI_RPM = int(os.getenv('GEMINI_RPM', '0'))
+GEMINI_TPM = int(os.getenv('GEMINI_TPM', '0'))
+GEMINI_MIN_CONCURRENCY = int(os.getenv('GEMINI_MIN_CONCURRENCY', '1'))
+GEMINI_QUEUE_TIMEOUT = float(os.getenv('GEMINI_QUEUE_TIMEOUT', '30'))
+GEMINI_MAX_RETRIES = int(os.getenv('GEMINI_MAX_RETRIES', '3'))
+GEMINI_BACKOFF_BASE = float(os.getenv('GEMINI_BACKOFF_BASE', '1.0'))
+
+# Celery Configuration
+CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://redis:6379/0')
+CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', 'redis://redis:6379/1')
+CELERY_TASK_ALWAYS_EAGER = os.getenv('CELERY_TASK_ALWAYS_EAGER', 'false').lower() == 'true'
+CELERY_RESULT_EXPIRES = int(os.getenv('CELERY_RESULT_EXPIRES', '86400'))
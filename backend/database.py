@@ -1,17 +1,57 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
 
+from config import DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING
+
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://user:password@db:5432/mydatabase")
 
-engine = create_engine(DATABASE_URL)
+# Async-Treiber passend zur (synchronen) DATABASE_URL
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite"
+}
+
+def async_url(url: str) -> str:
+    scheme, rest = url.split("://", 1)
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}://{rest}"
+
+def pool_options(url: str) -> dict:
+    options = {"pool_pre_ping": DB_POOL_PRE_PING}
+    # SQLite nutzt eigene Pools ohne Größenlimit
+    if not url.startswith("sqlite"):
+        options.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE
+        )
+    return options
+
+# Synchron für Alembic, Celery-Worker und CLI-Skripte
+engine = create_engine(DATABASE_URL, **pool_options(DATABASE_URL))
 session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
-def get_db():
-    db = session_local()
-    try:
+# Asynchron für die API-Endpoints
+async_engine = create_async_engine(async_url(DATABASE_URL), **pool_options(DATABASE_URL))
+async_session_local = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+def enable_sqlite_foreign_keys(engine):
+    """SQLite prüft Foreign Keys (und damit ON DELETE CASCADE) nur mit diesem Pragma"""
+    @event.listens_for(engine, "connect")
+    def _set_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+if DATABASE_URL.startswith("sqlite"):
+    enable_sqlite_foreign_keys(engine)
+    enable_sqlite_foreign_keys(async_engine.sync_engine)
+
+async def get_db():
+    async with async_session_local() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
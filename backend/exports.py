@@ -0,0 +1,225 @@
+"""Rendering der Exporte (Markdown, Word, PDF) in einem Prozess-Pool
+
+PDF/DOCX-Rendering ist CPU-gebunden und würde den Event-Loop blockieren.
+Die Worker-Prozesse laden Styles und die Word-Vorlage einmal beim Start.
+Jeder API-Prozess startet EXPORT_WORKERS eigene Worker (Default 2).
+"""
+import asyncio
+import multiprocessing
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from io import BytesIO
+
+from docx import Document
+from docx.api import _default_docx_path
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.lib.units import inch
+
+from config import EXPORT_WORKERS, EXPORT_TIMEOUT
+
+FOOTER = "Generated with Easy Content Generator"
+
+# Format -> (Media-Type, Dateiendung)
+EXPORT_FORMATS = {
+    "markdown": ("text/markdown", "md"),
+    "docx": ("application/vnd.openxmlformats-officedocument.wordprocessingml.document", "docx"),
+    "pdf": ("application/pdf", "pdf")
+}
+
+
+def export_to_markdown(title: str, body: str) -> str:
+    """Konvertiert Content zu Markdown"""
+    return f"""# {title}
+
+{body}
+
+---
+{FOOTER}
+"""
+
+
+@lru_cache(maxsize=1)
+def docx_template() -> bytes:
+    with open(_default_docx_path(), "rb") as f:
+        return f.read()
+
+
+def export_to_docx(title: str, body: str) -> bytes:
+    """Konvertiert Content zu Word (.docx)"""
+    doc = Document(BytesIO(docx_template()))
+    doc.add_heading(title, 0)
+    doc.add_paragraph(body)
+    doc.add_paragraph()
+    doc.add_paragraph(FOOTER)
+    
+    output = BytesIO()
+    doc.save(output)
+    return output.getvalue()
+
+
+@lru_cache(maxsize=1)
+def pdf_styles() -> dict:
+    """Stylesheet einmal pro Prozess aufbauen statt bei jedem Export"""
+    styles = getSampleStyleSheet()
+    return {
+        "title": ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor='#1f2937',
+            spaceAfter=30
+        ),
+        "body": styles['BodyText'],
+        "footer": ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=8,
+            textColor='#9ca3af'
+        )
+    }
+
+
+def export_to_pdf(title: str, body: str) -> bytes:
+    """Konvertiert Content zu PDF"""
+    output = BytesIO()
+    doc = SimpleDocTemplate(output, pagesize=letter)
+    styles = pdf_styles()
+    story = []
+    
+    story.append(Paragraph(title, styles["title"]))
+    story.append(Spacer(1, 0.3*inch))
+    
+    for para in body.split('\n'):
+        if para.strip():
+            story.append(Paragraph(para, styles["body"]))
+        story.append(Spacer(1, 0.1*inch))
+    
+    story.append(Spacer(1, 0.5*inch))
+    story.append(Paragraph(FOOTER, styles["footer"]))
+    
+    doc.build(story)
+    return output.getvalue()
+
+
+def render_export(export_format: str, title: str, body: str) -> bytes:
+    if export_format == "markdown":
+        return export_to_markdown(title, body).encode()
+    if export_format == "docx":
+        return export_to_docx(title, body)
+    return export_to_pdf(title, body)
+
+
+class RenderTimeout(Exception):
+    """Export hat das Zeitlimit im Worker-Prozess überschritten"""
+
+
+def _raise_render_timeout(signum, frame):
+    raise RenderTimeout()
+
+
+def render_export_limited(timeout: float, export_format: str, title: str, body: str) -> bytes:
+    """render_export mit hartem Zeitlimit per SIGALRM (läuft im Hauptthread des Worker-Prozesses)
+
+    Ein Timeout im API-Prozess bricht den Job im Pool nicht ab: ohne dieses Limit
+    bliebe der Worker belegt, bis der Export irgendwann fertig ist.
+    """
+    signal.signal(signal.SIGALRM, _raise_render_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return render_export(export_format, title, body)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _warm_up():
+    """Initializer der Worker: Styles, Vorlage und Fonts vorab laden"""
+    pdf_styles()
+    docx_template()
+    export_to_pdf("warm-up", "warm-up")
+
+
+class ExportRenderer:
+    """Warmer Prozess-Pool für Exporte mit Timeout pro Job"""
+
+    def __init__(self, workers: int, timeout: float):
+        self.workers = workers
+        self.timeout = timeout
+        self._pool = None
+        self.rendered = 0
+        self.timeouts = 0
+        self.restarts = 0
+
+    def start(self):
+        if self.workers <= 0 or self._pool is not None:
+            return
+        # spawn statt fork: der API-Prozess hat bereits Threads und einen Event-Loop
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_up
+        )
+        # Alle Worker sofort starten, nicht erst beim ersten Export-Burst
+        for _ in range(self.workers):
+            self._pool.submit(int)
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def restart(self):
+        """Pool samt laufender Jobs verwerfen; der nächste Export startet neue Worker"""
+        self.restarts += 1
+        pool = self._pool
+        self.shutdown()
+        # shutdown() wartet nicht auf laufende Jobs, beendet deren Prozesse aber auch nicht
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            process.terminate()
+
+    async def render(self, export_format: str, title: str, body: str) -> bytes:
+        # Markdown ist reine String-Formatierung, dafür lohnt kein Prozesswechsel
+        if export_format == "markdown":
+            return render_export(export_format, title, body)
+        
+        loop = asyncio.get_running_loop()
+        if self.workers <= 0:
+            # Threads lassen sich nicht abbrechen: hier gilt nur das Timeout des Aufrufers
+            job = loop.run_in_executor(None, render_export, export_format, title, body)
+        else:
+            self.start()
+            job = loop.run_in_executor(self._pool, render_export_limited, self.timeout, export_format, title, body)
+        
+        try:
+            # Etwas Luft, damit normalerweise das harte Limit im Worker greift
+            data = await asyncio.wait_for(job, self.timeout + 1)
+        except RenderTimeout:
+            self.timeouts += 1
+            raise asyncio.TimeoutError()
+        except asyncio.TimeoutError:
+            # Worker reagiert nicht einmal auf SIGALRM (z.B. in C-Code): Pool neu aufsetzen
+            self.timeouts += 1
+            if self.workers > 0:
+                self.restart()
+            raise
+        except BrokenProcessPool:
+            # Ein abgestürzter Worker macht den Pool unbrauchbar: neu aufsetzen
+            self.restart()
+            raise
+        
+        self.rendered += 1
+        return data
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "rendered": self.rendered,
+            "timeouts": self.timeouts,
+            "restarts": self.restarts
+        }
+
+
+export_renderer = ExportRenderer(workers=EXPORT_WORKERS, timeout=EXPORT_TIMEOUT)
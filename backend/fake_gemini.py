@@ -0,0 +1,209 @@
+import asyncio
+import hashlib
+import json
+import random
+import time
+from typing import Callable, Optional
+
+from config import (
+    FAKE_GEMINI_LATENCY,
+    FAKE_GEMINI_CHUNK_SIZE,
+    FAKE_GEMINI_CHUNK_DELAY,
+    FAKE_GEMINI_ERROR_RATE,
+    FAKE_GEMINI_QUOTA_ERROR_RATE,
+    FAKE_GEMINI_REPLAY_PATH
+)
+
+
+class FakeGeminiError(Exception):
+    """Simulierter Serverfehler der Gemini API"""
+
+    code = 500
+
+
+class FakeQuotaError(Exception):
+    """Simulierter 429 / RESOURCE_EXHAUSTED Fehler"""
+
+    code = 429
+
+    def __init__(self):
+        super().__init__("429 RESOURCE_EXHAUSTED: Quota exceeded (fake)")
+
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+def parse_latency(spec: str) -> Callable[[], float]:
+    """Latenz-Verteilung aus einem Spec wie 'fixed:0.5', 'uniform:0.2:1.5',
+    'normal:0.8:0.2' oder 'lognormal:-0.5:0.6' (Sekunden)"""
+    kind, *params = spec.split(":")
+    values = [float(p) for p in params]
+
+    if kind == "fixed":
+        return lambda: values[0]
+    if kind == "uniform":
+        return lambda: random.uniform(values[0], values[1])
+    if kind == "normal":
+        return lambda: max(0.0, random.gauss(values[0], values[1]))
+    if kind == "lognormal":
+        return lambda: random.lognormvariate(values[0], values[1])
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+def prompt_hash(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode()).hexdigest()
+
+
+def load_recordings(path: str) -> dict:
+    """Lese aufgezeichnete Antworten (JSONL: prompt_hash, prompt, text)"""
+    recordings = {}
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                recordings[entry["prompt_hash"]] = entry["text"]
+    return recordings
+
+
+class FakeGenerativeModel:
+    """Lokaler Ersatz für genai.GenerativeModel (Lasttests ohne API-Quota)"""
+
+    def __init__(
+        self,
+        model_name: str = "models/fake-gemini",
+        latency: str = "fixed:0",
+        chunk_size: int = 40,
+        chunk_delay: float = 0.0,
+        error_rate: float = 0.0,
+        quota_error_rate: float = 0.0,
+        replay_path: Optional[str] = None
+    ):
+        self.model_name = model_name
+        self.sample_latency = parse_latency(latency)
+        self.chunk_size = chunk_size
+        self.chunk_delay = chunk_delay
+        self.error_rate = error_rate
+        self.quota_error_rate = quota_error_rate
+        self.recordings = load_recordings(replay_path) if replay_path else {}
+        self.calls = 0
+
+    def _text_for(self, prompt: str) -> str:
+        recorded = self.recordings.get(prompt_hash(prompt))
+        if recorded is not None:
+            return recorded
+
+        topic = prompt.strip().splitlines()[-1][:100]
+        paragraph = f"This is generated placeholder content about {topic}. "
+        return "\n\n".join(paragraph * 4 for _ in range(3))
+
+    def _maybe_fail(self):
+        roll = random.random()
+        if roll < self.quota_error_rate:
+            raise FakeQuotaError()
+        if roll < self.quota_error_rate + self.error_rate:
+            raise FakeGeminiError("500 INTERNAL: Injected failure (fake)")
+
+    def _chunks(self, text: str):
+        return [text[i:i + self.chunk_size] for i in range(0, len(text), self.chunk_size)]
+
+    async def generate_content_async(self, prompt: str, stream: bool = False):
+        self.calls += 1
+        await asyncio.sleep(self.sample_latency())
+        self._maybe_fail()
+        text = self._text_for(prompt)
+
+        if not stream:
+            return FakeResponse(text)
+        return _FakeAsyncStream(self._chunks(text), self.chunk_delay)
+
+    def generate_content(self, prompt: str, stream: bool = False):
+        self.calls += 1
+        time.sleep(self.sample_latency())
+        self._maybe_fail()
+        text = self._text_for(prompt)
+
+        if not stream:
+            return FakeResponse(text)
+        return _fake_sync_stream(self._chunks(text), self.chunk_delay)
+
+
+class _FakeAsyncStream:
+    def __init__(self, chunks: list, delay: float):
+        self.chunks = chunks
+        self.delay = delay
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            yield FakeResponse(chunk)
+
+
+def _fake_sync_stream(chunks: list, delay: float):
+    for chunk in chunks:
+        if delay:
+            time.sleep(delay)
+        yield FakeResponse(chunk)
+
+
+class RecordingModel:
+    """Wrapper um ein echtes Modell, der alle Antworten als JSONL mitschreibt"""
+
+    def __init__(self, model, path: str):
+        self.model = model
+        self.model_name = getattr(model, "model_name", "recorded")
+        self.path = path
+
+    def _record(self, prompt: str, text: str):
+        with open(self.path, "a") as f:
+            f.write(json.dumps({"prompt_hash": prompt_hash(prompt), "prompt": prompt, "text": text}) + "\n")
+
+    async def generate_content_async(self, prompt: str, stream: bool = False):
+        if stream:
+            response = await self.model.generate_content_async(prompt, stream=True)
+            return _RecordingAsyncStream(response, lambda text: self._record(prompt, text))
+
+        response = await self.model.generate_content_async(prompt)
+        self._record(prompt, response.text)
+        return response
+
+    def generate_content(self, prompt: str, stream: bool = False):
+        if stream:
+            return self._record_sync_stream(prompt, self.model.generate_content(prompt, stream=True))
+
+        response = self.model.generate_content(prompt)
+        self._record(prompt, response.text)
+        return response
+
+    def _record_sync_stream(self, prompt: str, response):
+        parts = []
+        for chunk in response:
+            parts.append(chunk.text)
+            yield chunk
+        self._record(prompt, "".join(parts))
+
+
+class _RecordingAsyncStream:
+    def __init__(self, response, on_complete: Callable[[str], None]):
+        self.response = response
+        self.on_complete = on_complete
+
+    async def __aiter__(self):
+        parts = []
+        async for chunk in self.response:
+            parts.append(chunk.text)
+            yield chunk
+        self.on_complete("".join(parts))
+
+
+def fake_model_from_config() -> FakeGenerativeModel:
+    return FakeGenerativeModel(
+        latency=FAKE_GEMINI_LATENCY,
+        chunk_size=FAKE_GEMINI_CHUNK_SIZE,
+        chunk_delay=FAKE_GEMINI_CHUNK_DELAY,
+        error_rate=FAKE_GEMINI_ERROR_RATE,
+        quota_error_rate=FAKE_GEMINI_QUOTA_ERROR_RATE,
+        replay_path=FAKE_GEMINI_REPLAY_PATH
+    )
@@ -0,0 +1,138 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import google.generativeai as genai
+
+from config import (
+    GEMINI_API_KEY,
+    GEMINI_BACKEND,
+    GEMINI_RECORD_PATH,
+    GENERATION_CONCURRENCY,
+    GENERATION_TIMEOUT,
+    GENERATION_CHUNK_TIMEOUT
+)
+from cache import generation_cache
+from singleflight import single_flight
+from rate_limit import gemini_limiter
+from model_catalog import load_catalog, select_model_name
+from fake_gemini import fake_model_from_config, RecordingModel
+
+# Fallback für Modelle ohne async API (eigener Pool, damit der Default-Executor frei bleibt)
+_executor = ThreadPoolExecutor(
+    max_workers=GENERATION_CONCURRENCY,
+    thread_name_prefix="gemini"
+)
+
+
+def load_model():
+    """Erzeuge das Gemini-Modell ohne Netzwerkzugriff (None wenn kein API Key gesetzt ist)"""
+    if GEMINI_BACKEND == "fake":
+        print("Using model: fake Gemini backend")
+        return fake_model_from_config()
+    
+    if not GEMINI_API_KEY:
+        return None
+    
+    genai.configure(api_key=GEMINI_API_KEY)
+    model_name = select_model_name(load_catalog())
+    print(f"Using model: {model_name}")
+    model = genai.GenerativeModel(model_name)
+    
+    if GEMINI_RECORD_PATH:
+        # Echte Antworten für spätere Replays im Fake-Backend mitschreiben
+        return RecordingModel(model, GEMINI_RECORD_PATH)
+    return model
+
+
+async def _call_model(model, prompt: str):
+    if hasattr(model, "generate_content_async"):
+        return await model.generate_content_async(prompt)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, model.generate_content, prompt)
+
+
+async def generate_text(model, prompt: str) -> str:
+    """Generiere Text, ohne den Event Loop zu blockieren"""
+    # Parallelität und Quota regelt der Limiter (GENERATION_CONCURRENCY ist das Maximum)
+    response = await gemini_limiter.run(
+        prompt,
+        lambda: asyncio.wait_for(_call_model(model, prompt), timeout=GENERATION_TIMEOUT)
+    )
+    await gemini_limiter.record_output(response.text)
+    return response.text
+
+
+def cache_key(model, prompt: str) -> str:
+    """Cache-Key aus Modellname, finalem Prompt und Generierungs-Settings"""
+    model_name = getattr(model, "model_name", type(model).__name__)
+    settings = dict(getattr(model, "_generation_config", None) or {})
+    return generation_cache.make_key(model_name, prompt, settings)
+
+
+async def generate_cached(model, prompt: str, fresh: bool = False) -> tuple[str, bool]:
+    """Generiere Text über den Cache; liefert (Text, aus_cache)"""
+    key = cache_key(model, prompt)
+    
+    if not fresh:
+        cached = await generation_cache.get(key)
+        if cached is not None:
+            return cached, True
+    
+    async def produce() -> str:
+        text = await generate_text(model, prompt)
+        await generation_cache.set(key, text)
+        return text
+    
+    if fresh:
+        # Wer ausdrücklich ein neues Ergebnis will, hängt sich nicht an einen laufenden Call
+        return await produce(), False
+    
+    # Gleichzeitige identische Anfragen teilen sich einen Upstream-Call
+    text = await single_flight.do(key, produce)
+    return text, False
+
+
+async def stream_text(model, prompt: str):
+    """Generiere Text als Stream von Chunks
+
+    GENERATION_TIMEOUT begrenzt den ganzen Stream, GENERATION_CHUNK_TIMEOUT jede
+    einzelne Pause: ein hängender Upstream hält weder die SSE-Verbindung noch den
+    Limiter-Slot unbegrenzt fest.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + GENERATION_TIMEOUT
+
+    def timeout() -> float:
+        return min(GENERATION_CHUNK_TIMEOUT, deadline - loop.time())
+
+    async with gemini_limiter.slot(prompt):
+        if hasattr(model, "generate_content_async"):
+            response = await asyncio.wait_for(
+                model.generate_content_async(prompt, stream=True),
+                timeout=timeout()
+            )
+            chunks = aiter(response)
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(anext(chunks), timeout=timeout())
+                except StopAsyncIteration:
+                    return
+                if chunk.text:
+                    await gemini_limiter.record_output(chunk.text)
+                    yield chunk.text
+
+        # Ein hängender Executor-Thread lässt sich nicht abbrechen, der Stream endet trotzdem
+        response = await asyncio.wait_for(
+            loop.run_in_executor(_executor, lambda: iter(model.generate_content(prompt, stream=True))),
+            timeout=timeout()
+        )
+        while True:
+            chunk = await asyncio.wait_for(
+                loop.run_in_executor(_executor, next, response, None),
+                timeout=timeout()
+            )
+            if chunk is None:
+                return
+            if chunk.text:
+                await gemini_limiter.record_output(chunk.text)
+                yield chunk.text
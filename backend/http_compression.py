@@ -0,0 +1,32 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import Message, Receive, Scope, Send
+
+# Nur Text wird komprimiert: SSE würde im gzip-Puffer hängen bleiben, ZIP/PDF/DOCX sind schon komprimiert
+COMPRESSIBLE_TYPES = ("application/json", "text/plain", "text/markdown", "text/html", "text/csv")
+
+
+class SelectiveGZipResponder(GZipResponder):
+    async def send_with_gzip(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            await super().send_with_gzip(message)
+            headers = MutableHeaders(raw=message["headers"])
+            if not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES):
+                # Wie eine bereits kodierte Antwort unverändert durchreichen
+                self.content_encoding_set = True
+            elif headers.get("etag", "").startswith('"'):
+                # Starke ETags gelten nur für genau diese Bytes, nicht für die gzip-Variante
+                headers["etag"] = "W/" + headers["etag"]
+            return
+        await super().send_with_gzip(message)
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware, die nur Text-Antworten komprimiert (Streams und Binärdateien bleiben unverändert)"""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = SelectiveGZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
@@ -0,0 +1,26 @@
+import os
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+
+from database import engine
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini")
+
+
+def migrate():
+    """Schema auf den neuesten Stand bringen (alembic upgrade head)"""
+    config = Config(ALEMBIC_INI)
+    tables = inspect(engine).get_table_names()
+    
+    # Datenbanken aus der create_all-Zeit auf die Ausgangs-Revision setzen
+    if "users" in tables and "alembic_version" not in tables:
+        command.stamp(config, "0001")
+    
+    command.upgrade(config, "head")
+
+
+if __name__ == "__main__":
+    migrate()
+    print("Database schema up to date")
@@ -0,0 +1,27 @@
+SUPPORTED_LANGUAGES = {
+    "en": "English",
+    "de": "German",
+    "fr": "French",
+    "es": "Spanish",
+    "it": "Italian",
+    "pt": "Portuguese",
+    "nl": "Dutch",
+    "ja": "Japanese",
+    "zh": "Chinese",
+    "ru": "Russian"
+}
+
+# Eingebaute Postgres-Textsuche-Konfigurationen (Stemmer + Stopwörter)
+POSTGRES_TEXT_SEARCH_CONFIGS = {
+    "english", "german", "french", "spanish", "italian", "portuguese", "dutch", "russian"
+}
+
+# Sprachen ohne eigene Konfiguration (z.B. Japanisch, Chinesisch) nutzen 'simple'
+TEXT_SEARCH_CONFIGS = {
+    code: name.lower() if name.lower() in POSTGRES_TEXT_SEARCH_CONFIGS else "simple"
+    for code, name in SUPPORTED_LANGUAGES.items()
+}
+
+
+def text_search_config(language: str) -> str:
+    return TEXT_SEARCH_CONFIGS.get(language, "simple")
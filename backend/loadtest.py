@@ -0,0 +1,191 @@
+"""Lasttest für die API (ohne echte Gemini-Quota)
+
+Server mit Fake-Backend starten, z.B. gegen SQLite:
+
+    DATABASE_URL=sqlite:///./loadtest.db python init_db.py
+    GEMINI_BACKEND=fake DATABASE_URL=sqlite:///./loadtest.db uvicorn app:app --port 8000
+
+Dann den Lasttest ausführen:
+
+    python loadtest.py --base-url http://localhost:8000 --users 50 --duration 60
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from collections import defaultdict
+
+import httpx
+
+# Gewichtung der Aktionen pro virtuellem User
+SCENARIO = [
+    ("generate", 2),
+    ("history", 4),
+    ("list_drafts", 2),
+    ("save_draft", 1),
+    ("export", 1)
+]
+
+TOPICS = ["electric bikes", "remote work", "coffee roasting", "home gardening", "cloud security"]
+
+
+class Stats:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.status_codes = defaultdict(lambda: defaultdict(int))
+
+    def record(self, name: str, started: float, response: httpx.Response = None, error: Exception = None):
+        self.latencies[name].append(time.perf_counter() - started)
+        if error is not None:
+            self.errors[name] += 1
+            self.status_codes[name][type(error).__name__] += 1
+            return
+        self.status_codes[name][response.status_code] += 1
+        if response.status_code >= 400:
+            self.errors[name] += 1
+
+
+def percentile(values: list, pct: float) -> float:
+    if not values:
+        return 0.0
+    # Nearest-Rank-Methode
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+async def timed(stats: Stats, name: str, request):
+    started = time.perf_counter()
+    try:
+        response = await request
+    except httpx.HTTPError as e:
+        stats.record(name, started, error=e)
+        return None
+    stats.record(name, started, response)
+    return response
+
+
+async def virtual_user(client: httpx.AsyncClient, stats: Stats, stop_at: float, think_time: float):
+    username = f"load_{uuid.uuid4().hex[:12]}"
+    password = "loadtest-password"
+
+    await timed(stats, "register", client.post(
+        "/auth/register",
+        params={"username": username, "email": f"{username}@example.com", "password": password}
+    ))
+    response = await timed(stats, "login", client.post(
+        "/auth/login", params={"username": username, "password": password}
+    ))
+    if response is None or response.status_code != 200:
+        return
+
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    content_ids = []
+    actions = [name for name, _ in SCENARIO]
+    weights = [weight for _, weight in SCENARIO]
+
+    while time.monotonic() < stop_at:
+        action = random.choices(actions, weights)[0]
+
+        if action == "generate":
+            response = await timed(stats, "generate", client.post(
+                "/generate",
+                params={"prompt": f"Write a short post about {random.choice(TOPICS)}"},
+                headers=headers
+            ))
+            if response is not None and response.status_code == 200:
+                content_ids.append(response.json()["id"])
+        elif action == "history":
+            await timed(stats, "history", client.get("/history", headers=headers))
+        elif action == "list_drafts":
+            await timed(stats, "list_drafts", client.get("/drafts", headers=headers))
+        elif action == "save_draft":
+            response = await timed(stats, "save_draft", client.post(
+                "/drafts",
+                params={"title": "Load test draft", "body": "Draft body " * 50},
+                headers=headers
+            ))
+            if response is not None and response.status_code == 200:
+                content_ids.append(response.json()["id"])
+        elif action == "export" and content_ids:
+            export_format = random.choice(["markdown", "docx", "pdf"])
+            await timed(stats, f"export_{export_format}", client.get(
+                f"/export/{random.choice(content_ids)}/{export_format}", headers=headers
+            ))
+
+        if think_time:
+            await asyncio.sleep(random.uniform(0, think_time))
+
+
+def report(stats: Stats, elapsed: float) -> dict:
+    endpoints = {}
+    for name, values in sorted(stats.latencies.items()):
+        endpoints[name] = {
+            "requests": len(values),
+            "errors": stats.errors[name],
+            "throughput_rps": round(len(values) / elapsed, 2),
+            "p50_ms": round(percentile(values, 50) * 1000, 1),
+            "p95_ms": round(percentile(values, 95) * 1000, 1),
+            "p99_ms": round(percentile(values, 99) * 1000, 1),
+            "status_codes": {str(k): v for k, v in stats.status_codes[name].items()}
+        }
+
+    total = sum(len(values) for values in stats.latencies.values())
+    return {
+        "duration_s": round(elapsed, 1),
+        "total_requests": total,
+        "total_errors": sum(stats.errors.values()),
+        "throughput_rps": round(total / elapsed, 2),
+        "endpoints": endpoints
+    }
+
+
+def print_report(result: dict):
+    print(f"\n{'endpoint':<18}{'reqs':>8}{'errors':>8}{'rps':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, row in result["endpoints"].items():
+        print(
+            f"{name:<18}{row['requests']:>8}{row['errors']:>8}{row['throughput_rps']:>9}"
+            f"{row['p50_ms']:>10}{row['p95_ms']:>10}{row['p99_ms']:>10}"
+        )
+    print(
+        f"\nTotal: {result['total_requests']} requests, {result['total_errors']} errors, "
+        f"{result['throughput_rps']} req/s over {result['duration_s']} s"
+    )
+
+
+async def main(args):
+    stats = Stats()
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        started = time.monotonic()
+        stop_at = started + args.duration
+        users = []
+        for i in range(args.users):
+            users.append(asyncio.create_task(virtual_user(client, stats, stop_at, args.think_time)))
+            if args.ramp_up:
+                await asyncio.sleep(args.ramp_up / args.users)
+        await asyncio.gather(*users)
+        elapsed = time.monotonic() - started
+
+    result = report(stats, elapsed)
+    print_report(result)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test for Easy Content Generator")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--users", type=int, default=20, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="Test duration in seconds")
+    parser.add_argument("--ramp-up", type=float, default=5, help="Seconds until all users are started")
+    parser.add_argument("--think-time", type=float, default=0.5, help="Max random pause between actions")
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--json", help="Write the report as JSON to this file")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,72 @@
+"""initial schema (Stand vor Alembic, vorher per create_all angelegt)
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("username", sa.String()),
+        sa.Column("email", sa.String()),
+        sa.Column("hashed_password", sa.String()),
+        sa.Column("is_active", sa.Boolean()),
+        sa.Column("is_admin", sa.Boolean()),
+        sa.Column("created_at", sa.DateTime()),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_username", "users", ["username"], unique=True)
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "contents",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String()),
+        sa.Column("body", sa.Text()),
+        sa.Column("language", sa.String()),
+        sa.Column("tone", sa.String()),
+        sa.Column("status", sa.String()),
+        sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id")),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("updated_at", sa.DateTime()),
+    )
+    op.create_index("ix_contents_id", "contents", ["id"])
+    op.create_index("ix_contents_title", "contents", ["title"])
+    op.create_index("ix_contents_language", "contents", ["language"])
+    op.create_index("ix_contents_tone", "contents", ["tone"])
+    op.create_index("ix_contents_status", "contents", ["status"])
+    op.create_index("ix_contents_owner_id", "contents", ["owner_id"])
+
+    op.create_table(
+        "templates",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String()),
+        sa.Column("category", sa.String()),
+        sa.Column("prompt", sa.Text()),
+        sa.Column("language", sa.String()),
+        sa.Column("is_default", sa.Boolean()),
+        sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime()),
+    )
+    op.create_index("ix_templates_id", "templates", ["id"])
+    op.create_index("ix_templates_name", "templates", ["name"])
+    op.create_index("ix_templates_category", "templates", ["category"])
+    op.create_index("ix_templates_language", "templates", ["language"])
+    op.create_index("ix_templates_owner_id", "templates", ["owner_id"])
+
+
+def downgrade():
+    op.drop_table("templates")
+    op.drop_table("contents")
+    op.drop_table("users")
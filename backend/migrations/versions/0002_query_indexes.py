@@ -0,0 +1,112 @@
+"""composite/partial indexes matching the hot queries
+
+- /history:        owner_id + status='published', ORDER BY created_at, id
+- /drafts:         owner_id + status='draft',     ORDER BY updated_at, id
+- /admin/contents: optional status,               ORDER BY created_at, id
+- /templates:      owner_id + language + is_default
+- /admin/templates:                               ORDER BY created_at
+
+Indizes werden auf Postgres mit CREATE/DROP INDEX CONCURRENTLY angelegt
+bzw. entfernt, damit die Tabellen während der Migration beschreibbar bleiben.
+Ein abgebrochener Build hinterlässt einen INVALID-Index, den IF NOT EXISTS
+stillschweigend behalten würde: solche Reste werden vorher entfernt.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+DRAFTS_ONLY = sa.text("status = 'draft'")
+
+CREATED_INDEXES = (
+    "ix_contents_owner_status_created",
+    "ix_contents_owner_drafts_updated",
+    "ix_contents_status_created",
+    "ix_contents_created",
+    "ix_templates_owner_custom",
+    "ix_templates_created_at"
+)
+RESTORED_INDEXES = ("ix_templates_owner_id", "ix_contents_status", "ix_contents_owner_id")
+
+
+def drop_invalid_indexes(names):
+    """INVALID-Indizes (Reste eines fehlgeschlagenen CONCURRENTLY-Builds) entfernen"""
+    bind = op.get_bind()
+    # Offline (--sql) gibt es keinen Katalog zum Abfragen
+    if bind.dialect.name != "postgresql" or op.get_context().as_sql:
+        return
+    
+    invalid = bind.execute(sa.text(
+        "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE NOT i.indisvalid AND c.relnamespace = current_schema()::regnamespace "
+        "AND c.relname = ANY(:names)"
+    ), {"names": list(names)}).scalars().all()
+    for name in invalid:
+        op.drop_index(name, postgresql_concurrently=True, if_exists=True)
+
+
+def upgrade():
+    # CONCURRENTLY ist in einer Transaktion nicht erlaubt
+    with op.get_context().autocommit_block():
+        drop_invalid_indexes(CREATED_INDEXES)
+        
+        op.create_index(
+            "ix_contents_owner_status_created", "contents",
+            ["owner_id", "status", "created_at", "id"],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            "ix_contents_owner_drafts_updated", "contents",
+            ["owner_id", "updated_at", "id"],
+            postgresql_where=DRAFTS_ONLY, sqlite_where=DRAFTS_ONLY,
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            "ix_contents_status_created", "contents",
+            ["status", "created_at", "id"],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            "ix_contents_created", "contents",
+            ["created_at", "id"],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            "ix_templates_owner_custom", "templates",
+            ["owner_id", "language", "is_default"],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            "ix_templates_created_at", "templates",
+            ["created_at"],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+        # Durch die Composite-Indizes abgedeckt (gleiche führende Spalte)
+        op.drop_index("ix_contents_owner_id", "contents", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_contents_status", "contents", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_templates_owner_id", "templates", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        drop_invalid_indexes(RESTORED_INDEXES)
+        
+        op.create_index("ix_templates_owner_id", "templates", ["owner_id"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_contents_status", "contents", ["status"], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index("ix_contents_owner_id", "contents", ["owner_id"], postgresql_concurrently=True, if_not_exists=True)
+
+        op.drop_index("ix_templates_created_at", "templates", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_templates_owner_custom", "templates", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_contents_created", "contents", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_contents_status_created", "contents", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_contents_owner_drafts_updated", "contents", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_contents_owner_status_created", "contents", postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,74 @@
+"""full-text search vector on contents
+
+Fügt contents.search_vector (tsvector, Titel Gewicht A + Body Gewicht B) mit
+GIN-Index hinzu. Die Konfiguration kommt aus contents.language; neue und
+geänderte Zeilen pflegt die Anwendung (models.py), bestehende Zeilen werden
+hier in Batches nachgetragen. Auf SQLite bleibt die Spalte leer.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+# Stand der Sprachzuordnung zum Zeitpunkt der Migration (languages.TEXT_SEARCH_CONFIGS)
+TEXT_SEARCH_CONFIGS = {
+    "en": "english",
+    "de": "german",
+    "fr": "french",
+    "es": "spanish",
+    "it": "italian",
+    "pt": "portuguese",
+    "nl": "dutch",
+    "ru": "russian"
+}
+
+
+def backfill():
+    config = "CASE language " + " ".join(
+        f"WHEN '{code}' THEN '{name}'" for code, name in TEXT_SEARCH_CONFIGS.items()
+    ) + " ELSE 'simple' END::regconfig"
+    
+    statement = sa.text(f"""
+        UPDATE contents SET search_vector =
+            setweight(to_tsvector({config}, coalesce(title, '')), 'A') ||
+            setweight(to_tsvector({config}, coalesce(body, '')), 'B')
+        WHERE id >= :start AND id < :stop AND search_vector IS NULL
+    """)
+    
+    bind = op.get_bind()
+    max_id = bind.execute(sa.text("SELECT coalesce(max(id), 0) FROM contents")).scalar()
+    # Kurze Transaktionen je Batch statt eines Updates über die ganze Tabelle
+    for start in range(0, max_id + 1, BACKFILL_BATCH_SIZE):
+        bind.execute(statement, {"start": start, "stop": start + BACKFILL_BATCH_SIZE})
+
+
+def upgrade():
+    op.add_column(
+        "contents",
+        sa.Column("search_vector", postgresql.TSVECTOR().with_variant(sa.Text(), "sqlite"), nullable=True)
+    )
+    
+    with op.get_context().autocommit_block():
+        if op.get_bind().dialect.name == "postgresql":
+            backfill()
+        op.create_index(
+            "ix_contents_search_vector", "contents", ["search_vector"],
+            postgresql_using="gin", postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_contents_search_vector", "contents", postgresql_concurrently=True, if_exists=True)
+    op.drop_column("contents", "search_vector")
@@ -0,0 +1,56 @@
+"""ON DELETE CASCADE for contents.owner_id and templates.owner_id
+
+Beim Löschen eines Users entfernt die Datenbank dessen Contents und
+Templates selbst; das ORM muss sie nicht mehr vorher laden (passive_deletes).
+
+Auf Postgres wird der Foreign Key als NOT VALID ersetzt und danach
+außerhalb der Transaktion validiert, damit die Tabellen nicht für die
+Dauer eines Full-Scans gesperrt sind. SQLite baut die Tabellen per Batch neu.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+TABLES = ("contents", "templates")
+
+# Namen der in 0001 unbenannt angelegten Foreign Keys (Postgres-Default)
+NAMING_CONVENTION = {"fk": "%(table_name)s_%(column_0_name)s_fkey"}
+
+
+def replace_owner_fk(ondelete):
+    if op.get_bind().dialect.name != "postgresql":
+        for table in TABLES:
+            with op.batch_alter_table(table, naming_convention=NAMING_CONVENTION) as batch:
+                batch.drop_constraint(f"{table}_owner_id_fkey", type_="foreignkey")
+                batch.create_foreign_key(
+                    f"{table}_owner_id_fkey", "users", ["owner_id"], ["id"], ondelete=ondelete
+                )
+        return
+
+    for table in TABLES:
+        op.drop_constraint(f"{table}_owner_id_fkey", table, type_="foreignkey")
+        op.create_foreign_key(
+            f"{table}_owner_id_fkey", table, "users", ["owner_id"], ["id"],
+            ondelete=ondelete, postgresql_not_valid=True
+        )
+
+    # VALIDATE braucht nur SHARE UPDATE EXCLUSIVE, Schreiben bleibt möglich
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {table}_owner_id_fkey")
+
+
+def upgrade():
+    replace_owner_fk("CASCADE")
+
+
+def downgrade():
+    replace_owner_fk(None)
@@ -0,0 +1,134 @@
+"""zstd-compressed contents.body with a stored excerpt
+
+Ersetzt contents.body (Text) durch body_compressed (zstd-Frame, siehe
+compression.py) und excerpt (die ersten 500 Zeichen für Listen). Aus einer
+Stichprobe der vorhandenen Bodies wird ein erstes Dictionary trainiert;
+danach werden alle Zeilen in Batches komprimiert und body entfernt.
+
+Vor dem Start der neuen App-Version ausführen: Zeilen, die die alte Version
+während der Migration noch schreibt, hätten danach keinen Body.
+Den frei gewordenen Platz gibt Postgres erst nach VACUUM FULL / pg_repack zurück.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+import zstandard
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+# Stand von config.py / models.py zum Zeitpunkt der Migration
+COMPRESSION_LEVEL = 3
+DICTIONARY_SIZE = 112 * 1024
+DICTIONARY_SAMPLES = 10000
+EXCERPT_MAX_LENGTH = 500
+
+
+def train_dictionary(dictionaries):
+    """Dictionary aus einer Stichprobe der Bodies (None, wenn es dafür zu wenige gibt)"""
+    samples = [
+        row[0].encode() for row in op.get_bind().execute(
+            sa.text("SELECT body FROM contents WHERE body IS NOT NULL ORDER BY random() LIMIT :limit"),
+            {"limit": DICTIONARY_SAMPLES}
+        )
+    ]
+    if not samples:
+        return None
+
+    try:
+        dictionary = zstandard.train_dictionary(DICTIONARY_SIZE, samples, level=COMPRESSION_LEVEL)
+    except zstandard.ZstdError:
+        return None
+
+    op.bulk_insert(dictionaries, [
+        {"id": dictionary.dict_id(), "data": dictionary.as_bytes(), "created_at": datetime.utcnow()}
+    ])
+    return dictionary
+
+
+def backfill(dictionary):
+    compressor = zstandard.ZstdCompressor(level=COMPRESSION_LEVEL, dict_data=dictionary)
+    bind = op.get_bind()
+
+    select_batch = sa.text(
+        "SELECT id, body FROM contents WHERE id > :after AND body IS NOT NULL ORDER BY id LIMIT :limit"
+    )
+    update = sa.text(
+        "UPDATE contents SET body_compressed = :data, excerpt = :excerpt WHERE id = :id"
+    ).bindparams(sa.bindparam("data", type_=sa.LargeBinary()))
+
+    # Kurze Transaktionen je Batch; komprimiert wird in Python
+    after = 0
+    while True:
+        rows = bind.execute(select_batch, {"after": after, "limit": BACKFILL_BATCH_SIZE}).all()
+        if not rows:
+            break
+        bind.execute(update, [
+            {"id": row_id, "data": compressor.compress(body.encode()), "excerpt": body[:EXCERPT_MAX_LENGTH]}
+            for row_id, body in rows
+        ])
+        after = rows[-1][0]
+
+
+def restore_bodies():
+    bind = op.get_bind()
+    dictionaries = {
+        row_id: zstandard.ZstdCompressionDict(data)
+        for row_id, data in bind.execute(sa.text("SELECT id, data FROM compression_dictionaries"))
+    }
+
+    select_batch = sa.text(
+        "SELECT id, body_compressed FROM contents "
+        "WHERE id > :after AND body_compressed IS NOT NULL ORDER BY id LIMIT :limit"
+    )
+    update = sa.text("UPDATE contents SET body = :body WHERE id = :id")
+
+    after = 0
+    while True:
+        rows = bind.execute(select_batch, {"after": after, "limit": BACKFILL_BATCH_SIZE}).all()
+        if not rows:
+            break
+        params = []
+        for row_id, data in rows:
+            dict_id = zstandard.get_frame_parameters(data).dict_id
+            decompressor = zstandard.ZstdDecompressor(dict_data=dictionaries.get(dict_id))
+            params.append({"id": row_id, "body": decompressor.decompress(data).decode()})
+        bind.execute(update, params)
+        after = rows[-1][0]
+
+
+def upgrade():
+    dictionaries = op.create_table(
+        "compression_dictionaries",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime()),
+    )
+    op.add_column("contents", sa.Column("body_compressed", sa.LargeBinary(), nullable=True))
+    op.add_column("contents", sa.Column("excerpt", sa.String(), nullable=True))
+
+    with op.get_context().autocommit_block():
+        backfill(train_dictionary(dictionaries))
+
+    op.drop_column("contents", "body")
+
+
+def downgrade():
+    op.add_column("contents", sa.Column("body", sa.Text(), nullable=True))
+
+    with op.get_context().autocommit_block():
+        restore_bodies()
+
+    op.drop_column("contents", "excerpt")
+    op.drop_column("contents", "body_compressed")
+    op.drop_table("compression_dictionaries")
@@ -0,0 +1,45 @@
+"""covering index for the ETag version query of /history and /drafts
+
+count(id), max(id) und max(updated_at) je owner_id + status werden damit
+per Index-Only-Scan beantwortet, ohne Tabellenzeilen zu lesen
+(ix_contents_owner_status_created enthält updated_at nicht).
+
+Der Index deckt auch die Sortierung von /drafts (status = 'draft',
+ORDER BY updated_at, id) ab und ersetzt den partiellen Index aus 0002.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+DRAFTS_ONLY = sa.text("status = 'draft'")
+
+
+def upgrade():
+    # CONCURRENTLY ist in einer Transaktion nicht erlaubt
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_contents_owner_status_version", "contents",
+            ["owner_id", "status", "updated_at", "id"],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.drop_index("ix_contents_owner_drafts_updated", "contents", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_contents_owner_drafts_updated", "contents",
+            ["owner_id", "updated_at", "id"],
+            postgresql_where=DRAFTS_ONLY, sqlite_where=DRAFTS_ONLY,
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.drop_index("ix_contents_owner_status_version", "contents", postgresql_concurrently=True, if_exists=True)
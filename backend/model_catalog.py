@@ -0,0 +1,56 @@
+import json
+import os
+from datetime import datetime
+from typing import Optional
+
+import google.generativeai as genai
+
+from config import (
+    GEMINI_API_KEY,
+    GEMINI_MODEL,
+    GEMINI_DEFAULT_MODEL,
+    GEMINI_MODEL_CATALOG_PATH
+)
+
+
+def load_catalog(path: str = GEMINI_MODEL_CATALOG_PATH) -> Optional[dict]:
+    """Lese den gecachten Modell-Katalog von der Platte (kein Netzwerk)"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def refresh_catalog(path: str = GEMINI_MODEL_CATALOG_PATH) -> dict:
+    """Frage die verfügbaren Modelle bei Gemini ab und speichere sie"""
+    if not GEMINI_API_KEY:
+        raise RuntimeError("Gemini API not configured")
+    
+    genai.configure(api_key=GEMINI_API_KEY)
+    models = [
+        m.name for m in genai.list_models()
+        if 'generateContent' in m.supported_generation_methods
+    ]
+    catalog = {
+        "models": models,
+        "updated_at": datetime.utcnow().isoformat()
+    }
+    
+    # Atomar schreiben, damit parallel startende Worker nie eine halbe Datei lesen
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(catalog, f)
+    os.replace(tmp_path, path)
+    
+    return catalog
+
+
+def select_model_name(catalog: Optional[dict] = None) -> str:
+    """GEMINI_MODEL > erstes Modell im Katalog > Default"""
+    if GEMINI_MODEL:
+        return GEMINI_MODEL
+    if catalog and catalog.get("models"):
+        return catalog["models"][0]
+    return GEMINI_DEFAULT_MODEL
@@ -1,7 +1,14 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, BigInteger, String, Text, LargeBinary, DateTime, ForeignKey, Boolean, Index, event, func, cast, inspect
+from sqlalchemy.dialects.postgresql import TSVECTOR, REGCONFIG
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
+from typing import Optional
 from database import Base
+from languages import text_search_config
+from compression import body_codec
+
+# Länge des unkomprimierten Auszugs (obere Grenze für EXCERPT_LENGTH)
+EXCERPT_MAX_LENGTH = 500
 
 class User(Base):
     __tablename__ = "users"
@@ -14,23 +21,67 @@ class User(Base):
     is_admin = Column(Boolean, default=False)  # ✅ NEU
     created_at = Column(DateTime, default=datetime.utcnow)
     
-    contents = relationship("Content", back_populates="owner", cascade="all, delete-orphan")
-    templates = relationship("Template", back_populates="owner", cascade="all, delete-orphan")
+    # Kinder löscht die Datenbank (ON DELETE CASCADE), das ORM lädt sie dafür nicht
+    contents = relationship("Content", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True)
+    templates = relationship("Template", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True)
 
 class Content(Base):
     __tablename__ = "contents"
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
-    body = Column(Text)
+    # Body zstd-komprimiert, Zugriff über Content.body; raiseload, damit Listen ihn nie nebenbei laden
+    body_compressed = deferred(Column(LargeBinary), raiseload=True)
+    # Anfang des Bodies für Listen-Auszüge, ohne den Body zu laden
+    excerpt = Column(String)
     language = Column(String, default="en", index=True)
     tone = Column(String, default="professional", index=True)
-    status = Column(String, default="published", index=True)  # ✅ NEU: 'draft' oder 'published'
-    owner_id = Column(Integer, ForeignKey("users.id"), index=True)
+    status = Column(String, default="published")  # ✅ NEU: 'draft' oder 'published'
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))  # abgedeckt durch die Composite-Indizes
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)  # ✅ NEU
+    # Volltext-Index über Titel + Body, nur auf Postgres befüllt (siehe search.py)
+    search_vector = deferred(Column(TSVECTOR().with_variant(Text(), "sqlite")))
     
     owner = relationship("User", back_populates="contents")
+    
+    @property
+    def body(self) -> Optional[str]:
+        return body_codec.decompress(self.body_compressed)
+    
+    @body.setter
+    def body(self, value: Optional[str]):
+        self.body_compressed = body_codec.compress(value)
+        self.excerpt = value[:EXCERPT_MAX_LENGTH] if value is not None else None
+    
+    # Indizes passend zu den Queries (siehe migrations/versions/0002_query_indexes.py und 0006)
+    __table_args__ = (
+        Index("ix_contents_owner_status_created", "owner_id", "status", "created_at", "id"),
+        Index("ix_contents_owner_status_version", "owner_id", "status", "updated_at", "id"),
+        Index("ix_contents_status_created", "status", "created_at", "id"),
+        Index("ix_contents_created", "created_at", "id"),
+        Index("ix_contents_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+def search_document(title: str, body: str, language: str):
+    """tsvector aus Titel (Gewicht A) und Body (Gewicht B) mit der Konfiguration der Sprache"""
+    config = cast(text_search_config(language), REGCONFIG)
+    return (
+        func.setweight(func.to_tsvector(config, title or ""), "A")
+        .op("||")(func.setweight(func.to_tsvector(config, body or ""), "B"))
+    )
+
+@event.listens_for(Content, "before_insert")
+def _set_search_vector(mapper, connection, target):
+    if connection.dialect.name == "postgresql":
+        target.search_vector = search_document(target.title, target.body, target.language or "en")
+
+@event.listens_for(Content, "before_update")
+def _update_search_vector(mapper, connection, target):
+    state = inspect(target)
+    changed = any(state.attrs[name].history.has_changes() for name in ("title", "body_compressed", "language"))
+    if changed and connection.dialect.name == "postgresql":
+        target.search_vector = search_document(target.title, target.body, target.language)
 
 class Template(Base):
     __tablename__ = "templates"
@@ -41,7 +92,18 @@ class Template(Base):
     prompt = Column(Text)
     language = Column(String, default="en", index=True)
     is_default = Column(Boolean, default=True)
-    owner_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)  # abgedeckt durch ix_templates_owner_custom
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    
+    owner = relationship("User", back_populates="templates")
     
-    owner = relationship("User", back_populates="templates")
\ No newline at end of file
+    __table_args__ = (
+        Index("ix_templates_owner_custom", "owner_id", "language", "is_default"),
+    )
+
+class CompressionDictionary(Base):
+    __tablename__ = "compression_dictionaries"
+    
+    id = Column(BigInteger, primary_key=True, autoincrement=False)  # zstd Dictionary-ID
+    data = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,80 @@
+import ast
+import base64
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import PAGE_SIZE_DEFAULT, PAGE_SIZE_MAX
+
+
+def encode_cursor(sort_value, row_id: int) -> str:
+    """Opaker Cursor aus (Sortierwert, id) der letzten Zeile"""
+    value = sort_value.isoformat() if isinstance(sort_value, datetime) else repr(sort_value)
+    raw = f"{value}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str, parse=datetime.fromisoformat) -> tuple:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        sort_value, row_id = raw.rsplit("|", 1)
+        return parse(sort_value), int(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def parse_text(value: str) -> str:
+    """Gegenstück zu repr() in encode_cursor für Text-Sortierspalten"""
+    try:
+        parsed = ast.literal_eval(value)
+    except SyntaxError:
+        raise ValueError(value)
+    if not isinstance(parsed, str):
+        raise ValueError(value)
+    return parsed
+
+
+def page_size(limit: Optional[int]) -> int:
+    if limit is None:
+        return PAGE_SIZE_DEFAULT
+    if limit < 1:
+        raise HTTPException(status_code=400, detail="Limit must be positive")
+    return min(limit, PAGE_SIZE_MAX)
+
+
+async def fetch_all(db: AsyncSession, statement) -> list:
+    """Ergebnis als Liste: ORM-Objekte bei select(Model), sonst Rows"""
+    result = await db.execute(statement)
+    descriptions = statement.column_descriptions
+    if len(descriptions) == 1 and isinstance(descriptions[0]["expr"], type):
+        return result.scalars().all()
+    return result.all()
+
+
+async def keyset_page(db: AsyncSession, statement, sort_column, id_column, cursor: Optional[str], limit: int,
+                      descending: bool = True, parse=datetime.fromisoformat):
+    """Nach (sort_column, id) sortierte Seite + Cursor der nächsten Seite"""
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor, parse)
+        position = tuple_(sort_column, id_column)
+        after = tuple_(sort_value, row_id)
+        statement = statement.where(position < after if descending else position > after)
+    
+    if descending:
+        statement = statement.order_by(sort_column.desc(), id_column.desc())
+    else:
+        statement = statement.order_by(sort_column.asc(), id_column.asc())
+    
+    # Eine Zeile mehr laden, um zu wissen ob es eine weitere Seite gibt
+    rows = await fetch_all(db, statement.limit(limit + 1))
+    
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+    
+    return rows, next_cursor
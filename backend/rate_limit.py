@@ -0,0 +1,274 @@
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, Optional
+
+import redis.asyncio as aioredis
+
+from config import (
+    REDIS_URL,
+    GENERATION_CONCURRENCY,
+    GEMINI_RPM,
+    GEMINI_TPM,
+    GEMINI_MIN_CONCURRENCY,
+    GEMINI_QUEUE_TIMEOUT,
+    GEMINI_MAX_RETRIES,
+    GEMINI_BACKOFF_BASE
+)
+
+
+class QuotaExceededError(Exception):
+    """Gemini-Quota erschöpft und Anfrage konnte nicht rechtzeitig eingeplant werden"""
+
+    def __init__(self, retry_after: float):
+        super().__init__("Gemini quota exceeded, please retry later")
+        self.retry_after = retry_after
+
+
+def is_quota_error(exc: Exception) -> bool:
+    """Erkenne 429 / RESOURCE_EXHAUSTED Fehler der Gemini API"""
+    if getattr(exc, "code", None) == 429:
+        return True
+    text = str(exc)
+    return "429" in text or "RESOURCE_EXHAUSTED" in text or "ResourceExhausted" in type(exc).__name__
+
+
+def estimate_tokens(text: str) -> int:
+    """Grobe Token-Schätzung (~4 Zeichen pro Token)"""
+    return max(1, len(text) // 4)
+
+
+class TokenBucket:
+    """Token Bucket, der sich pro Minute um `rate_per_minute` auffüllt"""
+
+    def __init__(self, rate_per_minute: int):
+        self.capacity = float(rate_per_minute)
+        self.rate = rate_per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self, amount: float, deadline: float):
+        amount = min(amount, self.capacity)
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+
+            wait = (amount - self.tokens) / self.rate
+            if time.monotonic() + wait > deadline:
+                raise QuotaExceededError(retry_after=wait)
+            await asyncio.sleep(wait)
+
+    async def debit(self, amount: float):
+        """Nachträglich verbrauchte Tokens abziehen (darf negativ werden)"""
+        self._refill()
+        self.tokens -= amount
+
+
+# Auffüllen und Abbuchen in einem Schritt; liefert die Wartezeit in Sekunden (0 = abgebucht)
+_TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local amount = tonumber(ARGV[3])
+local now_parts = redis.call('time')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local tokens = tonumber(redis.call('hget', KEYS[1], 'tokens') or capacity)
+local updated_at = tonumber(redis.call('hget', KEYS[1], 'updated_at') or now)
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+local wait = 0
+if ARGV[4] == '1' or tokens >= amount then
+    tokens = tokens - amount
+else
+    wait = (amount - tokens) / rate
+end
+redis.call('hset', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('expire', KEYS[1], 120)
+return tostring(wait)
+"""
+
+
+class RedisTokenBucket(TokenBucket):
+    """Token Bucket mit Stand in Redis, geteilt von allen API-Prozessen und Celery-Workern
+
+    Bei Redis-Fehlern wird auf den lokalen Bucket des Prozesses ausgewichen.
+    """
+
+    def __init__(self, rate_per_minute: int, redis_client, key: str):
+        super().__init__(rate_per_minute)
+        self.redis = redis_client
+        self.key = key
+        self.redis_errors = 0
+
+    async def _take(self, amount: float, force: bool) -> Optional[float]:
+        try:
+            wait = await self.redis.eval(_TAKE_SCRIPT, 1, self.key, self.capacity, self.rate, amount, int(force))
+        except Exception:
+            self.redis_errors += 1
+            return None
+        return float(wait)
+
+    async def acquire(self, amount: float, deadline: float):
+        amount = min(amount, self.capacity)
+        while True:
+            wait = await self._take(amount, force=False)
+            if wait is None:
+                return await super().acquire(amount, deadline)
+            if wait <= 0:
+                return
+
+            if time.monotonic() + wait > deadline:
+                raise QuotaExceededError(retry_after=wait)
+            await asyncio.sleep(wait)
+
+    async def debit(self, amount: float):
+        if await self._take(amount, force=True) is None:
+            await super().debit(amount)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD-Limit: +1 pro erfolgreichem Fenster, halbieren bei Throttling"""
+
+    def __init__(self, min_limit: int, max_limit: int, decrease_cooldown: float = 1.0):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self.decrease_cooldown = decrease_cooldown
+        self._last_decrease = 0.0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self, deadline: float):
+        async with self._cond:
+            while self.in_flight >= int(self.limit):
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    raise QuotaExceededError(retry_after=1.0)
+                try:
+                    await asyncio.wait_for(self._cond.wait(), timeout)
+                except asyncio.TimeoutError:
+                    raise QuotaExceededError(retry_after=1.0)
+            self.in_flight += 1
+
+    async def release(self, throttled: bool = False, succeeded: bool = False):
+        async with self._cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if throttled:
+                # Ein Burst von 429ern soll das Limit nur einmal halbieren
+                if now - self._last_decrease >= self.decrease_cooldown:
+                    self.limit = max(self.min_limit, self.limit / 2)
+                    self._last_decrease = now
+            elif succeeded:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+
+class GeminiRateLimiter:
+    """Client-seitige Rate-Kontrolle für Gemini (RPM/TPM + adaptive Parallelität)
+
+    Mit Redis teilen sich alle Prozesse (API und Celery-Worker) die RPM/TPM-Buckets,
+    ohne Redis prüft jeder Prozess die volle Quota für sich. Das AIMD-Limit gilt
+    immer pro Prozess.
+    """
+
+    def __init__(self, rpm: int, tpm: int, min_concurrency: int, max_concurrency: int,
+                 queue_timeout: float, max_retries: int, backoff_base: float,
+                 redis_url: Optional[str] = None):
+        self.redis = aioredis.from_url(redis_url) if redis_url else None
+        self.requests = self._bucket(rpm, "ratelimit:gemini:requests")
+        self.tokens = self._bucket(tpm, "ratelimit:gemini:tokens")
+        self.concurrency = AdaptiveConcurrencyLimiter(min_concurrency, max_concurrency)
+        self.queue_timeout = queue_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.succeeded = 0
+        self.throttled = 0
+        self.rejected = 0
+
+    def _bucket(self, rate_per_minute: int, key: str) -> Optional[TokenBucket]:
+        if rate_per_minute <= 0:
+            return None
+        if self.redis:
+            return RedisTokenBucket(rate_per_minute, self.redis, key)
+        return TokenBucket(rate_per_minute)
+
+    @asynccontextmanager
+    async def slot(self, prompt: str, deadline: float = None):
+        """Reserviere Quota und einen Parallelitäts-Slot für einen Gemini-Call"""
+        if deadline is None:
+            deadline = time.monotonic() + self.queue_timeout
+
+        try:
+            if self.requests:
+                await self.requests.acquire(1, deadline)
+            if self.tokens:
+                await self.tokens.acquire(estimate_tokens(prompt), deadline)
+            await self.concurrency.acquire(deadline)
+        except QuotaExceededError:
+            self.rejected += 1
+            raise
+
+        throttled = False
+        succeeded = False
+        try:
+            yield
+            succeeded = True
+            self.succeeded += 1
+        except Exception as e:
+            throttled = is_quota_error(e)
+            if throttled:
+                self.throttled += 1
+            raise
+        finally:
+            await self.concurrency.release(throttled=throttled, succeeded=succeeded)
+
+    async def record_output(self, text: str):
+        if self.tokens:
+            await self.tokens.debit(estimate_tokens(text))
+
+    async def run(self, prompt: str, call: Callable[[], Awaitable]):
+        """Führe einen Gemini-Call aus; bei 429 mit Backoff erneut versuchen"""
+        deadline = time.monotonic() + self.queue_timeout
+        attempt = 0
+        while True:
+            try:
+                async with self.slot(prompt, deadline):
+                    return await call()
+            except Exception as e:
+                if not is_quota_error(e):
+                    raise
+                attempt += 1
+                delay = self.backoff_base * 2 ** (attempt - 1) * (0.5 + random.random())
+                if attempt > self.max_retries or time.monotonic() + delay > deadline:
+                    self.rejected += 1
+                    raise QuotaExceededError(retry_after=delay) from e
+            await asyncio.sleep(delay)
+
+    def stats(self) -> dict:
+        return {
+            "shared_quota": self.redis is not None,
+            "concurrency_limit": int(self.concurrency.limit),
+            "in_flight": self.concurrency.in_flight,
+            "succeeded": self.succeeded,
+            "throttled": self.throttled,
+            "rejected": self.rejected
+        }
+
+
+gemini_limiter = GeminiRateLimiter(
+    rpm=GEMINI_RPM,
+    tpm=GEMINI_TPM,
+    min_concurrency=GEMINI_MIN_CONCURRENCY,
+    max_concurrency=GENERATION_CONCURRENCY,
+    queue_timeout=GEMINI_QUEUE_TIMEOUT,
+    max_retries=GEMINI_MAX_RETRIES,
+    backoff_base=GEMINI_BACKOFF_BASE,
+    redis_url=REDIS_URL
+)
@@ -0,0 +1,173 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import redis.asyncio as aioredis
+from fastapi import Depends
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from auth import get_current_user
+from cache import LRUCache
+from config import REDIS_URL, DATABASE_REPLICA_URLS, REPLICA_STICKY_SECONDS, REPLICA_RETRY_SECONDS
+from database import async_session_local, async_url, pool_options
+from models import User
+
+
+class Replica:
+    """Eine Read-Replica mit eigenem Pool und Health-Status"""
+
+    def __init__(self, url: str):
+        engine = create_async_engine(async_url(url), **pool_options(url))
+        self.name = engine.url.render_as_string(hide_password=True)
+        self.session_local = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+        self.down_until = 0.0
+        self.reads = 0
+        self.failures = 0
+
+    def healthy(self) -> bool:
+        return self.down_until <= time.monotonic()
+
+
+class ReplicaRouter:
+    """Verteilt Lese-Sessions reihum auf die Replicas, mit Failover auf den Primary"""
+
+    def __init__(self, urls: list, sticky_seconds: int, retry_seconds: int, redis_url: Optional[str] = None):
+        self.replicas = [Replica(url) for url in urls]
+        self.sticky_seconds = sticky_seconds
+        self.retry_seconds = retry_seconds
+        # User, die gerade geschrieben haben, lesen bis zum Ablauf vom Primary (Read-Your-Writes)
+        self._recent_writers = LRUCache(max_entries=100000, ttl=sticky_seconds)
+        # Über Redis gilt das auch für Requests, die ein anderer API-Prozess bearbeitet
+        self.redis = aioredis.from_url(redis_url) if redis_url and self.replicas else None
+        self._pending_writes = set()
+        self._next = 0
+        self.primary_reads = 0
+        self.sticky_reads = 0
+        self.redis_errors = 0
+
+    def record_write(self, user_id: int):
+        self._recent_writers.set(user_id, True)
+        if self.redis is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Synchroner Aufrufer ohne Event Loop (CLI, Celery-Worker)
+            return
+        task = loop.create_task(self._publish_write(user_id))
+        self._pending_writes.add(task)
+        task.add_done_callback(self._pending_writes.discard)
+
+    async def _publish_write(self, user_id: int):
+        try:
+            await self.redis.set(f"replica:sticky:{user_id}", 1, ex=self.sticky_seconds)
+        except Exception:
+            self.redis_errors += 1
+
+    async def is_sticky(self, user_id: int) -> bool:
+        """Hat der User innerhalb von sticky_seconds in irgendeinem Prozess geschrieben?"""
+        if self._recent_writers.get(user_id):
+            return True
+        if self.redis is None:
+            return False
+        try:
+            return bool(await self.redis.exists(f"replica:sticky:{user_id}"))
+        except Exception:
+            self.redis_errors += 1
+            return False
+
+    async def pick(self, user_id: Optional[int] = None) -> Optional[Replica]:
+        """Nächste gesunde Replica (None = Primary verwenden)"""
+        if not self.replicas:
+            return None
+        if user_id is not None and await self.is_sticky(user_id):
+            self.sticky_reads += 1
+            return None
+
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next % len(self.replicas)]
+            self._next += 1
+            if replica.healthy():
+                return replica
+        return None
+
+    def mark_down(self, replica: Replica):
+        """Replica für retry_seconds aus der Rotation nehmen"""
+        replica.down_until = time.monotonic() + self.retry_seconds
+        replica.failures += 1
+
+    @asynccontextmanager
+    async def session(self, user_id: Optional[int] = None):
+        """Lese-Session auf einer Replica, bei Verbindungsfehlern auf dem Primary"""
+        replica = await self.pick(user_id)
+        db = None
+
+        if replica is not None:
+            db = replica.session_local()
+            try:
+                # Verbindung sofort prüfen, solange noch auf den Primary ausgewichen werden kann
+                await db.connection()
+            except (DBAPIError, OSError):
+                await db.close()
+                self.mark_down(replica)
+                replica, db = None, None
+
+        if db is None:
+            db = async_session_local()
+            self.primary_reads += 1
+        else:
+            replica.reads += 1
+
+        try:
+            yield db
+        except DBAPIError as e:
+            # Replica mitten im Request weggebrochen: für die nächsten Requests aussortieren
+            if replica is not None and e.connection_invalidated:
+                self.mark_down(replica)
+            raise
+        finally:
+            await db.close()
+
+    def stats(self) -> dict:
+        return {
+            "replicas": [
+                {
+                    "name": replica.name,
+                    "healthy": replica.healthy(),
+                    "reads": replica.reads,
+                    "failures": replica.failures
+                }
+                for replica in self.replicas
+            ],
+            "primary_reads": self.primary_reads,
+            "sticky_reads": self.sticky_reads,
+            "sticky_users": len(self._recent_writers),
+            "shared_stickiness": self.redis is not None,
+            "redis_errors": self.redis_errors
+        }
+
+
+replica_router = ReplicaRouter(
+    urls=DATABASE_REPLICA_URLS,
+    sticky_seconds=REPLICA_STICKY_SECONDS,
+    retry_seconds=REPLICA_RETRY_SECONDS,
+    redis_url=REDIS_URL
+)
+
+
+async def get_read_db(current_user: User = Depends(get_current_user)):
+    """Session für reine Lese-Endpoints (Replica, falls konfiguriert)"""
+    async with replica_router.session(current_user.id) as db:
+        yield db
+
+
+@event.listens_for(Session, "after_commit")
+def _remember_writer(session):
+    # user_id setzt get_current_user auf der Primary-Session des Requests
+    user_id = session.info.get("user_id")
+    if user_id is not None:
+        replica_router.record_write(user_id)
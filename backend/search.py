@@ -0,0 +1,153 @@
+from datetime import datetime
+from functools import reduce
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import Integer, String, Text, bindparam, column, func, case, cast, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY, REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from compression import body_codec
+from config import EXCERPT_LENGTH
+from languages import TEXT_SEARCH_CONFIGS, text_search_config
+from models import User, Content
+from pagination import keyset_page
+
+MAX_QUERY_LENGTH = 256
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+
+
+def build_tsquery(q: str, language: Optional[str]):
+    """tsquery mit der Konfiguration der Sprache; ohne Sprachfilter ODER-verknüpft über alle
+    Konfigurationen, damit der Ausdruck konstant bleibt und der GIN-Index genutzt wird"""
+    configs = [text_search_config(language)] if language else sorted(set(TEXT_SEARCH_CONFIGS.values()))
+    queries = [func.websearch_to_tsquery(cast(config, REGCONFIG), q) for config in configs]
+    return reduce(lambda left, right: left.op("||")(right), queries)
+
+
+def row_config(language=Content.language):
+    """Textsuche-Konfiguration passend zur Sprache der jeweiligen Zeile"""
+    return cast(case(TEXT_SEARCH_CONFIGS, value=language, else_="simple"), REGCONFIG)
+
+
+async def headlines(db: AsyncSession, ids: list, tsquery) -> dict:
+    """ts_headline für die Trefferseite; die Bodies liegen komprimiert in der DB
+    und werden deshalb hier entpackt und als Arrays zurückgeschickt"""
+    if not ids:
+        return {}
+    
+    rows = (await db.execute(
+        select(Content.id, Content.language, Content.body_compressed).where(Content.id.in_(ids))
+    )).all()
+    await body_codec.ensure_loaded(row.body_compressed for row in rows)
+    
+    page = func.unnest(
+        bindparam("ids", [row.id for row in rows], type_=ARRAY(Integer)),
+        bindparam("languages", [row.language for row in rows], type_=ARRAY(String)),
+        bindparam("bodies", [body_codec.decompress(row.body_compressed) or "" for row in rows], type_=ARRAY(Text))
+    ).table_valued(column("id", Integer), column("language", String), column("body", Text)).render_derived(name="page")
+    
+    result = await db.execute(select(
+        page.c.id,
+        func.ts_headline(row_config(page.c.language), page.c.body, tsquery, HEADLINE_OPTIONS)
+    ))
+    return dict(result.all())
+
+
+async def search_contents(
+    db: AsyncSession,
+    q: str,
+    owner_id: Optional[int],
+    language: Optional[str],
+    tone: Optional[str],
+    status: Optional[str],
+    date_from: Optional[datetime],
+    date_to: Optional[datetime],
+    sort: str,
+    cursor: Optional[str],
+    limit: int,
+    with_owner: bool = False
+):
+    """Volltextsuche über Titel + Body mit Ranking, Snippets und Keyset-Pagination (fertige Treffer + Cursor)"""
+    q = q.strip()
+    if not q:
+        raise HTTPException(status_code=400, detail="Search query must not be empty")
+    if len(q) > MAX_QUERY_LENGTH:
+        raise HTTPException(status_code=400, detail=f"Search query too long (max {MAX_QUERY_LENGTH})")
+    if sort not in ("rank", "created_at"):
+        raise HTTPException(status_code=400, detail="sort must be 'rank' or 'created_at'")
+    
+    if db.bind.dialect.name == "postgresql":
+        tsquery = build_tsquery(q, language)
+        rank = func.ts_rank_cd(Content.search_vector, tsquery).label("rank")
+        snippet = None  # per headlines() für die fertige Seite
+        match = Content.search_vector.op("@@")(tsquery)
+    else:
+        # Ohne tsvector (SQLite in der Entwicklung): LIKE über Titel und Auszug, ohne Ranking
+        pattern = "%" + q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        rank = None
+        snippet = func.substr(Content.excerpt, 1, EXCERPT_LENGTH).label("snippet")
+        match = or_(Content.title.ilike(pattern, escape="\\"), Content.excerpt.ilike(pattern, escape="\\"))
+        sort = "created_at"
+    
+    columns = [
+        Content.id,
+        Content.title,
+        Content.language,
+        Content.tone,
+        Content.status,
+        Content.owner_id,
+        Content.created_at,
+        Content.updated_at
+    ]
+    if snippet is not None:
+        columns.append(snippet)
+    if rank is not None:
+        columns.append(rank)
+    
+    query = select(*columns).where(match)
+    if with_owner:
+        query = query.add_columns(User.username.label("owner_username")).outerjoin(User, User.id == Content.owner_id)
+    
+    if owner_id is not None:
+        query = query.where(Content.owner_id == owner_id)
+    if language:
+        query = query.where(Content.language == language)
+    if tone:
+        query = query.where(Content.tone == tone)
+    if status:
+        query = query.where(Content.status == status)
+    if date_from:
+        query = query.where(Content.created_at >= date_from)
+    if date_to:
+        query = query.where(Content.created_at < date_to)
+    
+    if sort == "rank":
+        rows, next_cursor = await keyset_page(db, query, rank, Content.id, cursor, limit, parse=float)
+    else:
+        rows, next_cursor = await keyset_page(db, query, Content.created_at, Content.id, cursor, limit)
+    
+    if snippet is None:
+        snippets = await headlines(db, [row.id for row in rows], tsquery)
+    else:
+        snippets = {row.id: row.snippet for row in rows}
+    
+    return [search_result(row, snippets.get(row.id)) for row in rows], next_cursor
+
+
+def search_result(row, snippet: Optional[str]) -> dict:
+    result = {
+        "id": row.id,
+        "title": row.title,
+        "snippet": snippet,
+        "language": row.language,
+        "tone": row.tone,
+        "status": row.status,
+        "rank": getattr(row, "rank", None),
+        "created_at": row.created_at.isoformat(),
+        "updated_at": row.updated_at.isoformat() if row.updated_at else None
+    }
+    if hasattr(row, "owner_username"):
+        result["owner_id"] = row.owner_id
+        result["owner_username"] = row.owner_username
+    return result
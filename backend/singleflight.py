@@ -0,0 +1,149 @@
+import asyncio
+import time
+import uuid
+from typing import Awaitable, Callable, Optional
+
+import redis.asyncio as aioredis
+
+from config import (
+    REDIS_URL,
+    GENERATION_TIMEOUT,
+    GEMINI_QUEUE_TIMEOUT,
+    SINGLE_FLIGHT_ENABLED,
+    SINGLE_FLIGHT_POLL_INTERVAL,
+    SINGLE_FLIGHT_RESULT_TTL
+)
+
+# Lock nur freigeben, wenn er noch uns gehört
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Lock verlängern, solange er noch uns gehört
+_EXTEND_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class SingleFlight:
+    """Fasst gleichzeitige Aufrufe mit gleichem Key zu einem Upstream-Call zusammen"""
+
+    def __init__(self, enabled: bool, redis_url: Optional[str], lock_ttl: float, poll_interval: float, result_ttl: int):
+        self.enabled = enabled
+        self.lock_ttl = lock_ttl
+        self.poll_interval = poll_interval
+        self.result_ttl = result_ttl
+        self.redis = aioredis.from_url(redis_url, decode_responses=True) if enabled and redis_url else None
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.leaders = 0
+        self.local_followers = 0
+        self.remote_followers = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[str]]) -> str:
+        if not self.enabled:
+            return await fn()
+        
+        task = self._inflight.get(key)
+        if task is None:
+            # Eigener Task, damit ein abgebrochener Client die Wartenden nicht mitreißt
+            task = asyncio.ensure_future(self._run(key, fn))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.local_followers += 1
+        
+        return await asyncio.shield(task)
+
+    async def _run(self, key: str, fn: Callable[[], Awaitable[str]]) -> str:
+        if not self.redis:
+            self.leaders += 1
+            return await fn()
+        
+        lock_key = f"singleflight:lock:{key}"
+        deadline = time.monotonic() + self.lock_ttl
+        
+        try:
+            while time.monotonic() < deadline:
+                token = uuid.uuid4().hex
+                if await self.redis.set(lock_key, token, nx=True, px=int(self.lock_ttl * 1000)):
+                    return await self._lead(lock_key, token, fn)
+                
+                # Ein anderer Worker generiert bereits: auf dessen Ergebnis warten
+                leader_token = await self.redis.get(lock_key)
+                if leader_token is None:
+                    continue
+                
+                result = await self._follow(lock_key, leader_token)
+                if result is not None:
+                    self.remote_followers += 1
+                    return result
+        except aioredis.RedisError:
+            pass
+        
+        self.leaders += 1
+        return await fn()
+
+    async def _lead(self, lock_key: str, token: str, fn: Callable[[], Awaitable[str]]) -> str:
+        self.leaders += 1
+        keep_alive = asyncio.ensure_future(self._keep_lock(lock_key, token))
+        try:
+            result = await fn()
+            try:
+                await self.redis.set(f"{lock_key}:result:{token}", result, ex=self.result_ttl)
+            except aioredis.RedisError:
+                pass
+            return result
+        finally:
+            keep_alive.cancel()
+            try:
+                await self.redis.eval(_RELEASE_SCRIPT, 1, lock_key, token)
+            except aioredis.RedisError:
+                pass
+
+    async def _keep_lock(self, lock_key: str, token: str):
+        """Lock verlängern, solange der Leader in der Limiter-Queue wartet oder generiert"""
+        while True:
+            await asyncio.sleep(self.lock_ttl / 3)
+            try:
+                if not await self.redis.eval(_EXTEND_SCRIPT, 1, lock_key, token, int(self.lock_ttl * 1000)):
+                    return
+            except aioredis.RedisError:
+                return
+
+    async def _follow(self, lock_key: str, leader_token: str) -> Optional[str]:
+        # Kein eigenes Timeout: der Leader hält den Lock nur, solange er lebt
+        result_key = f"{lock_key}:result:{leader_token}"
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            result = await self.redis.get(result_key)
+            if result is not None:
+                return result
+            if await self.redis.get(lock_key) != leader_token:
+                # Leader fertig ohne Ergebnis (z.B. Fehler) oder Lock abgelaufen
+                return await self.redis.get(result_key)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "distributed": self.redis is not None,
+            "in_flight": len(self._inflight),
+            "leaders": self.leaders,
+            "local_followers": self.local_followers,
+            "remote_followers": self.remote_followers
+        }
+
+
+single_flight = SingleFlight(
+    enabled=SINGLE_FLIGHT_ENABLED,
+    redis_url=REDIS_URL,
+    # Wartezeit im Limiter plus Generierung; der Leader verlängert den Lock zusätzlich
+    lock_ttl=GEMINI_QUEUE_TIMEOUT + GENERATION_TIMEOUT,
+    poll_interval=SINGLE_FLIGHT_POLL_INTERVAL,
+    result_ttl=SINGLE_FLIGHT_RESULT_TTL
+)
@@ -0,0 +1,281 @@
+import asyncio
+import logging
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+
+import redis
+import redis.asyncio as aioredis
+from sqlalchemy import event, func, case, inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from config import REDIS_URL, STATS_CACHE_TTL, STATS_STALE_TTL, STATS_FAST_COUNTS
+from replicas import replica_router
+from models import User, Content, Template
+
+logger = logging.getLogger(__name__)
+
+# Zähler in Redis: andere Prozesse (Celery-Worker) melden darüber Änderungen am Session-Listener vorbei
+STATS_VERSION_KEY = "stats:version"
+
+
+async def compute_snapshot(db: AsyncSession) -> dict:
+    """Alle Dashboard-Zahlen mit drei Aggregat-Queries (je ein Scan pro Tabelle)"""
+    users = (await db.execute(select(
+        func.count(User.id),
+        func.count(case((User.is_active == True, 1))),
+        func.count(case((User.is_admin == True, 1)))
+    ))).one()
+
+    # Eine Gruppierung über (Sprache, Tone, Status) liefert Totals und alle Verteilungen
+    content_groups = (await db.execute(
+        select(Content.language, Content.tone, Content.status, func.count(Content.id))
+        .group_by(Content.language, Content.tone, Content.status)
+    )).all()
+
+    template_groups = (await db.execute(
+        select(Template.category, Template.is_default, func.count(Template.id))
+        .group_by(Template.category, Template.is_default)
+    )).all()
+
+    by_language, by_tone, by_status = Counter(), Counter(), Counter()
+    for language, tone, status, count in content_groups:
+        by_language[language] += count
+        by_tone[tone] += count
+        by_status[status] += count
+
+    by_category, by_default = Counter(), Counter()
+    for category, is_default, count in template_groups:
+        by_category[category] += count
+        by_default[bool(is_default)] += count
+
+    return {
+        "users": {"total": users[0], "active": users[1], "admins": users[2]},
+        "contents": {
+            "total": sum(by_status.values()),
+            "by_status": dict(by_status),
+            "by_language": dict(by_language),
+            "by_tone": dict(by_tone)
+        },
+        "templates": {
+            "total": sum(by_category.values()),
+            "default": by_default[True],
+            "custom": by_default[False],
+            "by_category": dict(by_category)
+        },
+        "estimated": False,
+        "computed_at": datetime.now().isoformat()
+    }
+
+
+async def estimate_snapshot(db: AsyncSession) -> Optional[dict]:
+    """Sofortige Schätzung der Tabellengrößen aus den Planner-Statistiken (nur Postgres)"""
+    if db.bind.dialect.name != "postgresql":
+        return None
+
+    estimates = dict((await db.execute(text(
+        "SELECT relname, GREATEST(reltuples, 0)::bigint FROM pg_class "
+        "WHERE relname IN ('users', 'contents', 'templates') AND relkind = 'r'"
+    ))).all())
+
+    return {
+        "users": {"total": estimates.get("users", 0), "active": None, "admins": None},
+        "contents": {"total": estimates.get("contents", 0), "by_status": {}, "by_language": {}, "by_tone": {}},
+        "templates": {"total": estimates.get("templates", 0), "default": None, "custom": None, "by_category": {}},
+        "estimated": True,
+        "computed_at": datetime.now().isoformat()
+    }
+
+
+class StatsCache:
+    """Snapshot-Cache mit TTL und Stale-While-Revalidate
+
+    Commits dieses Prozesses werden sofort als Delta eingerechnet, Änderungen der
+    Celery-Worker über den Redis-Zähler STATS_VERSION_KEY beim nächsten Request.
+    Schreibzugriffe anderer API-Prozesse erscheinen erst mit dem nächsten Refresh,
+    also nach spätestens `ttl` Sekunden plus der Dauer einer Neuberechnung.
+    """
+
+    def __init__(self, ttl: int, stale_ttl: int, fast_counts: bool, redis_url: Optional[str]):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.fast_counts = fast_counts
+        self.redis = aioredis.from_url(redis_url, decode_responses=True) if redis_url else None
+        self.redis_errors = 0
+        self._version = None
+        self._snapshot = None
+        self._computed_at = 0.0
+        self._refresh_task = None
+        self._lock = asyncio.Lock()
+
+    async def _check_version(self):
+        """Snapshot verwerfen, wenn ein anderer Prozess seit dem letzten Request Änderungen gemeldet hat"""
+        try:
+            version = await self.redis.get(STATS_VERSION_KEY)
+        except Exception:
+            self.redis_errors += 1
+            return
+        if version != self._version:
+            self._version = version
+            self.invalidate()
+
+    async def _refresh(self) -> dict:
+        async with replica_router.session() as db:
+            snapshot = await compute_snapshot(db)
+        self._snapshot = snapshot
+        self._computed_at = time.monotonic()
+        return snapshot
+
+    def _refresh_in_background(self):
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._refresh())
+            self._refresh_task.add_done_callback(self._refresh_done)
+
+    def _refresh_done(self, task: asyncio.Task):
+        if task.cancelled() or task.exception() is None:
+            return
+        logger.error("Background stats refresh failed", exc_info=task.exception())
+        # Kalter Cache: der nächste Request berechnet selbst, statt weiter den alten Snapshot zu bekommen
+        self._snapshot = None
+        self._computed_at = 0.0
+
+    async def get(self, db: AsyncSession) -> dict:
+        if self.redis:
+            await self._check_version()
+        
+        age = time.monotonic() - self._computed_at
+
+        if self._snapshot is not None and age < self.ttl:
+            return self._snapshot
+
+        if self._snapshot is not None and age < self.ttl + self.stale_ttl:
+            # Veralteten Snapshot sofort liefern, im Hintergrund neu berechnen
+            self._refresh_in_background()
+            return self._snapshot
+
+        if self.fast_counts:
+            estimate = await estimate_snapshot(db)
+            if estimate is not None:
+                self._refresh_in_background()
+                return estimate
+
+        # Kein brauchbarer Snapshot: einmal berechnen, parallele Requests warten darauf
+        async with self._lock:
+            if self._snapshot is None or time.monotonic() - self._computed_at >= self.ttl + self.stale_ttl:
+                await self._refresh()
+            return self._snapshot
+
+    def apply_deltas(self, deltas: Counter):
+        """Committete Änderungen direkt in den Snapshot einrechnen (bis zum nächsten Refresh)"""
+        if self._snapshot is None:
+            return
+        for path, delta in deltas.items():
+            if not delta:
+                continue
+            *parents, leaf = path
+            node = self._snapshot
+            for key in parents:
+                node = node[key]
+            node[leaf] = (node.get(leaf) or 0) + delta
+            if parents[-1].startswith("by_") and node[leaf] <= 0:
+                del node[leaf]
+
+    def invalidate(self):
+        self._computed_at = 0.0
+
+
+def _counter_paths(model, value) -> list:
+    """Snapshot-Zähler, zu denen eine Zeile mit den gegebenen Attributwerten beiträgt"""
+    if model is Content:
+        return [
+            ("contents", "total"),
+            ("contents", "by_status", value("status")),
+            ("contents", "by_language", value("language")),
+            ("contents", "by_tone", value("tone"))
+        ]
+    if model is User:
+        paths = [("users", "total")]
+        if value("is_active"):
+            paths.append(("users", "active"))
+        if value("is_admin"):
+            paths.append(("users", "admins"))
+        return paths
+    if model is Template:
+        return [
+            ("templates", "total"),
+            ("templates", "default" if value("is_default") else "custom"),
+            ("templates", "by_category", value("category"))
+        ]
+    return []
+
+
+def _previous_value(obj):
+    state = inspect(obj)
+
+    def value(name):
+        history = state.attrs[name].history
+        return history.deleted[0] if history.deleted else getattr(obj, name)
+    return value
+
+
+def record_bulk_delete(session, model, rows):
+    """Am ORM vorbei gelöschte Zeilen (DELETE ... RETURNING) beim Commit einrechnen"""
+    deltas = session.info.setdefault("stats_deltas", Counter())
+    for row in rows:
+        for path in _counter_paths(model, lambda name: getattr(row, name)):
+            deltas[path] -= 1
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_stats_deltas(session, flush_context):
+    deltas = session.info.setdefault("stats_deltas", Counter())
+    for obj in session.new:
+        for path in _counter_paths(type(obj), lambda name: getattr(obj, name)):
+            deltas[path] += 1
+    for obj in session.deleted:
+        for path in _counter_paths(type(obj), _previous_value(obj)):
+            deltas[path] -= 1
+    for obj in session.dirty:
+        for path in _counter_paths(type(obj), _previous_value(obj)):
+            deltas[path] -= 1
+        for path in _counter_paths(type(obj), lambda name: getattr(obj, name)):
+            deltas[path] += 1
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_stats_deltas(session):
+    deltas = session.info.pop("stats_deltas", None)
+    if deltas:
+        stats_cache.apply_deltas(deltas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stats_deltas(session):
+    session.info.pop("stats_deltas", None)
+
+
+stats_cache = StatsCache(
+    ttl=STATS_CACHE_TTL,
+    stale_ttl=STATS_STALE_TTL,
+    fast_counts=STATS_FAST_COUNTS,
+    redis_url=REDIS_URL
+)
+
+_sync_redis = redis.Redis.from_url(REDIS_URL) if REDIS_URL else None
+
+
+def publish_stats_change():
+    """Snapshot in diesem und (über Redis) in allen API-Prozessen verwerfen
+
+    Für Änderungen, die der Session-Listener nicht sieht, z.B. Set-basierte
+    Deletes im Celery-Worker. Ohne Redis erreicht das nur den eigenen Prozess.
+    """
+    stats_cache.invalidate()
+    if _sync_redis is None:
+        return
+    try:
+        _sync_redis.incr(STATS_VERSION_KEY)
+    except Exception:
+        stats_cache.redis_errors += 1
@@ -0,0 +1,160 @@
+import asyncio
+import threading
+
+from celery import Celery
+from sqlalchemy import select, delete
+
+from config import (
+    CELERY_BROKER_URL,
+    CELERY_RESULT_BACKEND,
+    CELERY_TASK_ALWAYS_EAGER,
+    CELERY_RESULT_EXPIRES,
+    GEMINI_MAX_RETRIES,
+    GEMINI_BACKOFF_BASE,
+    BULK_DELETE_CHUNK_SIZE
+)
+from generation import load_model, generate_cached
+from rate_limit import QuotaExceededError
+from database import session_local
+from models import User, Content, Template
+from stats import publish_stats_change
+
+# Worker starten: celery -A tasks worker --loglevel=info
+celery_app = Celery(
+    "easy_content_generator",
+    broker=CELERY_BROKER_URL,
+    backend=CELERY_RESULT_BACKEND
+)
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    task_track_started=True,
+    result_extended=True,
+    result_expires=CELERY_RESULT_EXPIRES,
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+    task_always_eager=CELERY_TASK_ALWAYS_EAGER,
+    task_store_eager_result=True
+)
+
+_model = None
+_loops = threading.local()
+
+
+def get_model():
+    """Lade das Gemini-Modell einmal pro Worker-Prozess"""
+    global _model
+    if _model is None:
+        _model = load_model()
+    return _model
+
+
+def run_async(coro):
+    """Führe eine Coroutine im Event Loop dieses Worker-Threads aus
+
+    Ein langlebiger Loop statt asyncio.run pro Task: die Redis-Clients von Cache,
+    Single-Flight und Limiter binden ihre Verbindungen an den Loop, in dem sie
+    aufgebaut wurden.
+    """
+    loop = getattr(_loops, "loop", None)
+    if loop is None:
+        loop = _loops.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(coro)
+
+
+@celery_app.task(name="generate_content", bind=True, max_retries=GEMINI_MAX_RETRIES)
+def generate_content_task(self, owner_id: int, prompt: str, enhanced_prompt: str, language: str, tone: str) -> dict:
+    """Generiere Content im Worker und speichere ihn"""
+    model = get_model()
+    if not model:
+        raise RuntimeError("Gemini API not configured")
+    
+    try:
+        # Gleicher Weg wie /generate: Cache, Single-Flight und Rate-Limiter gelten auch für Jobs
+        generated_text, _ = run_async(generate_cached(model, enhanced_prompt))
+    except QuotaExceededError as e:
+        # Quota erschöpft: Job später erneut einplanen statt ihn fehlschlagen zu lassen
+        countdown = max(e.retry_after, GEMINI_BACKOFF_BASE * 2 ** self.request.retries)
+        raise self.retry(exc=e, countdown=countdown)
+    
+    db = session_local()
+    try:
+        content = Content(
+            title=prompt[:100],
+            body=generated_text,
+            language=language,
+            tone=tone,
+            status="published",
+            owner_id=owner_id
+        )
+        db.add(content)
+        db.commit()
+        db.refresh(content)
+        # Die API-Prozesse sehen diesen Insert nicht über ihren Session-Listener
+        publish_stats_change()
+        
+        return {
+            "id": content.id,
+            "prompt": prompt,
+            "content": generated_text,
+            "language": language,
+            "tone": tone,
+            "status": content.status,
+            "created_at": content.created_at.isoformat()
+        }
+    finally:
+        db.close()
+
+
+@celery_app.task(name="purge_users", bind=True)
+def purge_users_task(self, user_ids: list) -> dict:
+    """Lösche deaktivierte User samt Contents in Chunks (eine Transaktion pro Chunk)"""
+    progress = {
+        "users_total": len(user_ids),
+        "users_deleted": 0,
+        "contents_deleted": 0,
+        "templates_deleted": 0
+    }
+    
+    db = session_local()
+    try:
+        # Zwischenzeitlich wieder aktivierte User bleiben erhalten
+        inactive_ids = db.scalars(
+            select(User.id).where(User.id.in_(user_ids), User.is_active == False)
+        ).all()
+        
+        for user_id in inactive_ids:
+            while True:
+                chunk = db.scalars(
+                    select(Content.id).where(Content.owner_id == user_id).limit(BULK_DELETE_CHUNK_SIZE)
+                ).all()
+                if not chunk:
+                    break
+                db.execute(
+                    delete(Content).where(Content.id.in_(chunk))
+                    .execution_options(synchronize_session=False)
+                )
+                db.commit()
+                progress["contents_deleted"] += len(chunk)
+                self.update_state(state="PROGRESS", meta=progress)
+            
+            result = db.execute(
+                delete(Template).where(Template.owner_id == user_id)
+                .execution_options(synchronize_session=False)
+            )
+            progress["templates_deleted"] += result.rowcount
+            # Was seit dem letzten Chunk noch angelegt wurde, entfernt ON DELETE CASCADE
+            db.execute(
+                delete(User).where(User.id == user_id, User.is_active == False)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            progress["users_deleted"] += 1
+            # Dashboard-Zahlen der API neu berechnen lassen, unabhängig davon, ob jemand den Job abfragt
+            publish_stats_change()
+            self.update_state(state="PROGRESS", meta=progress)
+        
+        return progress
+    finally:
+        db.close()
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import uuid
+
+# Eigene SQLite-Datenbank und Fake-Gemini, bevor config.py importiert wird
+TEST_DIR = tempfile.mkdtemp(prefix="ecg-tests-")
+os.environ.update(
+    DATABASE_URL=f"sqlite:///{TEST_DIR}/test.db",
+    DATABASE_REPLICA_URLS="",
+    EXPORT_CACHE_DIR=os.path.join(TEST_DIR, "exports"),
+    GEMINI_BACKEND="fake",
+    FAKE_GEMINI_LATENCY="fixed:0",
+    FAKE_GEMINI_CHUNK_DELAY="0.02",
+    CELERY_TASK_ALWAYS_EAGER="true",
+    CELERY_BROKER_URL="memory://",
+    CELERY_RESULT_BACKEND="cache+memory://",
+)
+os.environ.pop("REDIS_URL", None)
+
+import pytest
+from fastapi.testclient import TestClient
+
+from init_db import migrate
+
+
+@pytest.fixture(scope="session")
+def client():
+    migrate()
+    from app import app
+    with TestClient(app) as client:
+        yield client
+
+
+def register(client) -> dict:
+    """Frisch registrierter User: {"id", "headers"}"""
+    username = f"user_{uuid.uuid4().hex[:8]}"
+    response = client.post("/auth/register", params={
+        "username": username, "email": f"{username}@example.com", "password": "secret123"
+    })
+    assert response.status_code == 200, response.text
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return {"id": client.get("/auth/me", headers=headers).json()["id"], "headers": headers}
+
+
+@pytest.fixture
+def user(client):
+    return register(client)
+
+
+@pytest.fixture
+def admin(client):
+    """Eigener User mit Admin-Rechten"""
+    from auth import invalidate_principal
+    from database import session_local
+    from models import User
+
+    admin = register(client)
+    with session_local() as db:
+        db.get(User, admin["id"]).is_admin = True
+        db.commit()
+    client.portal.call(invalidate_principal, admin["id"])
+    return admin
@@ -0,0 +1,39 @@
+import pytest
+
+
+def fetch_all_pages(client, headers: dict, params: dict) -> list:
+    rows, cursor = [], None
+    while True:
+        response = client.get("/admin/templates", params={**params, **({"cursor": cursor} if cursor else {})}, headers=headers)
+        assert response.status_code == 200, response.text
+        rows.extend(response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            return rows
+
+
+@pytest.mark.parametrize("sort", ["name", "category", "language", "created_at"])
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_admin_templates_sort_pages_through_all_rows(client, admin, user, sort, order):
+    for name, category, language in [
+        ("Beta", "blog", "de"), ("alpha", "email", "en"), ("Gamma", "blog", "fr"),
+        ("Beta", "social", "en"), ("Delta | pipe", "ad", "de")
+    ]:
+        client.post("/templates", params={
+            "name": name, "category": category, "prompt": "p", "language": language
+        }, headers=user["headers"])
+
+    rows = fetch_all_pages(client, admin["headers"], {
+        "owner_id": user["id"], "sort": sort, "order": order, "limit": 2
+    })
+
+    assert len(rows) == 5
+    keys = [(row[sort], row["id"]) for row in rows]
+    assert keys == sorted(keys, reverse=order == "desc")
+
+
+def test_admin_templates_rejects_unknown_sort_and_bad_cursor(client, admin):
+    assert client.get("/admin/templates", params={"sort": "prompt"}, headers=admin["headers"]).status_code == 400
+    assert client.get(
+        "/admin/templates", params={"sort": "name", "cursor": "X19pbXBvcnRfXyh8MQ=="}, headers=admin["headers"]
+    ).status_code == 400
@@ -0,0 +1,52 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+import zstandard
+
+from compression import BodyCodec, UnknownDictionaryError, body_codec
+from database import session_local
+from models import CompressionDictionary, Content
+
+
+def train_foreign_dictionary() -> zstandard.ZstdCompressionDict:
+    """Dictionary, das ein anderer Prozess (train_dictionary.py) nach dem Start der API angelegt hat"""
+    samples = [
+        f"Sample {i}: a body about topic {i % 17} with some shared wording and numbers {i * 31}.".encode() * 4
+        for i in range(400)
+    ]
+    dictionary = zstandard.train_dictionary(4096, samples)
+    with session_local() as db:
+        db.add(CompressionDictionary(id=dictionary.dict_id(), data=dictionary.as_bytes(), created_at=datetime(2000, 1, 1)))
+        db.commit()
+    return dictionary
+
+
+def test_content_with_dictionary_trained_elsewhere_is_readable(client, user):
+    dictionary = train_foreign_dictionary()
+    assert dictionary.dict_id() not in body_codec.stats()["dictionaries"]
+
+    body = "A body compressed by a worker that already knows the new dictionary."
+    with session_local() as db:
+        content = Content(title="foreign", language="en", tone="casual", status="published", owner_id=user["id"])
+        content.body_compressed = zstandard.ZstdCompressor(dict_data=dictionary).compress(body.encode())
+        content.excerpt = body
+        db.add(content)
+        db.commit()
+        content_id = content.id
+
+    response = client.get(f"/content/{content_id}", headers=user["headers"])
+
+    assert response.status_code == 200
+    assert response.json()["body"] == body
+    assert dictionary.dict_id() in body_codec.stats()["dictionaries"]
+
+
+def test_sync_dictionary_load_is_refused_on_the_event_loop():
+    codec = BodyCodec(level=3)
+
+    async def compress_on_loop():
+        codec.compress("text")
+
+    with pytest.raises(UnknownDictionaryError):
+        asyncio.run(compress_on_loop())
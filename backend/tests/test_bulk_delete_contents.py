@@ -0,0 +1,43 @@
+import pytest
+
+import app as app_module
+from stats import stats_cache
+
+
+def create_drafts(client, user, count: int) -> list:
+    return [
+        client.post("/drafts", params={"title": f"bulk {i}", "body": "body"}, headers=user["headers"]).json()["id"]
+        for i in range(count)
+    ]
+
+
+def test_bulk_delete_in_chunks_updates_dashboard_in_place(client, admin, user, monkeypatch):
+    monkeypatch.setattr(app_module, "BULK_DELETE_CHUNK_SIZE", 2)
+    ids = create_drafts(client, user, 5)
+    before = client.get("/admin/dashboard", headers=admin["headers"]).json()
+    computed_at = stats_cache._computed_at
+
+    response = client.post("/admin/contents/bulk-delete", json={"content_ids": ids + [ids[-1] + 10**6]},
+                           headers=admin["headers"])
+
+    assert response.status_code == 200
+    assert response.json()["deleted_count"] == 5
+    after = client.get("/admin/dashboard", headers=admin["headers"]).json()
+    assert after["content"]["drafts"] == before["content"]["drafts"] - 5
+    # Delta aus dem DELETE ... RETURNING, keine Neuberechnung des Snapshots
+    assert stats_cache._computed_at == computed_at
+
+
+@pytest.mark.parametrize("body", [{"content_ids": "abc"}, {"content_ids": ["x"]}, {}])
+def test_bulk_delete_rejects_malformed_ids(client, admin, body):
+    response = client.post("/admin/contents/bulk-delete", json=body, headers=admin["headers"])
+
+    assert response.status_code == 422
+
+
+def test_bulk_delete_rejects_too_many_ids(client, admin):
+    response = client.post("/admin/contents/bulk-delete",
+                           json={"content_ids": list(range(app_module.BULK_DELETE_MAX_IDS + 1))},
+                           headers=admin["headers"])
+
+    assert response.status_code == 422
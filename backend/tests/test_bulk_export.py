@@ -0,0 +1,45 @@
+import io
+import zipfile
+
+import pytest
+
+
+def create_draft(client, user, title: str) -> int:
+    response = client.post("/drafts", params={"title": title, "body": f"{title} body"}, headers=user["headers"])
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+
+def test_admin_bulk_export_filters_by_owner(client, admin, user):
+    create_draft(client, user, "owner filter")
+    create_draft(client, admin, "other owner")
+
+    response = client.post(
+        "/admin/export/bulk", json={"format": "markdown", "owner_id": str(user["id"])}, headers=admin["headers"]
+    )
+
+    assert response.status_code == 200
+    names = zipfile.ZipFile(io.BytesIO(response.content)).namelist()
+    assert names and all(name.startswith(f"user_{user['id']}/") for name in names)
+
+
+@pytest.mark.parametrize("owner_id", ["x", [1], {"id": 1}])
+def test_admin_bulk_export_rejects_invalid_owner_id(client, admin, owner_id):
+    response = client.post(
+        "/admin/export/bulk", json={"format": "markdown", "owner_id": owner_id}, headers=admin["headers"]
+    )
+
+    assert response.status_code == 400
+
+
+def test_user_bulk_export_ignores_owner_id(client, user, admin):
+    create_draft(client, admin, "not yours")
+    own_id = create_draft(client, user, "yours")
+
+    response = client.post(
+        "/export/bulk", json={"format": "markdown", "owner_id": admin["id"]}, headers=user["headers"]
+    )
+
+    assert response.status_code == 200
+    names = zipfile.ZipFile(io.BytesIO(response.content)).namelist()
+    assert [name.split("_")[0] for name in names] == [str(own_id)]
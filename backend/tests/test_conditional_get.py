@@ -0,0 +1,27 @@
+import pytest
+
+
+@pytest.mark.parametrize("path", ["/history", "/drafts", "/templates", "/languages", "/tones"])
+def test_matching_etag_returns_304(client, user, path):
+    response = client.get(path, headers=user["headers"])
+    etag = response.headers["etag"]
+
+    cached = client.get(path, headers={**user["headers"], "If-None-Match": etag})
+
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+
+def test_drafts_etag_changes_on_write(client, user):
+    draft = client.post("/drafts", params={"title": "etag draft", "body": "body"}, headers=user["headers"]).json()
+    etag = client.get("/drafts", headers=user["headers"]).headers["etag"]
+
+    client.put(f"/drafts/{draft['id']}", params={"title": "edited"}, headers=user["headers"])
+    edited = client.get("/drafts", headers={**user["headers"], "If-None-Match": etag})
+    assert edited.status_code == 200
+    assert edited.headers["etag"] != etag
+
+    client.delete(f"/drafts/{draft['id']}", headers=user["headers"])
+    deleted = client.get("/drafts", headers={**user["headers"], "If-None-Match": edited.headers["etag"]})
+    assert deleted.status_code == 200
+    assert deleted.json() == []
@@ -0,0 +1,37 @@
+import asyncio
+import time
+
+import pytest
+
+import exports
+from exports import ExportRenderer, RenderTimeout, render_export_limited
+
+
+def test_render_limit_aborts_a_slow_render(monkeypatch):
+    monkeypatch.setattr(exports, "render_export", lambda *args: time.sleep(5))
+
+    started = time.monotonic()
+    with pytest.raises(RenderTimeout):
+        render_export_limited(0.1, "pdf", "title", "body")
+    assert time.monotonic() - started < 1
+
+
+def test_timed_out_render_frees_its_worker():
+    renderer = ExportRenderer(workers=1, timeout=30)
+    slow_body = "\n".join(f"Paragraph {i} " * 40 for i in range(2000))
+
+    async def renders():
+        await renderer.render("pdf", "warm", "up")
+        renderer.timeout = 0.05
+        with pytest.raises(asyncio.TimeoutError):
+            await renderer.render("pdf", "slow", slow_body)
+        renderer.timeout = 30
+        return await renderer.render("pdf", "after", "timeout")
+
+    try:
+        assert asyncio.run(renders()).startswith(b"%PDF")
+    finally:
+        renderer.shutdown()
+    assert renderer.timeouts == 1
+    # Das harte Limit im Worker hat gegriffen, der Pool musste nicht neu starten
+    assert renderer.restarts == 0
@@ -0,0 +1,37 @@
+import pytest
+
+
+def test_batch_generates_items(client, user):
+    response = client.post("/generate/batch", json={
+        "items": [{"prompt": "batch topic one"}, {"prompt": "batch topic two", "language": "de"}]
+    }, headers=user["headers"])
+
+    assert response.status_code == 200
+    assert response.json()["succeeded"] == 2
+
+
+@pytest.mark.parametrize("concurrency", ["abc", None, [2]])
+def test_batch_rejects_invalid_concurrency(client, user, concurrency):
+    response = client.post("/generate/batch", json={
+        "items": [{"prompt": "batch topic"}], "concurrency": concurrency
+    }, headers=user["headers"])
+
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("items", [["just a prompt"], [{"prompt": "ok"}, 42], "not a list"])
+def test_batch_rejects_non_object_items(client, user, items):
+    response = client.post("/generate/batch", json={"items": items}, headers=user["headers"])
+
+    assert response.status_code == 400
+
+
+def test_batch_reports_invalid_item_fields_per_item(client, user):
+    response = client.post("/generate/batch", json={
+        "items": [{"prompt": "valid topic"}, {"prompt": 123}, {"prompt": "x", "language": ["en"]}]
+    }, headers=user["headers"])
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["succeeded"] == 1
+    assert [("error" in result) for result in body["results"]] == [False, True, True]
@@ -0,0 +1,128 @@
+import asyncio
+import time
+from urllib.parse import urlencode
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import undefer
+
+import generation
+from database import session_local
+from fake_gemini import FakeGenerativeModel
+from models import Content
+
+
+async def disconnect_after_first_chunk(app, headers: dict, params: dict) -> list:
+    """POST /generate/stream direkt über ASGI; nach dem ersten Chunk trennt der Client"""
+    first_chunk = asyncio.Event()
+    request_sent = False
+    bodies = []
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await first_chunk.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            bodies.append(message.get("body", b""))
+            if b"event: chunk" in message.get("body", b""):
+                first_chunk.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/generate/stream",
+        "raw_path": b"/generate/stream",
+        "root_path": "",
+        "query_string": urlencode(params).encode(),
+        "headers": [(b"host", b"testserver")] + [
+            (name.lower().encode(), value.encode()) for name, value in headers.items()
+        ],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    await app(scope, receive, send)
+    return bodies
+
+
+def test_stream_saves_draft_when_client_disconnects(client, user):
+    params = {"prompt": "disconnect test topic", "fresh": "true"}
+    bodies = client.portal.call(disconnect_after_first_chunk, client.app, user["headers"], params)
+
+    assert not any(b"event: done" in body for body in bodies)
+    with session_local() as db:
+        contents = db.scalars(
+            select(Content).options(undefer(Content.body_compressed)).where(Content.owner_id == user["id"])
+        ).all()
+    assert len(contents) == 1
+    assert contents[0].status == "draft"
+    assert contents[0].title == params["prompt"]
+    assert contents[0].body
+
+
+def test_stream_completes_and_publishes(client, user):
+    response = client.post(
+        "/generate/stream", params={"prompt": "complete test topic", "fresh": "true"}, headers=user["headers"]
+    )
+
+    assert response.status_code == 200
+    assert "event: done" in response.text
+    with session_local() as db:
+        content = db.scalars(select(Content).where(Content.owner_id == user["id"])).one()
+    assert content.status == "published"
+
+
+
+class SyncOnlyModel:
+    """Modell ohne async API: stream_text nutzt den Executor-Pfad"""
+
+    def __init__(self, model):
+        self.generate_content = model.generate_content
+
+
+def collect_until_timeout(model) -> list:
+    chunks = []
+
+    async def run():
+        async for text in generation.stream_text(model, "stalled topic"):
+            chunks.append(text)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(run())
+    return chunks
+
+
+@pytest.mark.parametrize("wrap", [lambda model: model, SyncOnlyModel])
+def test_stalled_upstream_hits_the_chunk_timeout(monkeypatch, wrap):
+    monkeypatch.setattr(generation, "GENERATION_CHUNK_TIMEOUT", 0.1)
+    model = FakeGenerativeModel(chunk_delay=2)
+
+    started = time.monotonic()
+    assert collect_until_timeout(wrap(model)) == []
+    assert time.monotonic() - started < 1
+
+
+def test_slow_stream_hits_the_overall_deadline(monkeypatch):
+    monkeypatch.setattr(generation, "GENERATION_TIMEOUT", 0.3)
+    model = FakeGenerativeModel(chunk_size=5, chunk_delay=0.05)
+
+    chunks = collect_until_timeout(model)
+
+    assert 0 < len(chunks) < len(model._chunks(model._text_for("stalled topic")))
+
+
+def test_stream_reports_timeout_as_error_event(client, user, monkeypatch):
+    monkeypatch.setattr(generation, "GENERATION_CHUNK_TIMEOUT", 0.001)
+
+    response = client.post("/generate/stream", params={"prompt": "timeout topic", "fresh": "true"},
+                           headers=user["headers"])
+
+    assert "event: error" in response.text
+    assert "Generation timed out" in response.text
@@ -0,0 +1,26 @@
+import uuid
+
+from conftest import register
+
+
+def test_job_completes_in_eager_mode(client, user):
+    response = client.post("/generate/jobs", params={"prompt": "queued topic"}, headers=user["headers"])
+    assert response.status_code == 202
+
+    job = client.get(f"/generate/jobs/{response.json()['job_id']}", headers=user["headers"])
+    assert job.status_code == 200
+    assert job.json()["status"] == "completed"
+    assert "queued topic" in job.json()["result"]["content"]
+
+
+def test_job_of_another_user_is_not_found(client, user):
+    job_id = client.post("/generate/jobs", params={"prompt": "private topic"}, headers=user["headers"]).json()["job_id"]
+
+    other = register(client)
+    assert client.get(f"/generate/jobs/{job_id}", headers=other["headers"]).status_code == 404
+
+
+def test_unknown_job_is_not_found(client, user):
+    response = client.get(f"/generate/jobs/{uuid.uuid4()}", headers=user["headers"])
+
+    assert response.status_code == 404
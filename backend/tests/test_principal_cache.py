@@ -0,0 +1,12 @@
+from conftest import register
+
+
+def test_revoked_admin_loses_access_immediately(client, admin):
+    promoted = register(client)
+    assert client.put(f"/admin/users/{promoted['id']}/toggle-admin", headers=admin["headers"]).status_code == 200
+    # Principal mit Admin-Rechten landet im Cache
+    assert client.get("/admin/users", headers=promoted["headers"]).status_code == 200
+
+    assert client.put(f"/admin/users/{promoted['id']}/toggle-admin", headers=admin["headers"]).status_code == 200
+
+    assert client.get("/admin/users", headers=promoted["headers"]).status_code == 403
@@ -0,0 +1,66 @@
+import asyncio
+import time
+
+import pytest
+
+from fake_gemini import FakeQuotaError
+from rate_limit import GeminiRateLimiter, QuotaExceededError
+
+
+def make_limiter(**options) -> GeminiRateLimiter:
+    settings = dict(rpm=0, tpm=0, min_concurrency=1, max_concurrency=8,
+                    queue_timeout=5, max_retries=3, backoff_base=0.05)
+    settings.update(options)
+    return GeminiRateLimiter(**settings)
+
+
+def test_quota_error_backs_off_and_halves_concurrency():
+    limiter = make_limiter()
+    calls = []
+
+    async def call():
+        calls.append(time.monotonic())
+        if len(calls) < 3:
+            raise FakeQuotaError()
+        return "ok"
+
+    assert asyncio.run(limiter.run("prompt", call)) == "ok"
+
+    assert len(calls) == 3
+    # Jitter: mindestens die Hälfte von 0.05s bzw. 0.1s Backoff
+    assert calls[1] - calls[0] >= 0.025
+    assert calls[2] - calls[1] >= 0.05
+    assert limiter.throttled == 2
+    # Beide 429 fallen in ein Cooldown-Fenster: nur einmal halbiert, dann +1/limit für den Erfolg
+    assert int(limiter.concurrency.limit) == 4
+
+
+def test_persistent_quota_errors_are_rejected_after_max_retries():
+    limiter = make_limiter(max_retries=2, backoff_base=0.01)
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        raise FakeQuotaError()
+
+    with pytest.raises(QuotaExceededError):
+        asyncio.run(limiter.run("prompt", call))
+    assert calls == 3
+    assert limiter.rejected == 1
+
+
+def test_request_bucket_queues_calls_beyond_the_rate():
+    # 60 RPM = 1 Request pro Sekunde, der Bucket startet voll
+    limiter = make_limiter(rpm=60, queue_timeout=0.5)
+
+    async def call():
+        return "ok"
+
+    async def burst():
+        for _ in range(60):
+            await limiter.run("prompt", call)
+        await limiter.run("prompt", call)
+
+    with pytest.raises(QuotaExceededError):
+        asyncio.run(burst())
@@ -0,0 +1,68 @@
+import asyncio
+import sqlite3
+
+import pytest
+from sqlalchemy import text
+
+from database import async_engine
+from replicas import ReplicaRouter
+
+
+@pytest.fixture
+def replica_urls(tmp_path) -> list:
+    """Zwei SQLite-Dateien als Replicas, jede kennt ihren eigenen Namen"""
+    urls = []
+    for name in ("replica_a", "replica_b"):
+        path = tmp_path / f"{name}.db"
+        with sqlite3.connect(path) as connection:
+            connection.execute("CREATE TABLE marker (name TEXT)")
+            connection.execute("INSERT INTO marker VALUES (?)", (name,))
+        urls.append(f"sqlite:///{path}")
+    return urls
+
+
+async def read_marker(router: ReplicaRouter, user_id: int = None) -> str:
+    async with router.session(user_id) as db:
+        if db.bind is async_engine:
+            return "primary"
+        return await db.scalar(text("SELECT name FROM marker"))
+
+
+def test_reads_rotate_over_replicas(replica_urls):
+    router = ReplicaRouter(replica_urls, sticky_seconds=10, retry_seconds=30)
+
+    async def reads():
+        return [await read_marker(router) for _ in range(4)]
+
+    assert asyncio.run(reads()) == ["replica_a", "replica_b", "replica_a", "replica_b"]
+
+
+def test_replica_marked_down_is_skipped_until_retry(replica_urls):
+    router = ReplicaRouter(replica_urls, sticky_seconds=10, retry_seconds=30)
+    router.mark_down(router.replicas[0])
+
+    async def reads():
+        return [await read_marker(router) for _ in range(3)]
+
+    assert asyncio.run(reads()) == ["replica_b"] * 3
+
+    router.mark_down(router.replicas[1])
+    assert asyncio.run(read_marker(router)) == "primary"
+
+
+def test_unreachable_replica_fails_over_to_primary(replica_urls, tmp_path):
+    router = ReplicaRouter([f"sqlite:///{tmp_path}/missing/replica.db"], sticky_seconds=10, retry_seconds=30)
+
+    assert asyncio.run(read_marker(router)) == "primary"
+    assert not router.replicas[0].healthy()
+
+
+def test_writer_reads_from_primary_after_a_write(replica_urls):
+    router = ReplicaRouter(replica_urls, sticky_seconds=10, retry_seconds=30)
+    router.record_write(1)
+
+    async def reads():
+        return await read_marker(router, user_id=1), await read_marker(router, user_id=2)
+
+    assert asyncio.run(reads()) == ("primary", "replica_a")
+    assert router.sticky_reads == 1
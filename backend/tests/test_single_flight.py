@@ -0,0 +1,49 @@
+import asyncio
+
+from fake_gemini import FakeGenerativeModel
+from generation import generate_cached
+from singleflight import SingleFlight
+
+
+def generate_concurrently(model, count: int, fresh: bool = False) -> list:
+    async def run():
+        return await asyncio.gather(*[generate_cached(model, "same prompt", fresh=fresh) for _ in range(count)])
+
+    return asyncio.run(run())
+
+
+def test_identical_requests_share_one_upstream_call():
+    model = FakeGenerativeModel(latency="fixed:0.1")
+
+    results = generate_concurrently(model, 10)
+
+    assert model.calls == 1
+    assert len({text for text, _ in results}) == 1
+
+
+def test_fresh_requests_bypass_single_flight():
+    model = FakeGenerativeModel(latency="fixed:0.1")
+
+    generate_concurrently(model, 5, fresh=True)
+
+    assert model.calls == 5
+
+
+def test_failed_leader_fails_all_waiting_callers():
+    single_flight = SingleFlight(enabled=True, redis_url=None, lock_ttl=1, poll_interval=0.01, result_ttl=60)
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        raise RuntimeError("upstream down")
+
+    async def run():
+        return await asyncio.gather(*[single_flight.do("key", failing) for _ in range(3)], return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert single_flight.local_followers == 2
@@ -0,0 +1,41 @@
+import asyncio
+import logging
+import time
+
+import stats
+from stats import StatsCache
+
+
+def test_failed_background_refresh_is_logged_and_resets_the_cache(caplog, monkeypatch):
+    # alembic.ini (fileConfig in migrate()) deaktiviert bereits angelegte Logger
+    monkeypatch.setattr(stats.logger, "disabled", False)
+    cache = StatsCache(ttl=1, stale_ttl=60, fast_counts=False, redis_url=None)
+
+    async def failing_refresh():
+        raise RuntimeError("database unavailable")
+
+    async def scenario():
+        cache._snapshot = {"stale": True}
+        cache._computed_at = time.monotonic() - 10
+        cache._refresh = failing_refresh
+
+        assert await cache.get(None) == {"stale": True}
+        await asyncio.wait([cache._refresh_task])
+
+    with caplog.at_level(logging.ERROR, logger="stats"):
+        asyncio.run(scenario())
+
+    assert cache._snapshot is None
+    assert cache._computed_at == 0.0
+    assert "database unavailable" in caplog.text
+
+
+def test_worker_generation_invalidates_the_snapshot(client, admin, user):
+    client.get("/admin/dashboard", headers=admin["headers"])
+    computed_at = stats.stats_cache._computed_at
+
+    response = client.post("/generate/jobs", params={"prompt": "stats topic"}, headers=user["headers"])
+    assert response.status_code == 202
+
+    # Ohne Redis erreicht die Meldung des Workers nur den eigenen Prozess (hier: eager)
+    assert stats.stats_cache._computed_at != computed_at
@@ -0,0 +1,15 @@
+from conftest import register
+
+
+def test_dashboard_reflects_purge_without_polling_the_job(client, admin):
+    victim = register(client)
+    for i in range(3):
+        client.post("/drafts", params={"title": f"purge {i}", "body": "body"}, headers=victim["headers"])
+    before = client.get("/admin/dashboard", headers=admin["headers"]).json()
+
+    response = client.post("/admin/users/bulk-delete", json=[victim["id"]], headers=admin["headers"])
+    assert response.status_code == 200
+
+    after = client.get("/admin/dashboard", headers=admin["headers"]).json()
+    assert after["users"]["total"] == before["users"]["total"] - 1
+    assert after["content"]["drafts"] == before["content"]["drafts"] - 3
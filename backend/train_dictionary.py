@@ -0,0 +1,53 @@
+"""Trainiert ein neues zstd-Dictionary aus einer Stichprobe der gespeicherten Bodies
+
+    DATABASE_URL=postgresql://... python train_dictionary.py
+
+Nach einem Neustart von API und Worker komprimieren sie neue Bodies mit dem
+neuen Dictionary; bestehende Bodies bleiben mit ihrem alten lesbar.
+"""
+import sys
+
+import zstandard
+from sqlalchemy import func, select
+
+from compression import body_codec
+from config import BODY_COMPRESSION_LEVEL, BODY_DICTIONARY_SIZE, BODY_DICTIONARY_SAMPLES
+from database import session_local
+from models import Content, CompressionDictionary
+
+
+def compressed_size(samples: list, dictionary=None) -> int:
+    compressor = zstandard.ZstdCompressor(level=BODY_COMPRESSION_LEVEL, dict_data=dictionary)
+    return sum(len(compressor.compress(sample)) for sample in samples)
+
+
+def main() -> int:
+    with session_local() as db:
+        samples = [
+            body_codec.decompress(data).encode()
+            for data in db.scalars(
+                select(Content.body_compressed)
+                .where(Content.body_compressed.isnot(None))
+                .order_by(func.random())
+                .limit(BODY_DICTIONARY_SAMPLES)
+            )
+        ]
+
+        try:
+            dictionary = zstandard.train_dictionary(BODY_DICTIONARY_SIZE, samples, level=BODY_COMPRESSION_LEVEL)
+        except zstandard.ZstdError as e:
+            print(f"❌ Training failed with {len(samples)} samples: {e}")
+            return 1
+
+        db.add(CompressionDictionary(id=dictionary.dict_id(), data=dictionary.as_bytes()))
+        db.commit()
+
+    raw = sum(len(sample) for sample in samples)
+    print(f"✅ Dictionary {dictionary.dict_id()} trained on {len(samples)} bodies ({raw} bytes)")
+    print(f"   without dictionary: {compressed_size(samples)} bytes")
+    print(f"   with dictionary:    {compressed_size(samples, dictionary)} bytes (training samples)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
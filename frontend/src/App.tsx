@@ -61,6 +61,7 @@ function App() {
   const [prompt, setPrompt] = useState('');
   const [generatedContent, setGeneratedContent] = useState('');
   const [history, setHistory] = useState<Content[]>([]);
+  const [historyCursor, setHistoryCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState('');
   const [selectedContent, setSelectedContent] = useState<Content | null>(null);
@@ -246,6 +247,7 @@ const handleRegister = async (e: React.FormEvent) => {
     setIsAdmin(false);
     setCurrentPage('main');
     setHistory([]);
+    setHistoryCursor(null);
     setSelectedContent(null);
     setGeneratedContent('');
     setPrompt('');
@@ -292,13 +294,16 @@ const handleRegister = async (e: React.FormEvent) => {
     }
   };
 
-  const fetchHistory = async () => {
+  const fetchHistory = async (cursor?: string) => {
     try {
       const response = await axios.get(`${API_BASE_URL}/history`, {
+        params: cursor ? { cursor } : {},
         headers: getAuthHeader(),
         timeout: 30000
       });
-      setHistory(response.data);
+      // Seitenweise: ohne Cursor erste Seite laden, mit Cursor anhängen
+      setHistory(cursor ? [...history, ...response.data] : response.data);
+      setHistoryCursor(response.headers['x-next-cursor'] || null);
     } catch (err) {
       console.error('Error fetching history:', err);
       setError(t('error.fetchHistory') || 'Failed to fetch history');
@@ -1271,6 +1276,14 @@ const PreviewComponent = ({ content, title }: { content: string; title: string }
                     </div>
                   ))
                 )}
+                {historyCursor && (
+                  <button
+                    onClick={() => fetchHistory(historyCursor)}
+                    className={`w-full text-sm font-bold py-2 px-4 rounded transition ${isDarkMode ? 'bg-slate-700 hover:bg-slate-600 text-gray-300' : 'bg-gray-200 hover:bg-gray-300 text-gray-800'}`}
+                  >
+                    {t('history.loadMore')}
+                  </button>
+                )}
               </div>
             </div>
           </div>
@@ -1,51 +1,40 @@
-import React, { useState } from 'react';
-import { useAdmin } from '../../context/AdminContext';
-
-interface FilterState {
-  status: string;
-  language: string;
-  userId: number | '';
-  searchTerm: string;
-}
+import React, { useEffect, useState } from 'react';
+import { useTranslation } from 'react-i18next';
+import { ContentFilters, useAdmin } from '../../context/AdminContext';
 
 export const ContentManagement: React.FC<{ isDarkMode: boolean }> = ({ isDarkMode }) => {
-  const { contents, users, loading, refreshData } = useAdmin();
+  const { t } = useTranslation();
+  const { contents, contentsCursor, contentFilters, users, loading, refreshData, loadMoreContents, filterContents } = useAdmin();
   const token = localStorage.getItem('access_token');
   const [selectedContents, setSelectedContents] = useState<Set<number>>(new Set());
-  
-  const [filters, setFilters] = useState<FilterState>({
-    status: '',
-    language: '',
-    userId: '',
-    searchTerm: ''
-  });
+  const [languages, setLanguages] = useState<Record<string, string>>({});
+  const [searchTerm, setSearchTerm] = useState('');
+
+  // ✅ Alle unterstützten Sprachen, nicht nur die der geladenen Seiten
+  useEffect(() => {
+    fetch('/api/languages')
+      .then(res => res.json())
+      .then(data => setLanguages(data.languages))
+      .catch(err => console.error('Error fetching languages:', err));
+  }, []);
 
-  // ✅ Get unique languages and statuses
-  const languages = [...new Set(contents.map(c => c.language))].filter(Boolean);
   const statuses = ['draft', 'published', 'archived'];
 
-  // ✅ Filter & Search logic
+  // Status, Sprache und User filtert der Server (über alle Seiten)
+  const updateFilters = (changes: Partial<ContentFilters>) => {
+    filterContents({ ...contentFilters, ...changes });
+  };
+
+  // ✅ Suche (Titel + Auszug) nur in den bereits geladenen Seiten
   const filteredContents = contents.filter(content => {
-    // Status filter
-    if (filters.status && content.status !== filters.status) return false;
-    
-    // Language filter
-    if (filters.language && content.language !== filters.language) return false;
-    
-    // User filter
-    if (filters.userId && content.user_id !== filters.userId) return false;
-    
-    // Search filter (Titel + Body)
-    if (filters.searchTerm) {
-      const search = filters.searchTerm.toLowerCase();
-      return (
-        content.title.toLowerCase().includes(search) ||
-        content.body.toLowerCase().includes(search)
-      );
-    }
-    
-    return true;
+    if (!searchTerm) return true;
+    const search = searchTerm.toLowerCase();
+    return (
+      content.title.toLowerCase().includes(search) ||
+      (content.body || '').toLowerCase().includes(search)
+    );
   });
+  const searchIsPartial = Boolean(searchTerm && contentsCursor);
 
   // Checkbox handlers
   const toggleContentSelection = (contentId: number) => {
@@ -131,8 +120,8 @@ export const ContentManagement: React.FC<{ isDarkMode: boolean }> = ({ isDarkMod
           <input
             type="text"
             placeholder="🔍 Search title & body..."
-            value={filters.searchTerm}
-            onChange={(e) => setFilters({ ...filters, searchTerm: e.target.value })}
+            value={searchTerm}
+            onChange={(e) => setSearchTerm(e.target.value)}
             className={`px-4 py-2 rounded-lg border ${
               isDarkMode
                 ? 'bg-slate-800 border-slate-700 text-white placeholder-gray-400'
@@ -142,8 +131,8 @@ export const ContentManagement: React.FC<{ isDarkMode: boolean }> = ({ isDarkMod
 
           {/* Status Filter */}
           <select
-            value={filters.status}
-            onChange={(e) => setFilters({ ...filters, status: e.target.value })}
+            value={contentFilters.status}
+            onChange={(e) => updateFilters({ status: e.target.value })}
             className={`px-4 py-2 rounded-lg border ${
               isDarkMode
                 ? 'bg-slate-800 border-slate-700 text-white'
@@ -160,8 +149,8 @@ export const ContentManagement: React.FC<{ isDarkMode: boolean }> = ({ isDarkMod
 
           {/* Language Filter */}
           <select
-            value={filters.language}
-            onChange={(e) => setFilters({ ...filters, language: e.target.value })}
+            value={contentFilters.language}
+            onChange={(e) => updateFilters({ language: e.target.value })}
             className={`px-4 py-2 rounded-lg border ${
               isDarkMode
                 ? 'bg-slate-800 border-slate-700 text-white'
@@ -169,17 +158,17 @@ export const ContentManagement: React.FC<{ isDarkMode: boolean }> = ({ isDarkMod
             }`}
           >
             <option value="">All Languages</option>
-            {languages.map(lang => (
-              <option key={lang} value={lang}>
-                {lang}
+            {Object.entries(languages).map(([code, name]) => (
+              <option key={code} value={code}>
+                {name}
               </option>
             ))}
           </select>
 
           {/* User Filter */}
           <select
-            value={filters.userId}
-            onChange={(e) => setFilters({ ...filters, userId: e.target.value ? Number(e.target.value) : '' })}
+            value={contentFilters.userId}
+            onChange={(e) => updateFilters({ userId: e.target.value ? Number(e.target.value) : '' })}
             className={`px-4 py-2 rounded-lg border ${
               isDarkMode
                 ? 'bg-slate-800 border-slate-700 text-white'
@@ -204,6 +193,12 @@ export const ContentManagement: React.FC<{ isDarkMode: boolean }> = ({ isDarkMod
             </button>
           )}
         </div>
+
+        {searchIsPartial && (
+          <p className={`text-sm ${isDarkMode ? 'text-yellow-300' : 'text-yellow-700'}`}>
+            {t('admin.partialResults', { count: contents.length })}
+          </p>
+        )}
       </div>
 
       {/* Contents Table */}
@@ -255,7 +250,7 @@ export const ContentManagement: React.FC<{ isDarkMode: boolean }> = ({ isDarkMod
                     {content.title}
                   </td>
                   <td className={`px-6 py-4 ${isDarkMode ? 'text-gray-300' : 'text-gray-600'}`}>
-                    {users.find(u => u.id === content.user_id)?.username || 'Unknown'}
+                    {content.owner_username || 'Unknown'}
                   </td>
                   <td className={`px-6 py-4 ${isDarkMode ? 'text-gray-300' : 'text-gray-600'}`}>
                     {content.language}
@@ -286,6 +281,15 @@ export const ContentManagement: React.FC<{ isDarkMode: boolean }> = ({ isDarkMod
             </tbody>
           </table>
         </div>
+
+        {contentsCursor && (
+          <button
+            onClick={loadMoreContents}
+            className={`mt-4 w-full py-2 rounded-lg font-medium ${isDarkMode ? 'bg-slate-800 hover:bg-slate-700 text-gray-300' : 'bg-white hover:bg-gray-100 text-gray-700 border border-gray-300'}`}
+          >
+            {t('admin.loadMore')}
+          </button>
+        )}
       </div>
 
       {/* No results */}
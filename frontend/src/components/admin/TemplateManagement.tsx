@@ -1,8 +1,10 @@
 import React from 'react';
+import { useTranslation } from 'react-i18next';
 import { useAdmin } from '../../context/AdminContext';
 
 export const TemplateManagement: React.FC<{ isDarkMode: boolean }> = ({ isDarkMode }) => {
-  const { templates, loading, refreshData } = useAdmin();
+  const { t } = useTranslation();
+  const { templates, templatesCursor, loading, refreshData, loadMoreTemplates } = useAdmin();
   const token = localStorage.getItem('access_token');
 
   const handleDeleteTemplate = async (templateId: number) => {
@@ -147,6 +149,15 @@ export const TemplateManagement: React.FC<{ isDarkMode: boolean }> = ({ isDarkMo
             </div>
           </div>
         )}
+
+        {templatesCursor && (
+          <button
+            onClick={loadMoreTemplates}
+            className={`mt-4 w-full py-2 rounded-lg font-medium ${isDarkMode ? 'bg-slate-800 hover:bg-slate-700 text-gray-300' : 'bg-white hover:bg-gray-100 text-gray-700 border border-gray-300'}`}
+          >
+            {t('admin.loadMore')}
+          </button>
+        )}
       </div>
     </div>
   );
@@ -1,4 +1,5 @@
 import React, { useState } from 'react';
+import { useTranslation } from 'react-i18next';
 import { useAdmin } from '../../context/AdminContext';
 
 interface EditModalData {
@@ -16,7 +17,8 @@ interface ResetPasswordModalData {
 const API_BASE = '/api'; // ✅ Nutzt den Vite Proxy!
 
 export const UserManagement: React.FC<{ isDarkMode: boolean }> = ({ isDarkMode }) => {
-  const { users, loading, refreshData } = useAdmin();
+  const { t } = useTranslation();
+  const { users, usersTotal, loading, refreshData, loadMoreUsers } = useAdmin();
   const [selectedUsers, setSelectedUsers] = useState<Set<number>>(new Set());
   const [searchTerm, setSearchTerm] = useState('');
   const [editModal, setEditModal] = useState<EditModalData | null>(null);
@@ -197,7 +199,7 @@ export const UserManagement: React.FC<{ isDarkMode: boolean }> = ({ isDarkMode }
     <div className={`p-8 ${isDarkMode ? 'bg-slate-900' : 'bg-gray-50'}`}>
       <div className="mb-8">
         <h1 className={`text-3xl font-bold mb-4 ${isDarkMode ? 'text-white' : 'text-gray-900'}`}>
-          👥 User Management ({filteredUsers.length})
+          👥 User Management ({filteredUsers.length} of {usersTotal})
         </h1>
 
         {/* Search Bar */}
@@ -321,6 +323,15 @@ export const UserManagement: React.FC<{ isDarkMode: boolean }> = ({ isDarkMode }
             </tbody>
           </table>
         </div>
+
+        {users.length < usersTotal && (
+          <button
+            onClick={loadMoreUsers}
+            className={`mt-4 w-full py-2 rounded-lg font-medium ${isDarkMode ? 'bg-slate-800 hover:bg-slate-700 text-gray-300' : 'bg-white hover:bg-gray-100 text-gray-700 border border-gray-300'}`}
+          >
+            {t('admin.loadMoreCount', { loaded: users.length, total: usersTotal })}
+          </button>
+        )}
       </div>
 
       {/* Edit User Modal */}
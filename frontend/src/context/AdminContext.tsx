@@ -1,13 +1,28 @@
-import React, { createContext, useState, useEffect } from 'react';
+import React, { createContext, useState, useEffect, useRef } from 'react';
+
+// Vom Server ausgewertete Filter für /admin/contents
+export interface ContentFilters {
+  status: string;
+  language: string;
+  userId: number | '';
+}
 
 interface AdminContextType {
   dashboard: any;
   users: any[];
+  usersTotal: number;
   contents: any[];
+  contentsCursor: string | null;
+  contentFilters: ContentFilters;
   templates: any[];
+  templatesCursor: string | null;
   loading: boolean;
   error: string | null;
   refreshData: () => void;
+  loadMoreUsers: () => void;
+  loadMoreContents: () => void;
+  loadMoreTemplates: () => void;
+  filterContents: (filters: ContentFilters) => void;
 }
 
 export const AdminContext = createContext<AdminContextType | undefined>(undefined);
@@ -18,36 +33,84 @@ const getApiBase = () => {
 
 export const AdminProvider: React.FC<{ children: React.ReactNode }> = ({ children }) => {
   const [dashboard, setDashboard] = useState(null);
-  const [users, setUsers] = useState([]);
-  const [contents, setContents] = useState([]);
-  const [templates, setTemplates] = useState([]);
+  const [users, setUsers] = useState<any[]>([]);
+  const [usersTotal, setUsersTotal] = useState(0);
+  const [contents, setContents] = useState<any[]>([]);
+  const [contentsCursor, setContentsCursor] = useState<string | null>(null);
+  const [contentFilters, setContentFilters] = useState<ContentFilters>({ status: '', language: '', userId: '' });
+  const contentsRequest = useRef(0);
+  const [templates, setTemplates] = useState<any[]>([]);
+  const [templatesCursor, setTemplatesCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
   const token = localStorage.getItem('access_token');
+  const headers = { Authorization: `Bearer ${token}` };
+
+  // Listen sind seitenweise (PAGE_SIZE_DEFAULT): Users per offset + X-Total-Count,
+  // Contents und Templates per Keyset-Cursor aus X-Next-Cursor
+  const fetchUsers = async (offset = 0) => {
+    const res = await fetch(`${getApiBase()}/admin/users?offset=${offset}`, { headers });
+    if (!res.ok) throw new Error('Failed to fetch users');
+    const page = await res.json();
+    setUsers(prev => (offset ? [...prev, ...page] : page));
+    setUsersTotal(Number(res.headers.get('X-Total-Count') ?? page.length));
+  };
+
+  const fetchCursorPage = async (path: string, params: Record<string, string>) => {
+    const query = new URLSearchParams(params).toString();
+    const res = await fetch(`${getApiBase()}${path}${query ? `?${query}` : ''}`, { headers });
+    if (!res.ok) throw new Error(`Failed to fetch ${path}`);
+    return { page: await res.json(), next: res.headers.get('X-Next-Cursor') };
+  };
+
+  const fetchContents = async (cursor?: string, filters: ContentFilters = contentFilters) => {
+    const params: Record<string, string> = {};
+    if (filters.status) params.status = filters.status;
+    if (filters.language) params.language = filters.language;
+    if (filters.userId !== '') params.owner_id = String(filters.userId);
+    if (cursor) params.cursor = cursor;
+    // Antworten auf überholte Filter verwerfen
+    const request = ++contentsRequest.current;
+    const { page, next } = await fetchCursorPage('/admin/contents', params);
+    if (request !== contentsRequest.current) return;
+    setContents(prev => (cursor ? [...prev, ...page] : page));
+    setContentsCursor(next);
+  };
+
+  const fetchTemplates = async (cursor?: string) => {
+    const { page, next } = await fetchCursorPage('/admin/templates', cursor ? { cursor } : {});
+    setTemplates(prev => (cursor ? [...prev, ...page] : page));
+    setTemplatesCursor(next);
+  };
+
+  const fetchDashboard = async () => {
+    const res = await fetch(`${getApiBase()}/admin/dashboard`, { headers });
+    if (!res.ok) throw new Error('Failed to fetch dashboard');
+    setDashboard(await res.json());
+  };
+
+  const loadMore = async (fetchPage: () => Promise<void>) => {
+    try {
+      await fetchPage();
+    } catch (err) {
+      setError(err instanceof Error ? err.message : 'Unknown error');
+    }
+  };
+
+  const loadMoreUsers = () => loadMore(() => fetchUsers(users.length));
+  const loadMoreContents = () => loadMore(() => fetchContents(contentsCursor ?? undefined));
+  const loadMoreTemplates = () => loadMore(() => fetchTemplates(templatesCursor ?? undefined));
+  const filterContents = (filters: ContentFilters) => {
+    setContentFilters(filters);
+    loadMore(() => fetchContents(undefined, filters));
+  };
 
   const fetchData = async () => {
     setLoading(true);
     setError(null);
     try {
-      const API_BASE = getApiBase(); // ✅ HIER berechnen!
-      const headers = { Authorization: `Bearer ${token}` };
-
-      const [dashRes, usersRes, contentsRes, templatesRes] = await Promise.all([
-        fetch(`${API_BASE}/admin/dashboard`, { headers }),
-        fetch(`${API_BASE}/admin/users`, { headers }),
-        fetch(`${API_BASE}/admin/contents`, { headers }),
-        fetch(`${API_BASE}/admin/templates`, { headers })
-      ]);
-
-      if (!dashRes.ok || !usersRes.ok || !contentsRes.ok || !templatesRes.ok) {
-        throw new Error('Failed to fetch admin data');
-      }
-
-      setDashboard(await dashRes.json());
-      setUsers(await usersRes.json());
-      setContents(await contentsRes.json());
-      setTemplates(await templatesRes.json());
+      await Promise.all([fetchDashboard(), fetchUsers(), fetchContents(), fetchTemplates()]);
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Unknown error');
       console.error('AdminContext Error:', err);
@@ -58,12 +121,16 @@ export const AdminProvider: React.FC<{ children: React.ReactNode }> = ({ childre
 
   useEffect(() => {
     fetchData();
-    const interval = setInterval(fetchData, 30000);
+    // Nur das Dashboard pollen: ein Reload der Listen würde nachgeladene Seiten verwerfen
+    const interval = setInterval(() => fetchDashboard().catch(err => console.error('AdminContext Error:', err)), 30000);
     return () => clearInterval(interval);
   }, [token]);
 
   return (
-    <AdminContext.Provider value={{ dashboard, users, contents, templates, loading, error, refreshData: fetchData }}>
+    <AdminContext.Provider value={{
+      dashboard, users, usersTotal, contents, contentsCursor, contentFilters, templates, templatesCursor, loading, error,
+      refreshData: fetchData, loadMoreUsers, loadMoreContents, loadMoreTemplates, filterContents
+    }}>
       {children}
     </AdminContext.Provider>
   );